@@ -0,0 +1,544 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This program allow to benchmark the HotClick's
+    start-up phases and memory usage headlessly,
+    using the offscreen Qt platform, and to detect
+    any regression against stored baselines. It also
+    times the pixel conditions' checks against a
+    synthetic frame source, which must remain far
+    below a millisecond per hotkey press, and the
+    hotkeys search queries against tens of thousands
+    of hotkeys, which must remain below a millisecond
+    per keystroke.
+
+    Usage:
+        python benchmark.py                    Compare against the baseline.
+        python benchmark.py --update-baseline  Store the results as the new baseline.
+        python benchmark.py --sizes 0 100 1000 --repeat 5 --threshold 0.2
+        python benchmark.py --pixel-condition  Time the pixel conditions' checks.
+        python benchmark.py --search           Time the hotkeys search queries.
+
+     _____________________________________________________________________
+    | VERSION | DATE YYYY-MM-DD |                 CONTENT                 |
+    |=====================================================================|
+    |  0.1.0  |      2026-10-19 | Initial release.                        |
+    |  0.2.0  |      2026-10-19 | Pixel conditions' checks benchmark.     |
+    |  0.3.0  |      2026-10-19 | Hotkeys search queries benchmark.       |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing  import Any, Callable, Dict, List, Optional, Set
+from pathlib import Path
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+import functools
+import importlib
+import tempfile
+import subprocess
+import tracemalloc
+
+# =-----------------------------------= #
+
+
+# =--------= #
+# Authorship #
+# =--------= #
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__date__         = "2026-10-19"
+__maintainer__   = "Quentin Raimbaud"
+__status__       = "Development"
+__version__      = "0.3.0"
+
+# =-------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Root directory of the HotClick repository.
+ROOT: Path = Path(__file__).parent
+
+# Default baseline file path.
+BASELINE_FILE: Path = ROOT / Path("benchmark_baseline.json")
+
+# Default config sizes (number of hotkeys) to benchmark.
+DEFAULT_SIZES: List[int] = [0, 10, 100, 500]
+
+#   Absolute noise floor below which a regression is ignored,
+# for the timings (in seconds) and the memory (in KiB).
+TIME_NOISE_FLOOR: float = 0.005
+MEMORY_NOISE_FLOOR: int = 2048
+
+# Start-up phases timings of the current child process.
+TIMINGS: Dict[str, float] = {}
+
+#   Maximum time, in seconds, a pixel condition's check may take at the 99th
+# percentile, the check being added to the handling of every guarded hotkey press.
+PIXEL_CONDITION_BUDGET: float = 0.0005
+
+# Maximum time, in seconds, a hotkeys search query may take at the 99th percentile, a query running per keystroke.
+SEARCH_BUDGET: float = 0.001
+
+# Queries timed by the hotkeys search benchmark, as typed one keystroke after another.
+SEARCH_QUERIES: List[str] = [
+    "c", "cl", "cli", "clic", "click", "click 1", "click 12", "k", "k1", "k12", "k123", "k1234",
+    "double", "double click", "double click 3", "160", "230 160", "zzz"
+]
+
+# =---------------------------------------------------------= #
+
+
+# =----------------------= #
+# Child process functions #
+# =----------------------= #
+
+def generate_config(size: int) -> Dict[str, Any]:
+    """
+    Generate a config dictionary containing the given number of hotkeys.
+
+    :param int size: The number of hotkeys to generate.
+    :returns: The generated config dictionary.
+    :rtype: Dict[str, Any]
+    """
+
+    # Import the config module lazily, the parent process doesn't need Qt.
+    import src.config as config
+
+    # Start from the default config and spread
+    # the hotkeys over a grid of 20 x 12 cells.
+    generated: Dict[str, Any] = copy.deepcopy(config.DEFAULT_CONFIG)
+    for i in range(size):
+        generated["hotkeys"][f"k{i}"] = {
+            "type": "Click",
+            'x': 160 + (i % 20) * 70,
+            'y': 160 + (i // 20 % 12) * 70,
+            'w': 60,
+            'h': 60,
+        }
+    return generated
+
+
+def timed(phase: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap the given function to accumulate its execution time in TIMINGS[phase].
+
+    :param str phase: The name of the phase to time.
+    :param function: The function to wrap.
+    :type function: Callable[..., Any]
+    :returns: The wrapped function.
+    :rtype: Callable[..., Any]
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start: float = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            TIMINGS[phase] = TIMINGS.get(phase, 0.0) + time.perf_counter() - start
+
+    return wrapper
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of the current process in KiB,
+    or None if it can't be measured on the current platform.
+
+    :returns: The peak resident set size in KiB.
+    :rtype: int or None
+    """
+
+    # Use the resource module on Unix platforms.
+    try:
+        import resource
+        max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss // 1024 if sys.platform == "darwin" else max_rss
+    except ImportError:
+        pass
+
+    # Otherwise, fallback to psutil if it is available.
+    try:
+        import psutil
+        memory_info: Any = psutil.Process().memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss) // 1024
+    except ImportError:
+        return None
+
+
+def run_child(size: int, top: int) -> None:
+    """
+    Benchmark a single HotClick start-up with a config of the given size
+    and print the JSON-dumped results as the last line of the stdout.
+
+    :param int size: The number of hotkeys of the config to load.
+    :param int top: The number of tracemalloc top allocators to report.
+    """
+
+    # Use the offscreen Qt platform and disable the high DPI scaling as main.py does.
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = '0'
+
+    # Import the HotClick software from the repository root.
+    sys.path.insert(0, str(ROOT))
+    from PySide6.QtWidgets import QApplication
+    from src.MainWindow    import MainWindow
+    import src.config          as config
+    import src.utils           as utils
+
+    # Write the generated config inside a temporary
+    # directory and make the software look into it.
+    temporary_directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+    configs_path: Path = Path(temporary_directory.name) / Path("configs")
+    configs_path.mkdir()
+    utils.json_write(generate_config(size), configs_path / Path("config.json"))
+    for module_name in ("src.MainWindow.IMainWindow", "src.MainWindow.MainWindow"):
+        setattr(importlib.import_module(module_name), "PATH", Path(temporary_directory.name))
+
+    # Wrap every start-up phase to time it.
+    main_window_module: Any = importlib.import_module("src.MainWindow.MainWindow")
+    main_window_module.IMainWindow._init_load_config = timed(
+        "_init_load_config", main_window_module.IMainWindow._init_load_config
+    )
+    main_window_module.MainWindow.set_stylesheets = timed("set_stylesheets", MainWindow.set_stylesheets)
+    config.load_style = timed("load_style", config.load_style)
+
+    # Initialize the QApplication before tracing the memory allocations.
+    app: QApplication = QApplication([])
+    tracemalloc.start(25)
+
+    # Time the MainWindow construction and its first display.
+    main_window: MainWindow = timed("MainWindow()", MainWindow)()
+    timed("show", main_window.show)()
+    timed("show", app.processEvents)()
+
+    # Time the asynchronous config loading until every CircleWindow got created.
+    def wait_config_loaded() -> None:
+        while main_window.is_loading_config:
+            app.processEvents()
+    timed("config loaded", wait_config_loaded)()
+
+    # Retrieve the memory usage.
+    snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Close the MainWindow to unhook its keyboard callback.
+    main_window.close()
+    app.processEvents()
+    temporary_directory.cleanup()
+
+    # Print the results as the last stdout line.
+    print(json.dumps({
+        "size": size,
+        "timings": TIMINGS,
+        "peak_rss_kib": peak_rss(),
+        "traced_peak_kib": traced_peak // 1024,
+        "top_allocators": [
+            {"where": str(statistic.traceback), "size_kib": statistic.size // 1024, "count": statistic.count}
+            for statistic in snapshot.statistics("lineno")[:top]
+        ],
+    }))
+
+# =---------------------------------------------------------------------------------------------= #
+
+
+# =-----------------------= #
+# Parent process functions #
+# =-----------------------= #
+
+def run_size(size: int, repeat: int, top: int) -> Dict[str, Any]:
+    """
+    Benchmark the given config size several times, each time in a fresh
+    child process, and return the best timings along with the memory usage.
+
+    :param int size: The number of hotkeys of the config to benchmark.
+    :param int repeat: The number of child processes to run.
+    :param int top: The number of tracemalloc top allocators to report.
+    :returns: The aggregated results.
+    :rtype: Dict[str, Any]
+    """
+
+    # Run the child processes and parse their results.
+    runs: List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        completed: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, __file__, "--child", str(size), "--top", str(top)],
+            cwd=ROOT,
+            env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode:
+            sys.stderr.write(completed.stderr)
+            raise RuntimeError(f"Benchmark child process failed for size {size}")
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    # Keep the best timing of every phase, the lowest memory
+    # usage and the top allocators of the first run.
+    rss_values: List[int] = [run["peak_rss_kib"] for run in runs if run["peak_rss_kib"] is not None]
+    return {
+        "timings": {phase: min(run["timings"][phase] for run in runs) for phase in runs[0]["timings"]},
+        "peak_rss_kib": min(rss_values) if rss_values else None,
+        "traced_peak_kib": min(run["traced_peak_kib"] for run in runs),
+        "top_allocators": runs[0]["top_allocators"],
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare the given results to the baseline and return the regressions found.
+
+    :param results: The results of the current benchmark, by config size.
+    :type results: Dict[str, Any]
+    :param baseline: The stored baseline results, by config size.
+    :type baseline: Dict[str, Any]
+    :param float threshold: The relative slowdown tolerated before considering a regression.
+    :returns: The description of every regression found.
+    :rtype: List[str]
+    """
+
+    # Compare every phase timing and memory usage
+    # of every config size present in the baseline.
+    regressions: List[str] = []
+    for size, result in results.items():
+        if size not in baseline:
+            continue
+        for phase, elapsed in result["timings"].items():
+            reference: Optional[float] = baseline[size]["timings"].get(phase)
+            if reference is not None and elapsed > reference * (1 + threshold) \
+                    and elapsed - reference > TIME_NOISE_FLOOR:
+                regressions.append(
+                    f"[{size} hotkeys] {phase}: {elapsed*1000:.1f} ms (baseline {reference*1000:.1f} ms)"
+                )
+        for metric in ("peak_rss_kib", "traced_peak_kib"):
+            value: Optional[int] = result[metric]
+            reference: Optional[int] = baseline[size].get(metric)
+            if value is not None and reference is not None and value > reference * (1 + threshold) \
+                    and value - reference > MEMORY_NOISE_FLOOR:
+                regressions.append(f"[{size} hotkeys] {metric}: {value} KiB (baseline {reference} KiB)")
+    return regressions
+
+
+def report(results: Dict[str, Any]) -> None:
+    """
+    Print a human-readable report of the given results.
+
+    :param results: The results of the current benchmark, by config size.
+    :type results: Dict[str, Any]
+    """
+
+    for size, result in results.items():
+        print(f"=== {size} hotkeys ===")
+        for phase, elapsed in result["timings"].items():
+            print(f"    {phase:<20} {elapsed*1000:10.2f} ms")
+        print(f"    {'peak RSS':<20} {result['peak_rss_kib']} KiB")
+        print(f"    {'traced peak':<20} {result['traced_peak_kib']} KiB")
+        print("    Top allocators:")
+        for allocator in result["top_allocators"]:
+            print(f"        {allocator['size_kib']:8} KiB {allocator['count']:8} blocks  {allocator['where']}")
+
+# =--------------------------------------------------------------------------------------------= #
+
+
+# =---------------------------------= #
+# Pixel condition benchmark function #
+# =---------------------------------= #
+
+def run_pixel_condition(checks: int, radius: int) -> bool:
+    """
+    Time the given number of pixel conditions' checks, for both modes, against a synthetic
+    frame source, print their distribution and return whether they all fit the budget.
+
+    :param int checks: The number of checks to time per mode.
+    :param int radius: The radius of the checked region.
+    :returns: True if the 99th percentile of every mode's checks is within the PIXEL_CONDITION_BUDGET.
+    :rtype: bool
+    """
+
+    # Import the pixels module lazily, only this benchmark needing NumPy.
+    sys.path.insert(0, str(ROOT))
+    from src.pixels import PixelCondition, SyntheticFrameSource, parse_color
+
+    # Check a region of a full HD frame filled with the condition's color, so every pixel gets compared.
+    source: SyntheticFrameSource = SyntheticFrameSource(1920, 1080, "#FF8000")
+    within_budget: bool = True
+    for mode in ("all", "any"):
+        condition: PixelCondition = PixelCondition(
+            (960, 540), parse_color("#FF8000"), radius, require_all=mode == "all", source=source
+        )
+
+        # Time every check separately, after a few warm-up ones.
+        for _ in range(100):
+            condition.matches()
+        elapsed: List[float] = []
+        for _ in range(checks):
+            start: float = time.perf_counter()
+            condition.matches()
+            elapsed.append(time.perf_counter() - start)
+
+        # Print the distribution of the checks' times.
+        elapsed.sort()
+        percentile: float = elapsed[min(len(elapsed), int(len(elapsed) * 0.99)) - 1]
+        within_budget &= percentile <= PIXEL_CONDITION_BUDGET
+        print(f"=== Pixel condition, mode \"{mode}\", {2 * radius + 1}x{2 * radius + 1} pixels ===")
+        for name, value in (("median", elapsed[len(elapsed) // 2]), ("99th percentile", percentile),
+                            ("max", elapsed[-1])):
+            print(f"    {name:<20} {value*1000000:10.2f} us")
+    print(f"    {'budget':<20} {PIXEL_CONDITION_BUDGET*1000000:10.2f} us")
+    return within_budget
+
+# =-------------------------------------------------------------------------------------------------= #
+
+
+# =------------------------------= #
+# Search index benchmark function #
+# =------------------------------= #
+
+def run_search(entries: int, checks: int) -> bool:
+    """
+    Time the SEARCH_QUERIES against a search index of the given number of hotkeys, indexed
+    the way the hotkeys registry does, print their distribution and return whether they all
+    fit the budget.
+
+    :param int entries: The number of hotkeys to index.
+    :param int checks: The number of times each query is timed.
+    :returns: True if the 99th percentile of every query is within the SEARCH_BUDGET.
+    :rtype: bool
+    """
+
+    # Import the search module lazily, it needs neither Qt nor the config.
+    sys.path.insert(0, str(ROOT))
+    from src.search import SEARCH_RESULTS_LIMIT, SearchIndex
+
+    # Index the hotkeys by key, action type and coordinates, spread over a grid of 20 x 12 cells.
+    action_types: List[str] = [
+        "Click", "Right Click", "Middle Click", "Double Click", "Hold", "Scroll", "Drag", "Key Tap", "Move", "Macro",
+        "Auto Click"
+    ]
+    index: SearchIndex = SearchIndex()
+    for i in range(entries):
+        index.update(i, f"k{i}", action_types[i % len(action_types)], 160 + (i % 20) * 70, 160 + (i // 20 % 12) * 70)
+
+    # Time every query separately, as the hotkeys search does, after a warm-up one.
+    within_budget: bool = True
+    print(f"=== Hotkeys search, {entries} hotkeys ===")
+    for query in SEARCH_QUERIES:
+        index.search(query, SEARCH_RESULTS_LIMIT)
+        elapsed: List[float] = []
+        for _ in range(checks):
+            start: float = time.perf_counter()
+            matches: Optional[Set[Any]] = index.search(query, SEARCH_RESULTS_LIMIT)
+            elapsed.append(time.perf_counter() - start)
+
+        # Print the distribution of the query's times along with its number of matches.
+        elapsed.sort()
+        percentile: float = elapsed[min(len(elapsed), int(len(elapsed) * 0.99)) - 1]
+        within_budget &= percentile <= SEARCH_BUDGET
+        print(
+            f"    {query!r:<20} median {elapsed[len(elapsed) // 2]*1000000:8.2f} us  99th percentile "
+            f"{percentile*1000000:8.2f} us  {'too many' if matches is None else len(matches)} matches"
+        )
+    print(f"    {'budget':<20} {SEARCH_BUDGET*1000000:10.2f} us")
+    return within_budget
+
+# =-------------------------------------------------------------------------------------------------= #
+
+
+# =-----------= #
+# Main function #
+# =-----------= #
+
+def main() -> None:
+    """Main function."""
+
+    # Parse the command line arguments.
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="HotClick start-up benchmark.")
+    parser.add_argument("--sizes", type=int, nargs='+', default=DEFAULT_SIZES, help="Config sizes to benchmark.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per config size, the best one is kept.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative regression threshold.")
+    parser.add_argument("--top", type=int, default=10, help="Number of tracemalloc top allocators to report.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline file path.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the baseline.")
+    parser.add_argument("--pixel-condition", action="store_true", help="Time the pixel conditions' checks instead.")
+    parser.add_argument("--checks", type=int, default=10000, help="Pixel condition checks per mode.")
+    parser.add_argument("--radius", type=int, default=2, help="Radius of the pixel condition's region.")
+    parser.add_argument("--search", action="store_true", help="Time the hotkeys search queries instead.")
+    parser.add_argument("--entries", type=int, default=30000, help="Hotkeys indexed by the search benchmark.")
+    parser.add_argument("--query-checks", type=int, default=1000, help="Search benchmark checks per query.")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    arguments: argparse.Namespace = parser.parse_args()
+
+    #   If the pixel conditions are benchmarked, time their checks and
+    # exit with a status code 1 if they don't fit within the budget.
+    if arguments.pixel_condition:
+        within_budget: bool = run_pixel_condition(arguments.checks, arguments.radius)
+        print("Within budget" if within_budget else "Budget exceeded")
+        sys.exit(0 if within_budget else 1)
+
+    #   If the hotkeys search is benchmarked, time its queries and
+    # exit with a status code 1 if they don't fit within the budget.
+    if arguments.search:
+        within_budget = run_search(arguments.entries, arguments.query_checks)
+        print("Within budget" if within_budget else "Budget exceeded")
+        sys.exit(0 if within_budget else 1)
+
+    # If this process is a child one, run a single benchmark and exit.
+    if arguments.child is not None:
+        run_child(arguments.child, arguments.top)
+        sys.exit(0)
+
+    # Benchmark every config size.
+    results: Dict[str, Any] = {}
+    for size in arguments.sizes:
+        print(f"Benchmarking {size} hotkeys...")
+        results[str(size)] = run_size(size, arguments.repeat, arguments.top)
+    report(results)
+
+    # Store the results as the baseline if required or if no baseline exists yet.
+    if arguments.update_baseline or not arguments.baseline.exists():
+        with open(arguments.baseline, 'w') as file:
+            file.write(json.dumps(results, indent=4))
+        print(f"Baseline stored in \"{arguments.baseline}\"")
+        sys.exit(0)
+
+    # Otherwise, compare the results to the baseline.
+    with open(arguments.baseline, 'r') as file:
+        baseline: Dict[str, Any] = json.load(file)
+    regressions: List[str] = compare(results, baseline, arguments.threshold)
+
+    # Exit with a status code 1 if any regression has been found.
+    if regressions:
+        print("Regressions found:")
+        for regression in regressions:
+            print(f"    -{regression}")
+        sys.exit(1)
+    print("No regression found")
+    sys.exit(0)
+
+# =------------------------------------------= #
+
+
+#   Run the main function is
+# this script is run directly.
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,9 @@
     |---------|-----------------|-----------------------------------------|
     |  0.5.0  |      2024-03-21 | Remove the color_selection image and    |
     |  0.5.0  |      2024-03-21 | add the theme.json file                 |
+    |---------|-----------------|-----------------------------------------|
+    |  0.6.0  |      2026-10-19 | Add the themes directory to the zip     |
+    |         |                 | file.                                   |
      ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
 """
 
@@ -53,10 +56,10 @@ import PyInstaller.__main__
 
 __author__       = "Quentin Raimbaud"
 __contact__      = "quentin.raimbaud.contact@gmail.com"
-__date__         = "2024-03-21"
+__date__         = "2026-10-19"
 __maintainer__   = "Quentin Raimbaud"
 __status__       = "Development"
-__version__      = "0.5.0"
+__version__      = "0.6.0"
 
 # =-------------------------------------------------= #
 
@@ -141,6 +144,11 @@ def zip_binary() -> None:
         print("    -Zipping theme.json")
         zip_object.write("theme.json", compress_type=zipfile.ZIP_DEFLATED)
 
+        # Add the "themes" directory's files to the zip file.
+        for theme in sorted(os.listdir("themes")):
+            print(f"    -Zipping themes/{theme}")
+            zip_object.write(f"themes/{theme}", compress_type=zipfile.ZIP_DEFLATED)
+
         # Add the "README.md" file to the zip file.
         print("    -Zipping README.md")
         zip_object.write("README.md", compress_type=zipfile.ZIP_DEFLATED)
@@ -17,15 +17,15 @@
 # =--------------= #
 
 from src.config        import CONFIG
-from PySide6.QtCore    import Qt, QPoint, QRect, QSize
-from PySide6.QtGui     import QColor, QFont, QFontMetrics, QPainter, QMouseEvent, QPaintEvent, QResizeEvent
+from PySide6.QtCore    import Qt, QPoint, QRect, QSize, QTimer, Signal
+from PySide6.QtGui     import QColor, QFont, QPainter, QPixmap, QMouseEvent, QMoveEvent, QPaintEvent, QResizeEvent
 from PySide6.QtWidgets import QSizeGrip, QWidget
 from src.config        import STYLE
+from src.sequences     import SEQUENCE_SEPARATOR, SEQUENCE_TIMEOUT
 import typing
 import math
 import src.logger          as logger
 import keyboard
-import string
 import src.utils           as utils
 
 # =-----------------------------------------------------------------------------------------------------= #
@@ -43,9 +43,98 @@ import src.utils           as utils
 # Declare a keyboard hotkey input flag.
 KEYBOARD_HOTKEY_INPUT_FLAG: bool = False
 
+# Declare the hotkey text font family.
+FONT_FAMILY: str = "Arial"
+
 # =----------------------------------= #
 
 
+# =----------------------= #
+# FramePacedSizeGrip class #
+# =----------------------= #
+
+class FramePacedSizeGrip(QSizeGrip):
+    """
+    Frame Paced Size Grip class that resizes its window at most
+    once per screen refresh, whatever the mouse polling rate.
+    Only the latest mouse move event of each frame get handled.
+    """
+
+    # Declare the signal to send once the resizing gesture ends.
+    released = Signal()
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, parent: QWidget) -> None:
+        """
+        Initializer method.
+
+        :param QWidget parent: The parent of the FramePacedSizeGrip to instantiate.
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Initialize the straight-forward attributes.
+        self._pending_event: typing.Optional[QMouseEvent] = None
+        self._frame_timer: QTimer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._frame_timeout)
+
+    # ================== #
+    # Overridden methods #
+    # ================== #
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """
+        Overridden mouseMoveEvent method.
+        This method is called when the mouse move while the FramePacedSizeGrip is pressed.
+
+        :param PySide6.QtGui.QMouseEvent event: The QMouseEvent received.
+        """
+
+        # Within a frame, only keep a copy of the latest event.
+        if self._frame_timer.isActive():
+            self._pending_event = event.clone()
+            return
+
+        # Otherwise, resize right away and start a new frame.
+        super().mouseMoveEvent(event)
+        self._frame_timer.start(utils.frame_interval(self))
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """
+        Overridden mouseReleaseEvent method.
+        This method is called when the mouse button get released from the FramePacedSizeGrip.
+
+        :param PySide6.QtGui.QMouseEvent event: The QMouseEvent received.
+        """
+
+        # Apply the latest pending resizing before ending the gesture.
+        self._frame_timer.stop()
+        self._frame_timeout()
+
+        # Call the super class mouseReleaseEvent method and notify the end of the gesture.
+        super().mouseReleaseEvent(event)
+        self.released.emit()
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _frame_timeout(self) -> None:
+        """Apply the latest mouse move event of the elapsed frame, if any."""
+        if self._pending_event is not None:
+            event: QMouseEvent = self._pending_event
+            self._pending_event = None
+            super().mouseMoveEvent(event)
+            self._frame_timer.start(utils.frame_interval(self))
+
+# =-------------------------------------------------------------------------------------------------= #
+
+
 # =----------------= #
 # CircleWindow class #
 # =----------------= #
@@ -56,6 +145,18 @@ class CircleWindow(QWidget):
     frameless circle containing an editable hotkey.
     """ 
 
+    #   Declare the signal sent from the keyboard hook each time a chord of the hotkey being input is
+    # complete, or once Enter confirms the input, given whether it got confirmed, for the pending
+    # sequence to be shown and its timeout to restart, or for it to be applied, from the Qt main loop.
+    chord_input = Signal(bool)
+
+    # The STYLE keys the CircleWindows are painted from.
+    THEME_KEYS: typing.Set[typing.Tuple[str, ...]] = {
+        ("Custom", "circlewindow-background-color"),
+        ("Custom", "invalid-color"),
+        ("Custom", "selected-background-color")
+    }
+
     # =================== #
     # Initializer methods #
     # =================== #
@@ -65,7 +166,8 @@ class CircleWindow(QWidget):
             virtual_parent: typing.Optional[QWidget] = None,
             hotkey: typing.Optional[str] = None,
             position: typing.Optional[QPoint] = None,
-            size: QSize = QSize(60, 60)
+            size: QSize = QSize(60, 60),
+            parent: typing.Optional[QWidget] = None
     ) -> None:
         """
         Initializer method.
@@ -73,6 +175,8 @@ class CircleWindow(QWidget):
         If a hotkey is provided, initialize the CircleWindow with such a hotkey.
         If a position is provided, initialize the CircleWindow at such coordinates.
         If a size is provided, initialize the CircleWindow with such a size.
+        If a parent is provided, the CircleWindow is a child widget of such
+        a parent (an OverlayWindow) instead of being a window on its own.
 
         :param virtual_parent: The optional virtual_parent of the CircleWindow to instantiate. By default, None.
         :type virtual_parent: QWidget or None
@@ -82,24 +186,38 @@ class CircleWindow(QWidget):
         :type position: PySide6.QtCore.QPoint or None
         :param size: The optional size of the CircleWindow to instantiate. By default, (60, 60).
         :type size: QSize or None
+        :param parent: The optional OverlayWindow parent of the CircleWindow to instantiate. By default, None.
+        :type parent: QWidget or None
         """
 
         # Call the super class's initializer method.
-        super().__init__()
+        super().__init__(parent)
 
         # Initialize the straight-forward attributes.
         self._virtual_parent: typing.Optional[QWidget] = virtual_parent
         self._old_position: typing.Optional[QPoint] = None
-        self._hotkey: str = hotkey if hotkey else \
-            next(c for c in string.printable if c not in getattr(self._virtual_parent, "hotkeys"))
+        self._drag_position: typing.Optional[QPoint] = None
+        self._drag_snap: bool = True
+        self._drag_pending: bool = False
+        self._frame_timer: typing.Optional[QTimer] = None
+        self._overlapping: bool = False
+        self._highlighted: bool = False
+        self._hotkey: str = hotkey if hotkey else getattr(self._virtual_parent, "registry").allocate()
         self._input_hotkeys: typing.List[str] = []
         self._last_input_hotkeys: typing.List[str] = []
+        self._input_sequence: typing.List[str] = []
+        self._pending_hotkey: str = ""
         self._hook: typing.Optional[typing.Callable[..., None]] = None
         self._is_resizing: bool = False
+        self._pixmap: typing.Optional[QPixmap] = None
+        self._pixmap_key: typing.Optional[typing.Tuple[int, int, str, str, float]] = None
 
         # Call the UI initialization method to initialize the UI itself.
         self._init_ui(position, size)
 
+        # Register the CircleWindow as the one displaying its hotkey.
+        getattr(self._virtual_parent, "registry").register(self, self._hotkey)
+
         # Trace.
         logger.info(f"New hotkey \"{self._hotkey.upper()}\" created")
 
@@ -119,8 +237,12 @@ class CircleWindow(QWidget):
         :type size: QSize or None
         """
 
-        # Set the Window Flags.
-        self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        #   Set the Window Flags. Within an OverlayWindow, the SubWindow
+        # flag makes the QSizeGrip resize the CircleWindow itself.
+        if self.parentWidget() is None:
+            self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
+        else:
+            self.setWindowFlags(Qt.SubWindow)
 
         # Set the Translucent Background attribute.
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -131,14 +253,26 @@ class CircleWindow(QWidget):
         # Set the minimum size.
         self.setMinimumSize(QSize(50, 50))
 
-        # If a position is provided, move the UI.
+        # If a position is provided, move the UI, mapping
+        # the global position within the parent if any.
         if position is not None:
-            self.move(position.x() - self.width(), position.y() - self.height())
-            # self.move(position)
+            top_left: QPoint = QPoint(position.x() - self.width(), position.y() - self.height())
+            if self.parentWidget() is not None:
+                top_left = self.parentWidget().mapFromGlobal(top_left)
+            self.move(top_left)
 
-        # Initialize the corner grip.
-        self._corner_grip: QSizeGrip = QSizeGrip(self)
+        # Initialize the corner grip, committing the new size once the resizing ends.
+        self._corner_grip: FramePacedSizeGrip = FramePacedSizeGrip(self)
         self._corner_grip.setFixedSize(QSize(20, 20))
+        self._corner_grip.released.connect(self._resizing_released)
+
+        #   Initialize the sequence timer, restarted by each chord input and applying the sequence
+        # once it elapses, the chords being input from the keyboard hook's thread.
+        self._input_timer: QTimer = QTimer(self)
+        self._input_timer.setSingleShot(True)
+        self._input_timer.setInterval(int(SEQUENCE_TIMEOUT * 1000))
+        self._input_timer.timeout.connect(self._apply_input_sequence)
+        self.chord_input.connect(self._chord_input)
 
     # ================== #
     # Overridden methods #
@@ -153,42 +287,21 @@ class CircleWindow(QWidget):
         :param PySide6.QtGui.QPaintEvent event: The QPaintEvent received.
         """
 
-        # Initialize a QPainter instance.
+        #   Re-render the cached pixmap only if the size, the hotkey or the pending one being input,
+        # the theme color, the overlapping warning, the highlight or the device pixel ratio changed.
+        text: str = self._pending_hotkey or self._hotkey
+        color: str = STYLE["Custom"]["invalid-color"] if self._overlapping else \
+            STYLE["Custom"]["selected-background-color"] if self._highlighted else \
+            STYLE["Custom"]["circlewindow-background-color"]
+        ratio: float = self.devicePixelRatioF()
+        pixmap_key: typing.Tuple[int, int, str, str, float] = (self.width(), self.height(), text, color, ratio)
+        if pixmap_key != self._pixmap_key:
+            self._pixmap = self._render_pixmap(text, color, ratio)
+            self._pixmap_key = pixmap_key
+
+        # Blit the cached pixmap.
         qp: QPainter = QPainter(self)
-
-        # Set the QPainter instance antialiasing and brush color.
-        qp.setRenderHint(QPainter.Antialiasing)
-        qp.setBrush(QColor("#80" + STYLE["Custom"]["circlewindow-background-color"][1:]))
-
-        # Give the QPainter instance an Ellipse shape.
-        qp.drawEllipse(8, 8, self.width()-8, self.height()-8)
-
-        # Calculate available space for text.
-        max_width = self.width() - 16
-        max_height = self.height() - 16
-
-        # Start with a larger font size and decrease until the text fits.
-        font_size = 22
-        font = QFont("Arial", font_size, QFont.Bold)
-
-        # Compute the text metrics for the iteration loop.
-        metrics = QFontMetrics(font)
-        text_width = metrics.horizontalAdvance(self._hotkey.upper())
-        text_height = metrics.height()
-
-        # Adjust font size until the text fits
-        while text_width > max_width or text_height > max_height:
-            font_size -= 1
-            font.setPointSize(font_size)
-            metrics = QFontMetrics(font)
-            text_width = metrics.horizontalAdvance(self._hotkey.upper())
-            text_height = metrics.height()
-
-        # Set the final QPainter font.
-        qp.setFont(font)
-
-        # Draw the text hotkey text centered within the QPainter instance.
-        qp.drawText(QRect(8, 8, self.width()-8, self.height()-8), Qt.AlignCenter, self._hotkey.upper())
+        qp.drawPixmap(0, 0, self._pixmap)
 
     def mousePressEvent(self, event: QMouseEvent):
         """
@@ -205,19 +318,21 @@ class CircleWindow(QWidget):
         # The MainWindow's config dictionary will be updated once the mouse's click get released.
         if event.button() == Qt.LeftButton:
             self._old_position = event.globalPosition().toPoint()
+            self._drag_position = self.pos()
 
             # Trace.
             logger.info(f"Move the hotkey \"{self._hotkey.upper()}\" from ({self.pos().x()};{self.pos().y()})")
 
         # Otherwise, if the event is a right click and KEYBOARD_HOTKEY_INPUT_FLAG is False
         # start the keyboard listener with the update_hotkey method as a callback.
-        # The MainWindow's config dictionary will be updated once a new valid and unique hotkey get pressed.
+        #   The MainWindow's config dictionary will be updated once a new valid and unique hotkey get pressed,
+        # possibly a sequence of chords, each one pressed within the sequence timeout after the previous one.
         elif event.button() == Qt.RightButton and not KEYBOARD_HOTKEY_INPUT_FLAG:
             self._hook = keyboard.on_press(self._update_hotkey)
             KEYBOARD_HOTKEY_INPUT_FLAG = True
 
             # Trace.
-            logger.info(f"Edit the hotkey \"{self._hotkey.upper()}\"")
+            logger.info(f"Edit the hotkey \"{self._hotkey.upper()}\", press Enter to confirm")
 
         # Otherwise, if the event is a middle click (scroll button), destroy the CircleWindow instance.
         # Update also the MainWindow's config dictionary.
@@ -225,7 +340,9 @@ class CircleWindow(QWidget):
             self.close()
             self.deleteLater()
             getattr(self._virtual_parent, "circle_windows").remove(self)
-            utils.update_dict(CONFIG, "hotkeys", self._hotkey.lower(), delete=True)
+            getattr(self._virtual_parent, "registry").unregister(self)
+            getattr(self._virtual_parent, "spatial_grid").remove(self)
+            getattr(self._virtual_parent, "refresh_hotkeys_search")()
 
             # Set KEYBOARD_HOTKEY_INPUT_FLAG to False
             # and unhook the hook function if it exists.
@@ -233,6 +350,9 @@ class CircleWindow(QWidget):
                 KEYBOARD_HOTKEY_INPUT_FLAG = False
                 utils.unhook(self._hook)
 
+            # Cancel the sequence being input, if any.
+            self._input_timer.stop()
+
             # Trace.
             logger.info(f"Delete the hotkey \"{self._hotkey.upper()}\"")
 
@@ -250,24 +370,30 @@ class CircleWindow(QWidget):
         # If the event is a left click, update the CONFIG dictionary.
         if event.button() == Qt.LeftButton:
 
-            # Call the utils.update_dict method twice with the corresponding arguments.
-            utils.update_dict(CONFIG, "last_position", value=[self.position.x(), self.position.y()])
-            utils.update_dict(
-                CONFIG,
-                "hotkeys",
-                self.hotkey.lower(),
-                value={
-                    "type": "Click",
-                    'x': self.position.x(),
-                    'y': self.position.y(),
-                    'w': self.size.width(),
-                    'h': self.size.height()
-                }
-            )
+            # Apply the latest pending move before ending the gesture.
+            if self._frame_timer is not None:
+                self._frame_timer.stop()
+            self._frame_timeout()
+
+            # Commit the new geometry, once for the whole gesture.
+            self._commit_geometry()
+
+            # Move the CircleWindow to the OverlayWindow of the screen it has been dropped on.
+            if self.parentWidget() is not None and hasattr(self._virtual_parent, "update_circle_window_parent"):
+                self._virtual_parent.update_circle_window_parent(self)
+
+            # Remove the alignment guides.
+            getattr(self._virtual_parent, "show_alignment_guides")([])
+            self._drag_position = None
 
             # Trace.
             logger.info(f"Move the hotkey \"{self._hotkey.upper()}\" to ({self.pos().x()};{self.pos().y()})")
 
+            # Warn about the overlapping hotkeys, which may lead to misclicks, and remove the warning color.
+            if self._overlapping:
+                logger.warning(f"Hotkey \"{self._hotkey.upper()}\" overlaps another hotkey!")
+                self._set_overlapping(False)
+
         # Continue propagating the MousePressEvent.
         super().mousePressEvent(event)
 
@@ -279,21 +405,40 @@ class CircleWindow(QWidget):
         :param PySide6.QtGui.QMouseEvent event: The QMouseEvent received.
         """
 
-        # If is_resizing is True, update the old position attribute.
+        # If is_resizing is True, update the old and drag position attributes.
         if self._is_resizing:
             self._old_position = event.globalPosition().toPoint()
+            self._drag_position = self.pos()
             self._is_resizing = False
 
-        # If the mouse move with the left mouse button pressed, update the CircleWindow's position.
-        if event.buttons() == Qt.LeftButton and self._old_position is not None:
+        #   If the mouse move with the left mouse button pressed, update the CircleWindow's
+        # position, snapping it to its neighbors unless the shift modifier is pressed.
+        # Within a frame, only the latest position get applied once the frame elapsed.
+        if event.buttons() == Qt.LeftButton and self._old_position is not None and self._drag_position is not None:
             tmp: QPoint = event.globalPosition().toPoint()
-            delta: QPoint = QPoint(tmp - self._old_position)
-            self.move(int(self.x() + delta.x()), int(self.y() + delta.y()))
+            self._drag_position += tmp - self._old_position
+            self._drag_snap = not event.modifiers() & Qt.ShiftModifier
             self._old_position = tmp
+            self._drag_pending = True
+            self._request_frame()
 
         # Continue propagating the MousePressEvent.
         super().mousePressEvent(event)
 
+    def moveEvent(self, event: QMoveEvent):
+        """
+        Overridden moveEvent method.
+        This method is called when the CircleWindow instance get moved.
+
+        :param PySide6.QtGui.QMoveEvent event: The QMoveEvent received.
+        """
+
+        # Call the super class moveEvent method.
+        super().moveEvent(event)
+
+        # Update the ellipse's geometry within the SpatialGrid.
+        getattr(self._virtual_parent, "spatial_grid").update(self, self.ellipse_geometry)
+
     def resizeEvent(self, event: QResizeEvent):
         """
         Overridden resizeEvent method.
@@ -305,25 +450,168 @@ class CircleWindow(QWidget):
         # Call the super class resizeEvent method.
         super().resizeEvent(event)
 
-        # Update the grip position and size.
+        #   Update the grip position and size, on the ellipse's diagonal,
+        # cos(atan(h/w)) and sin(atan(h/w)) being w/hypot(w,h) and h/hypot(w,h).
         ellipse_width = self.width()
         ellipse_height = self.height()
-        ellipse_center_x = ellipse_width / 2 + 10
-        ellipse_center_y = ellipse_height / 2 + 10
-        angle = math.atan(ellipse_height / ellipse_width)
+        diagonal = math.hypot(ellipse_width, ellipse_height)
         self._corner_grip.move(
-            int(ellipse_center_x - ellipse_width / 2 * math.cos(angle) - self._corner_grip.width() / 2),
-            int(ellipse_center_y - ellipse_height / 2 * math.sin(angle) - self._corner_grip.height() / 2)
+            int(ellipse_width / 2 + 10 - ellipse_width ** 2 / (2 * diagonal) - self._corner_grip.width() / 2),
+            int(ellipse_height / 2 + 10 - ellipse_height ** 2 / (2 * diagonal) - self._corner_grip.height() / 2)
         )
         self._corner_grip.resize(QSize(int(self.width()/5), int(self.height()/5)))
 
         # Keep in memory that the CircleWindow instance is getting resized, not moved.
         self._is_resizing = True
 
+        # Update the ellipse's geometry within the SpatialGrid.
+        getattr(self._virtual_parent, "spatial_grid").update(self, self.ellipse_geometry)
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def set_highlighted(self, highlighted: bool) -> None:
+        """
+        Set whether the CircleWindow matches the hotkeys search, repainting it if it changed.
+
+        :param bool highlighted: If True, the CircleWindow get painted with the selected background color.
+        """
+        if highlighted != self._highlighted:
+            self._highlighted = highlighted
+            self.update()
+
     # =============== #
     # Private methods # 
     # =============== #
 
+    def _request_frame(self) -> None:
+        """
+        Apply the pending move right away if no frame is in progress and start a new frame,
+        otherwise leave it pending until the frame elapses, at the screen refresh rate.
+        """
+
+        # Initialize the frame timer on the first gesture only.
+        if self._frame_timer is None:
+            self._frame_timer = QTimer(self)
+            self._frame_timer.setSingleShot(True)
+            self._frame_timer.timeout.connect(self._frame_timeout)
+
+        # If a frame is in progress, the pending move will be applied once it elapses.
+        if self._frame_timer.isActive():
+            return
+
+        # Otherwise, apply the pending move right away.
+        self._frame_timeout()
+
+    def _frame_timeout(self) -> None:
+        """Apply the latest pending move, if any, and start a new frame."""
+        if self._drag_pending and self._drag_position is not None:
+            self._drag_pending = False
+            self._drag_to(self._drag_position, self._drag_snap)
+            self._frame_timer.start(utils.frame_interval(self))
+
+    def _commit_geometry(self) -> None:
+        """
+        Update the last position and merge the current geometry into the hotkey's binding,
+        then update the highlight of the hotkeys search as the coordinates are searchable.
+        """
+        utils.update_dict(CONFIG, "last_position", value=[self.position.x(), self.position.y()])
+        getattr(self._virtual_parent, "registry").update_binding(
+            self.hotkey,
+            x=self.position.x(),
+            y=self.position.y(),
+            w=self.size.width(),
+            h=self.size.height()
+        )
+        getattr(self._virtual_parent, "refresh_hotkeys_search")()
+
+    def _resizing_released(self) -> None:
+        """Callback method when the corner grip get released, committing the new geometry."""
+
+        # Commit the new geometry, once for the whole gesture.
+        self._commit_geometry()
+
+        # Trace.
+        logger.info(f"Resize the hotkey \"{self._hotkey.upper()}\" to ({self.width()};{self.height()})")
+
+    def _drag_to(self, position: QPoint, snap: bool = True) -> None:
+        """
+        Move the CircleWindow to the given position, within its parent if any.
+        If snap is True, snap its ellipse to the closest alignment with its neighbors and draw the
+        alignment guides. Paint it with the invalid color while it overlaps another hotkey.
+
+        :param PySide6.QtCore.QPoint position: The unsnapped position to move the CircleWindow to.
+        :param bool snap: If True, snap the CircleWindow to its neighbors. By default, True.
+        """
+
+        # Retrieve the global geometry the ellipse would have at such a position.
+        spatial_grid: typing.Any = getattr(self._virtual_parent, "spatial_grid")
+        ellipse: QRect = QRect(8, 8, self.width() - 8, self.height() - 8).translated(
+            self.mapToGlobal(QPoint(0, 0)) - self.pos() + position
+        )
+
+        # Snap the ellipse to its neighbors if required.
+        offset: QPoint = QPoint()
+        guides: typing.List[typing.Any] = []
+        if snap:
+            offset, guides = spatial_grid.snap(self, ellipse)
+
+        # Move the CircleWindow, update the overlapping warning and draw the alignment guides.
+        self.move(position + offset)
+        self._set_overlapping(spatial_grid.overlaps(self, ellipse.translated(offset)))
+        getattr(self._virtual_parent, "show_alignment_guides")(guides)
+
+    def _set_overlapping(self, overlapping: bool) -> None:
+        """
+        Set whether the CircleWindow overlaps another hotkey, repainting it if it changed.
+
+        :param bool overlapping: If True, the CircleWindow get painted with the invalid color.
+        """
+        if overlapping != self._overlapping:
+            self._overlapping = overlapping
+            self.update()
+
+    def _render_pixmap(self, text: str, color: str, ratio: float) -> QPixmap:
+        """
+        Render the CircleWindow's appearance to a new transparent pixmap.
+
+        :param str text: The hotkey to display.
+        :param str color: The hex color of the circle.
+        :param float ratio: The device pixel ratio to render the pixmap for.
+        :returns: The rendered pixmap.
+        :rtype: PySide6.QtGui.QPixmap
+        """
+
+        # Initialize a transparent pixmap matching the device pixel ratio.
+        pixmap: QPixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        # Initialize a QPainter instance on the pixmap.
+        qp: QPainter = QPainter(pixmap)
+
+        # Set the QPainter instance antialiasing and brush color.
+        qp.setRenderHint(QPainter.Antialiasing)
+        qp.setBrush(QColor("#80" + color[1:]))
+
+        # Give the QPainter instance an Ellipse shape.
+        qp.drawEllipse(8, 8, self.width()-8, self.height()-8)
+
+        # Set the largest font fitting the available space for text, memoized by the fit_font_size function.
+        qp.setFont(QFont(
+            FONT_FAMILY,
+            utils.fit_font_size(text.upper(), self.width() - 16, self.height() - 16, FONT_FAMILY),
+            QFont.Bold
+        ))
+
+        # Draw the text hotkey text centered within the QPainter instance.
+        qp.drawText(QRect(8, 8, self.width()-8, self.height()-8), Qt.AlignCenter, text.upper())
+
+        # End the painting and return the pixmap.
+        qp.end()
+        return pixmap
+
     def _update_hotkey(self, event: utils.KeyboardEvent):
         """
         Update the hotkey displayed on the CircleWindow instance.
@@ -332,12 +620,15 @@ class CircleWindow(QWidget):
         :type event: utils.KeyboardEvent
         """
 
-        # Make KEYBOARD_HOTKEY_INPUT_FLAG global variable writable.
-        global KEYBOARD_HOTKEY_INPUT_FLAG
-
         # Retrieve the event's hotkey string value.
         event_hotkey: str = event.name.lower()
 
+        #   Apply the sequence being input right away once Enter confirms it, from the Qt main loop,
+        # Enter being a chord as any other key if no chord got input yet.
+        if event_hotkey == "enter" and self._input_sequence and not self._input_hotkeys:
+            self.chord_input.emit(True)
+            return
+
         # If the hotkey has already been registered, return.
         if event_hotkey in self._input_hotkeys:
             return
@@ -345,43 +636,79 @@ class CircleWindow(QWidget):
         # Add the new event hotkey to the input hotkey attribute.
         self._input_hotkeys.append(event_hotkey)
 
-        # If the hotkey isn't among ["ctrl", "maj", "alt"], unhook the keyboard listener,
-        # set KEYBOARD_HOTKEY_INPUT_FLAG to False and update the CircleWindow instance's attributes
+        #   If the hotkey isn't among ["ctrl", "maj", "alt"], the chord is complete: append it to the sequence
+        # being input, then restart the sequence timeout from the Qt main loop to wait for the next chord.
         if event_hotkey not in ["ctrl", "maj", "alt"]:
-
-            # Ensure the hotkey isn't already applied to another CircleWindow
-            hotkey: str = '+'.join(self._input_hotkeys)
-            if hotkey in getattr(self._virtual_parent, "hotkeys"):
-                logger.error(f"Hotkey \"{hotkey}\" is already assigned!")
-                self._input_hotkeys = []
-                return
-
-            utils.unhook(self._hook)
-            KEYBOARD_HOTKEY_INPUT_FLAG = False
-            previous_hotkey: str = self._hotkey
-            self._hotkey = hotkey
-            self._last_input_hotkeys = self._input_hotkeys.copy()
+            self._input_sequence.append('+'.join(self._input_hotkeys))
             self._input_hotkeys = []
-            self.update()
+            self.chord_input.emit(False)
 
-            # Update the CONFIG dictionary by calling the utils.update_dict
-            # method twice with the corresponding arguments.
-            utils.update_dict(CONFIG, "hotkeys", previous_hotkey.lower(), delete=True)
-            utils.update_dict(
-                CONFIG,
-                "hotkeys",
-                self.hotkey.lower(),
-                value={
-                    "type": "Click",
-                    'x': self.position.x(),
-                    'y': self.position.y(),
-                    'w': self.size.width(),
-                    'h': self.size.height()
-                }
-            )
+    def _chord_input(self, confirmed: bool) -> None:
+        """
+        Callback method when a chord of the hotkey being input is complete, showing the pending sequence
+        and restarting the sequence timeout, or when Enter confirmed the input, applying it at once.
 
-            # Trace.
-            logger.info(f"Hotkey edited to \"{self._hotkey.upper()}\"")
+        :param bool confirmed: If True, Enter confirmed the input.
+        """
+
+        # Apply the sequence at once if confirmed.
+        if confirmed:
+            self._input_timer.stop()
+            self._apply_input_sequence()
+            return
+
+        # Otherwise, show the pending sequence, waiting for its next chord, and restart the sequence timeout.
+        self._pending_hotkey = SEQUENCE_SEPARATOR.join(self._input_sequence + ["..."])
+        self.update()
+        self._input_timer.start()
+
+    def _apply_input_sequence(self) -> None:
+        """
+        Apply the sequence of chords input, once no chord got pressed for the sequence timeout or once
+        Enter confirmed it: unhook the keyboard listener, set KEYBOARD_HOTKEY_INPUT_FLAG to False and
+        update the CircleWindow instance's attributes.
+        """
+
+        # Make KEYBOARD_HOTKEY_INPUT_FLAG global variable writable.
+        global KEYBOARD_HOTKEY_INPUT_FLAG
+
+        #   Retrieve the sequence input, a single chord being the shortest sequence, and stop showing
+        # it as pending. Return if it got applied already, Enter confirming it as its timeout elapsed.
+        chords: typing.List[str] = self._input_sequence
+        self._input_sequence = []
+        self._pending_hotkey = ""
+        self.update()
+        if not chords:
+            return
+
+        #   Move the hotkey's binding to the new hotkey, ensuring it isn't already applied to another
+        # CircleWindow nor to a shortcut, and that it neither starts one nor starts with one.
+        hotkey: str = SEQUENCE_SEPARATOR.join(chords)
+        conflict: typing.Optional[str] = getattr(self._virtual_parent, "registry").rename(self, hotkey)
+        if conflict is not None:
+            logger.error(f"Hotkey \"{hotkey}\" conflicts with a {conflict}!")
+            return
+
+        utils.unhook(self._hook)
+        KEYBOARD_HOTKEY_INPUT_FLAG = False
+        self._hotkey = hotkey
+        self._last_input_hotkeys = chords
+        self.update()
+
+        # Merge the current geometry into the moved binding, creating it if needed.
+        getattr(self._virtual_parent, "registry").update_binding(
+            self.hotkey,
+            x=self.position.x(),
+            y=self.position.y(),
+            w=self.size.width(),
+            h=self.size.height()
+        )
+
+        # Update the highlight of the hotkeys search, as the hotkey is searchable.
+        getattr(self._virtual_parent, "refresh_hotkeys_search")()
+
+        # Trace.
+        logger.info(f"Hotkey edited to \"{self._hotkey.upper()}\"")
 
     # ============== #
     # Getter methods #
@@ -402,10 +729,20 @@ class CircleWindow(QWidget):
         """
         Getter method for the CircleWindow's coordinates.
 
-        :returns: The CircleWindow's coordinates as a QPoint.
+        :returns: The CircleWindow's global coordinates as a QPoint.
         :rtype: QPoint
         """
-        return self.pos() + QPoint(self.width(), self.height())
+        return self.mapToGlobal(QPoint(0, 0)) + QPoint(self.width(), self.height())
+
+    @property
+    def ellipse_geometry(self) -> QRect:
+        """
+        Getter method for the CircleWindow's ellipse geometry.
+
+        :returns: The CircleWindow's ellipse global geometry as a QRect.
+        :rtype: QRect
+        """
+        return QRect(self.mapToGlobal(QPoint(8, 8)), QSize(self.width() - 8, self.height() - 8))
 
     @property
     def size(self) -> QSize:
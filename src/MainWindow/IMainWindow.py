@@ -21,22 +21,34 @@
 # Libraries import #
 # =--------------= #
 
-from typing             import Dict, List, Optional
+from typing             import Any, Deque, Dict, KeysView, List, Optional, Set, Tuple
 from .MainMenuBar       import MainMenuBar
 from src.SettingsDialog import SettingsDialog
 from src.CircleWindow   import CircleWindow
-from PySide6.QtCore     import Qt, QPoint, QSize, Slot
-from PySide6.QtGui      import QAction, QCloseEvent, QIcon, QShortcut
-from PySide6.QtWidgets  import QMainWindow, QFileDialog, QLabel, QMenu, QPushButton, QSlider, QStatusBar, \
-    QSystemTrayIcon, QHBoxLayout, QVBoxLayout, QWidget
+from src.OverlayWindow  import OverlayWindow
+from PySide6.QtCore     import Qt, QLine, QObject, QPoint, QSize, QThread, QTimer, Signal, Slot
+from PySide6.QtGui      import QAction, QCloseEvent, QGuiApplication, QIcon, QScreen, QShortcut
+from PySide6.QtWidgets  import QMainWindow, QComboBox, QFileDialog, QLabel, QLineEdit, QMenu, QProgressBar, \
+    QPushButton, QSlider, QStatusBar, QSystemTrayIcon, QHBoxLayout, QVBoxLayout, QWidget
+from collections        import deque
 from pathlib            import Path
 from src.utils          import PATH
-from src.config         import CONFIG, CONFIG_FILE, STYLE
+from src.config         import CONFIG, CONFIG_FILE
+from src.registry       import HotkeyRegistry
+from src.spatial        import SpatialGrid
+from src.layers         import BASE_LAYER, BASE_LAYER_LABEL
+from src.profiles       import PROFILES, Profile
+from src.actions        import InputBackend
+from src.search         import SEARCH_RESULTS_LIMIT
 import typing
+import copy
 import src.logger           as logger
 import os
 import sys
+import time
 import src.config          as config
+import src.calibration     as calibration
+import src.stylesheet      as stylesheet
 import src.utils           as utils
 
 # =-----------------------------------------------------------------------------------------------------= #
@@ -47,6 +59,130 @@ import src.utils           as utils
 # =--------------------------------------------------= #
 
 
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+#   Maximum duration (in seconds) of a single CircleWindows creation
+# chunk, after which the control is given back to the Qt event loop.
+MATERIALIZATION_CHUNK_DURATION: float = 0.008
+
+# =---------------------------------------------------------------------------= #
+
+
+# =----------------------= #
+# ConfigLoaderThread class #
+# =----------------------= #
+
+class ConfigLoaderThread(QThread):
+    """
+    ConfigLoaderThread QThread used for reading,
+    parsing and validating a config file from a
+    different thread than the one used by the Qt
+    main loop, keeping the UI responsive.
+    """
+
+    # Declare the signals to send once the config
+    # file is parsed or once its parsing failed.
+    loaded = Signal(object)
+    failed = Signal(str)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, file: Path, parent: QWidget) -> None:
+        """
+        Initializer method.
+
+        :param file: The config file to parse.
+        :type file: pathlib.Path
+        :param parent: The parent of the ConfigLoaderThread to instantiate.
+        :type parent: QWidget
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Set the straight-forward attribute.
+        self._file: Path = file
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def run(self) -> None:
+        """
+        Overridden run method.
+        This method is called when the ConfigLoaderThread starts.
+        """
+
+        # Parse the config file and emit its content, or the exception raised.
+        try:
+            self.loaded.emit(config.parse_config(self._file))
+        except config.CONFIG_ERRORS as e:
+            self.failed.emit(str(e))
+
+# =--------------------------------------------------------------------------------= #
+
+
+# =---------------------= #
+# CalibrationThread class #
+# =---------------------= #
+
+class CalibrationThread(QThread):
+    """
+    CalibrationThread QThread used for measuring the
+    click timing of a mouse backend from a different
+    thread than the one used by the Qt main loop,
+    keeping the UI responsive meanwhile.
+    """
+
+    # Declare the signals to send once the click
+    # timing is calibrated or once the calibration failed.
+    calibrated = Signal(object)
+    failed = Signal(str)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, backend: InputBackend, key: str, parent: QWidget) -> None:
+        """
+        Initializer method.
+
+        :param InputBackend backend: The backend whose click timing to calibrate.
+        :param str key: The key of the mouse backend and screen setup.
+        :param parent: The parent of the CalibrationThread to instantiate.
+        :type parent: QWidget
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Set the straight-forward attributes.
+        self._backend: InputBackend = backend
+        self._key: str = key
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def run(self) -> None:
+        """
+        Overridden run method.
+        This method is called when the CalibrationThread starts.
+        """
+
+        # Calibrate the click timing and emit the calibration, or the exception raised.
+        try:
+            self.calibrated.emit(calibration.calibrate(self._backend, self._key))
+        except (RuntimeError, OSError) as e:
+            self.failed.emit(str(e))
+
+# =--------------------------------------------------------------------------------= #
+
+
 # =---------------= #
 # IMainWindow class #
 # =---------------= #
@@ -58,6 +194,15 @@ class IMainWindow(QMainWindow):
     by the Main Window class from the MainWindow.py file.
     """
 
+    #   Declare the signal sent from the keyboard hook each time
+    # a hotkey is pressed, for the widgets capturing a shortcut.
+    hotkey_pressed = Signal(str)
+
+    #   Declare the signal sent from the keyboard hook once the hotkey routine
+    # cycled to another profile, given its config file, for the MainWindow
+    # to apply its config from the Qt main loop.
+    profile_cycled = Signal(str)
+
     # =================== #
     # Initializer methods #
     # =================== #
@@ -70,9 +215,18 @@ class IMainWindow(QMainWindow):
 
         # Initialize the straight-forward attributes.
         self._circle_windows: List[CircleWindow] = []
+        self._highlighted_circle_windows: Set[CircleWindow] = set()
+        self._overlay_windows: Dict[QScreen, OverlayWindow] = {}
+        self._circle_windows_visible: bool = True
+        self._pending_hotkeys: Deque[str] = deque()
+        self._registry: HotkeyRegistry = HotkeyRegistry()
+        self._spatial_grid: SpatialGrid = SpatialGrid()
+        self._layer: str = BASE_LAYER
+        self._layer_views: Dict[str, Tuple[List[CircleWindow], HotkeyRegistry, SpatialGrid]] = {}
+        self._config_loader: Optional[ConfigLoaderThread] = None
+        self._calibration_thread: Optional[CalibrationThread] = None
         self._builtin_shortcuts: Dict[str, QShortcut] = {}
         self._custom_shortcuts: Dict[str, QShortcut] = {}
-        self._init_error_message: Optional[str] = None
         self._last_hotkey: Optional[str] = None
         self._disable_hotkeys: bool = False
 
@@ -85,6 +239,9 @@ class IMainWindow(QMainWindow):
         # Set the Window Flag.
         self.setWindowFlags(Qt.WindowStaysOnTopHint)
 
+        # Set the object name selecting the IMainWindow within the application-wide stylesheet.
+        self.setObjectName("main_window")
+
         # Set the title and icon of the Window.
         self.setWindowTitle("HotClick")
         self.setWindowIcon(QIcon(str(PATH / Path("img") / Path("icon.png"))))
@@ -103,13 +260,13 @@ class IMainWindow(QMainWindow):
 
         # Create the hotkeys menu and top layout.
         self._hotkeys_menu: QWidget = QWidget()
-        self._set_hotkeys_menu_stylesheet()
+        self._hotkeys_menu.setObjectName("hotkeys_menu")
         top_layout: QVBoxLayout = QVBoxLayout(self._hotkeys_menu)
 
         # Create a QLabel indicating what's the purpose of the QSlider and add it to the top layout.
         self._hotkeys_radius_label: QLabel = QLabel("Hotkeys default radius: 60")
         self._hotkeys_radius_label.setAlignment(Qt.AlignCenter)
-        self._set_hotkeys_radius_label_stylesheet()
+        self._hotkeys_radius_label.setObjectName("hotkeys_radius_label")
         top_layout.addWidget(self._hotkeys_radius_label)
 
         # Create the QSlider for selecting the hotkeys to be created and add it to the tp layout.
@@ -117,14 +274,32 @@ class IMainWindow(QMainWindow):
         self._hotkeys_radius_slider.setMinimum(50)
         self._hotkeys_radius_slider.setMaximum(400)
         self._hotkeys_radius_slider.setValue(60)
-        self._set_hotkeys_radius_slider_stylesheet()
+        self._hotkeys_radius_slider.setObjectName("hotkeys_radius_slider")
         top_layout.addWidget(self._hotkeys_radius_slider)
 
         # Create the QPushButton for adding new hotkeys and add it to the top layout
         self._new_hotkey_button = QPushButton("New Hotkey")
-        self._set_new_hotkey_button_stylesheet()
+        self._new_hotkey_button.setObjectName("new_hotkey_button")
         top_layout.addWidget(self._new_hotkey_button)
 
+        # Create the layers layout, selecting the edited layer or creating a new one, and add it to the top layout.
+        layers_layout: QHBoxLayout = QHBoxLayout()
+        self._layers_combo_box: QComboBox = QComboBox()
+        self._layers_combo_box.setObjectName("layers_combo_box")
+        self._layers_combo_box.addItem(BASE_LAYER_LABEL, BASE_LAYER)
+        layers_layout.addWidget(self._layers_combo_box, stretch=1)
+        self._new_layer_button: QPushButton = QPushButton("New Layer")
+        self._new_layer_button.setObjectName("new_layer_button")
+        layers_layout.addWidget(self._new_layer_button)
+        top_layout.addLayout(layers_layout)
+
+        # Create the QLineEdit for searching the hotkeys and add it to the top layout.
+        self._hotkeys_search_edit: QLineEdit = QLineEdit()
+        self._hotkeys_search_edit.setPlaceholderText("Search hotkeys...")
+        self._hotkeys_search_edit.setClearButtonEnabled(True)
+        self._hotkeys_search_edit.setObjectName("hotkeys_search_edit")
+        top_layout.addWidget(self._hotkeys_search_edit)
+
         # Add the top frame to the main layout.
         main_layout.addWidget(self._hotkeys_menu)
 
@@ -134,7 +309,7 @@ class IMainWindow(QMainWindow):
 
         # Create the start button for the bottom frame
         self._start_button = QPushButton("Start")
-        self._set_start_button_stylesheet()
+        self._start_button.setObjectName("start_button")
         bottom_layout.addWidget(self._start_button, alignment=Qt.AlignRight)
 
         # Add the bottom frame to the main layout
@@ -145,8 +320,19 @@ class IMainWindow(QMainWindow):
         self.setStatusBar(QStatusBar(self))
         self._status_bar: QStatusBar = self.statusBar()
         self._status_bar.messageChanged.connect(self._reset_status_bar_stylesheet)
-        self._set_status_bar_stylesheet()
-        self._status_bar: QStatusBar = self.statusBar()
+        self._status_bar.setObjectName("status_bar")
+
+        # Initialize the config loading progress bar, hidden while no config is being loaded.
+        self._loading_progress_bar: QProgressBar = QProgressBar(self._status_bar)
+        self._loading_progress_bar.setMaximumWidth(200)
+        self._loading_progress_bar.setFormat("Loading hotkeys %p%")
+        self._loading_progress_bar.setVisible(False)
+        self._status_bar.addPermanentWidget(self._loading_progress_bar)
+
+        # Initialize the timer creating the CircleWindows chunk by chunk.
+        self._materialization_timer: QTimer = QTimer(self)
+        self._materialization_timer.setInterval(0)
+        self._materialization_timer.timeout.connect(self._materialize_circle_windows_chunk)
 
         # Initialize the SettingsDialog to None
         self._settings_dialog: Optional[SettingsDialog] = None
@@ -229,145 +415,22 @@ class IMainWindow(QMainWindow):
         # Call the super class's closeEvent method.
         super().closeEvent(event)
 
+        # Cancel any config loading, waiting for its thread to finish.
+        self._cancel_config_loading(wait=True)
+
         # Reset the CircleWindows.
         self._reset_circle_windows()
 
+        # Close the OverlayWindows.
+        for overlay_window in self._overlay_windows.values():
+            overlay_window.close()
+
         # Clear the IMainWindow's layout.
         utils.clear_layout(self.layout())
 
         # Trace.
         logger.info("Exit the app")
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
-
-    def _set_main_window_stylesheet(self) -> None:
-        """Set the IMainWindow StyleSheet."""
-
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["background-color"]};
-        """)
-    
-    def _set_hotkeys_menu_stylesheet(self) -> None:
-        """Set the Hotkeys Menu StyleSheet."""
-
-        # Set the StyleSheet.
-        self._hotkeys_menu.setStyleSheet(f"""
-            QWidget {{
-                background-color: {STYLE["Custom"]["middleground-color"]};
-            }}
-        """)
-
-    def _set_hotkeys_radius_label_stylesheet(self) -> None:
-        """Set the Hotkeys Radius Label StyleSheet."""
-
-        # Set the StyleSheet.
-        self._hotkeys_radius_label.setStyleSheet(f"""
-             QLabel {{
-                 font-family: {STYLE["font-family"]};
-                 font-size: 14px;
-                 color: {STYLE["color"]};
-                 font-weight: bold;
-             }}
-        """)
-
-    def _set_hotkeys_radius_slider_stylesheet(self) -> None:
-        """Set the Hotkeys Radius Slider StyleSheet."""
-
-        # Set the StyleSheet.
-        self._hotkeys_radius_slider.setStyleSheet(f"""
-             QSlider::groove:horizontal {{
-                 border: 1px solid #999999;
-                 height: 10px;
-                 margin: 0px;
-                 border-radius: 5px;
-             }}
-             QSlider::handle:horizontal {{
-                 background: qradialgradient(
-                     spread:pad, cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5,
-                     stop:0.0 #9696FF,
-                     stop:1.0 #9696FF
-                 );
-                 border: 1px solid #5c5c5c;
-                 width: 20px;
-                 margin: -2px 0;
-                 border-radius: 10px;
-             }}
-             QSlider::add-page:horizontal {{
-                 background: #999999;
-                 border: 1px solid #999999;
-                 height: 10px;
-                 margin: 0px;
-             }}
-             QSlider::sub-page:horizontal {{
-                 background: #999999;
-                 background: qlineargradient(
-                     x1: 0, y1: 0, x2: 0, y2: 1,
-                     stop: 0 #FFFFFF,
-                     stop: 1 #FFFFFF
-                 );
-                 border: 1px solid #999999;
-                 height: 10px;
-                 margin: 0px;
-             }}
-        """)
-
-    def _set_new_hotkey_button_stylesheet(self) -> None:
-        """Set the New Hotkey Button StyleSheet."""
-
-        # Set the StyleSheet.
-        self._new_hotkey_button.setStyleSheet(f"""
-             QPushButton {{
-                 background-color: {STYLE["QPushButton"]["background-color"]};
-                 border-style: outset;
-                 border-width: 2px;
-                 border-radius: 10px;
-                 border-color: white;
-                 font: bold 14px;
-                 min-width: 15em;
-                 padding: 6px;
-             }}
-             QPushButton:pressed {{
-                 background-color: {STYLE["QPushButton:pressed"]["background-color"]};
-                 border-style: inset;
-             }}
-        """)
-
-    def _set_start_button_stylesheet(self) -> None:
-        """Set the Start Button StyleSheet."""
-
-        # Set the StyleSheet.
-        self._start_button.setStyleSheet(f"""
-             QPushButton {{
-                 background-color: {STYLE["QPushButton"]["background-color"]};
-                 border-style: outset;
-                 border-width: 2px;
-                 border-radius: 10px;
-                 border-color: beige;
-                 font: bold 14px;
-                 min-width: 6em;
-                 padding: 6px;
-             }}
-             QPushButton:pressed {{
-                 background-color: {STYLE["QPushButton:pressed"]["background-color"]};
-                 border-style: inset;
-             }}
-        """)
-
-    def _set_status_bar_stylesheet(self) -> None:
-        """Set the Status Bar StyleSheet."""
-
-        # Set the StyleSheet.
-        self._status_bar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {STYLE["QStatusBar"]["background-color"]};
-                padding-left:8px;
-                font-weight: bold;
-            }}
-        """)
-
     # =============================== #
     # Attributes manipulation methods #
     # =============================== #
@@ -376,17 +439,331 @@ class IMainWindow(QMainWindow):
         """Set the last_hotkey attribute to None."""
         self._last_hotkey = None
 
+    def update_builtin_shortcuts(self) -> None:
+        """
+        Update the builtin shortcuts used by the software.
+        This method should be overridden in child classes.
+        """
+        pass
+
+    def refresh_hotkeys_search(self) -> None:
+        """Highlight the CircleWindows matching the hotkeys search again, after a hotkey got edited."""
+        self._search_hotkeys(self._hotkeys_search_edit.text())
+
+    def _search_hotkeys(self, text: str) -> None:
+        """
+        Highlight the CircleWindows whose key, action type or coordinates contain every word of the given text.
+        Only the CircleWindows whose highlight changed get repainted. An empty text highlights none, and so
+        does a text matching more than SEARCH_RESULTS_LIMIT CircleWindows.
+
+        :param str text: The text to search.
+        """
+
+        #   Retrieve the matching CircleWindows from the registry's search index,
+        # highlighting none if the search matches too many of them.
+        text = text.strip()
+        matches: Optional[Set[CircleWindow]] = typing.cast(
+            Optional[Set[CircleWindow]], self._registry.search(text, SEARCH_RESULTS_LIMIT)
+        ) if text else set()
+        if matches is None:
+            logger.info(f"More than {SEARCH_RESULTS_LIMIT} hotkeys match \"{text}\", refine the search")
+            matches = set()
+
+        # Update the highlight of the CircleWindows entering or leaving the matches.
+        for circle_window in self._highlighted_circle_windows - matches:
+            circle_window.set_highlighted(False)
+        for circle_window in matches - self._highlighted_circle_windows:
+            circle_window.set_highlighted(True)
+        self._highlighted_circle_windows = matches
+
     def _reset_circle_windows(self) -> None:
         """
         Reset the CircleWindows by closing them
         and resetting the circle windows list.
         """
 
-        # Close, destroy and remove every element from the circle windows list.
-        for circle_window in self._circle_windows:
-            circle_window.close()
-            circle_window.deleteLater()
+        # Close, destroy and remove every element from the circle windows lists, including the other layers' ones.
+        for circle_windows in [self._circle_windows] + [view[0] for view in self._layer_views.values()]:
+            for circle_window in circle_windows:
+                circle_window.close()
+                circle_window.deleteLater()
         self._circle_windows = []
+        self._layer_views.clear()
+
+        #   Edit the base layer again if the edited layer doesn't exist anymore, the
+        # CONFIG dictionary being replaced, then fill the layers combo box again.
+        if self._layer not in CONFIG["layers"]:
+            self._layer = BASE_LAYER
+        if self._registry.layer != self._layer:
+            self._registry = HotkeyRegistry(self._layer)
+        self._update_layers_combo_box()
+
+        # Forget the CircleWindows, including the ones not created yet.
+        self._highlighted_circle_windows.clear()
+        self._registry.reset()
+        self._spatial_grid.clear()
+        self._pending_hotkeys.clear()
+        self._materialization_timer.stop()
+        self._loading_progress_bar.setVisible(False)
+
+    def _update_layers_combo_box(self) -> None:
+        """Fill the layers combo box with the base layer and the CONFIG dictionary's ones, selecting the edited one."""
+
+        # Fill the combo box without notifying the layer selection.
+        self._layers_combo_box.blockSignals(True)
+        self._layers_combo_box.clear()
+        self._layers_combo_box.addItem(BASE_LAYER_LABEL, BASE_LAYER)
+        for layer in CONFIG["layers"]:
+            self._layers_combo_box.addItem(layer, layer)
+        self._layers_combo_box.setCurrentIndex(self._layers_combo_box.findData(self._layer))
+        self._layers_combo_box.blockSignals(False)
+
+    def _edit_layer(self, layer: str) -> None:
+        """
+        Edit the given layer, only hiding the edited layer's CircleWindows and showing the given layer's ones.
+        The CircleWindows of a layer are created on its first edition, then kept along with its registry
+        and spatial grid while another layer is edited, instead of being created again.
+
+        :param str layer: The name of the layer to edit.
+        """
+
+        # If the layer is already edited, return here.
+        if layer == self._layer:
+            return
+
+        # Wait for the edited layer's CircleWindows to be created before editing another layer.
+        if self._pending_hotkeys:
+            self._update_layers_combo_box()
+            logger.warning("Wait for the hotkeys to be loaded before editing another layer")
+            return
+
+        # Remove the highlights, the hotkeys search only applying to the edited layer.
+        for circle_window in self._highlighted_circle_windows:
+            circle_window.set_highlighted(False)
+        self._highlighted_circle_windows.clear()
+
+        # Hide the edited layer's CircleWindows, keeping them along with their registry and spatial grid.
+        for circle_window in self._circle_windows:
+            circle_window.hide()
+        self._layer_views[self._layer] = (self._circle_windows, self._registry, self._spatial_grid)
+
+        # Show the layer's CircleWindows if they already exist, otherwise create them.
+        self._layer = layer
+        view: Optional[Tuple[List[CircleWindow], HotkeyRegistry, SpatialGrid]] = self._layer_views.pop(layer, None)
+        if view is None:
+            self._circle_windows, self._registry, self._spatial_grid = [], HotkeyRegistry(layer), SpatialGrid()
+            self._queue_circle_windows()
+        else:
+            self._circle_windows, self._registry, self._spatial_grid = view
+            for circle_window in self._circle_windows:
+                if circle_window.parentWidget() is not None or self._circle_windows_visible:
+                    circle_window.show()
+            self.refresh_hotkeys_search()
+
+        # Select the layer within the combo box, and trace.
+        self._update_layers_combo_box()
+        logger.info(f"Editing the layer \"{layer or BASE_LAYER_LABEL}\"")
+
+    def _hide_circle_windows(self) -> None:
+        """Hide the CircleWindows, keeping them alive to be shown again on restoration."""
+
+        # Keep in memory the CircleWindows are hidden,
+        # including the ones not created yet.
+        self._circle_windows_visible = False
+
+        # Hide every standalone CircleWindow.
+        for circle_window in self._circle_windows:
+            if circle_window.parentWidget() is None:
+                circle_window.hide()
+
+        # Deactivate the OverlayWindows, hiding their CircleWindows at once.
+        for overlay_window in self._overlay_windows.values():
+            overlay_window.set_active(False)
+
+    # Turn the show_circle_windows method into a slot to
+    # make it callable using QMetaObject.invokeMethod
+    # to ensure this method is called in the main thread.
+    @Slot()
+    def _show_circle_windows(self) -> None:
+        """
+        Show the CircleWindows hidden by the _hide_circle_windows method.
+        If the config file changed in the meantime, reload it instead.
+        """
+
+        # Keep in memory the CircleWindows are visible.
+        self._circle_windows_visible = True
+
+        # If the config file changed, reload it and return here.
+        if config.config_file_changed():
+            self._load_config()
+            return
+
+        # Show every standalone CircleWindow.
+        for circle_window in self._circle_windows:
+            if circle_window.parentWidget() is None:
+                circle_window.show()
+
+        # Activate the OverlayWindows if the overlay mode is enabled.
+        for overlay_window in self._overlay_windows.values():
+            overlay_window.set_active(CONFIG["overlay_mode"])
+
+    def _circle_window_parent(self, center: Optional[QPoint] = None) -> Optional[OverlayWindow]:
+        """
+        Return the OverlayWindow a CircleWindow centered at the given
+        global coordinates should belong to, creating it if required.
+        Return None if the overlay mode is disabled.
+
+        :param center: The optional CircleWindow's center. By default, None (the primary screen).
+        :type center: PySide6.QtCore.QPoint or None
+        :returns: The OverlayWindow of the screen containing the given center.
+        :rtype: OverlayWindow or None
+        """
+
+        # If the overlay mode is disabled, return None.
+        if not CONFIG["overlay_mode"]:
+            return None
+
+        # Retrieve the screen containing the given center, defaulting to the primary one.
+        screen: Optional[QScreen] = QGuiApplication.screenAt(center) if center is not None else None
+        if screen is None:
+            screen = QGuiApplication.primaryScreen()
+
+        # Return the OverlayWindow of such a screen.
+        return self._overlay_window(screen)
+
+    def _overlay_window(self, screen: QScreen) -> OverlayWindow:
+        """
+        Return the OverlayWindow of the given screen, creating it if it doesn't exist yet.
+
+        :param PySide6.QtGui.QScreen screen: The screen covered by the OverlayWindow.
+        :returns: The OverlayWindow of the given screen.
+        :rtype: OverlayWindow
+        """
+
+        # Create the OverlayWindow of such a screen if it doesn't exist yet.
+        if screen not in self._overlay_windows:
+            self._overlay_windows[screen] = OverlayWindow(screen)
+            self._overlay_windows[screen].set_active(True)
+
+        # Return the OverlayWindow.
+        return self._overlay_windows[screen]
+
+    def show_alignment_guides(self, guides: List[QLine]) -> None:
+        """
+        Draw the given alignment guides over the screens, in both the overlay and standalone modes.
+
+        :param guides: The global alignment guides, an empty list to remove them.
+        :type guides: List[PySide6.QtCore.QLine]
+        """
+
+        # Dispatch the guides to the OverlayWindows of the screens they start on.
+        screens_guides: Dict[QScreen, List[QLine]] = {screen: [] for screen in self._overlay_windows}
+        for guide in guides:
+            screen: Optional[QScreen] = QGuiApplication.screenAt(guide.p1()) or QGuiApplication.primaryScreen()
+            screens_guides.setdefault(screen, []).append(guide)
+
+        # Update every OverlayWindow's guides, creating the missing ones only to draw guides.
+        for screen, screen_guides in screens_guides.items():
+            if screen_guides or screen in self._overlay_windows:
+                self._overlay_window(screen).set_guides(screen_guides)
+
+    def update_circle_window_parent(self, circle_window: CircleWindow) -> None:
+        """
+        Move the given CircleWindow to the OverlayWindow of the screen its center is on.
+
+        :param CircleWindow circle_window: The CircleWindow to move.
+        """
+
+        # Retrieve the OverlayWindow the CircleWindow belongs to now.
+        overlay_window: Optional[OverlayWindow] = self._circle_window_parent(
+            circle_window.mapToGlobal(circle_window.rect().center())
+        )
+
+        # If it didn't change, return here.
+        if overlay_window is None or overlay_window is circle_window.parentWidget():
+            return
+
+        # Reparent the CircleWindow, keeping its global position.
+        top_left: QPoint = circle_window.mapToGlobal(QPoint(0, 0))
+        circle_window.setParent(overlay_window, Qt.SubWindow)
+        circle_window.move(overlay_window.mapFromGlobal(top_left))
+        circle_window.show()
+
+    def _restore_circle_windows(self) -> None:
+        """
+        Reset the CircleWindows and restore the edited layer's ones from the CONFIG dictionary,
+        the other layers' ones being created on their first edition. The CircleWindows are
+        created by time-boxed chunks on the Qt event loop, keeping the UI responsive with
+        very large configs.
+        """
+
+        # Reset the CircleWindows.
+        self._reset_circle_windows()
+
+        # Activate the OverlayWindows only if the overlay mode is enabled.
+        for overlay_window in self._overlay_windows.values():
+            overlay_window.set_active(CONFIG["overlay_mode"] and self._circle_windows_visible)
+
+        # Create the CircleWindows of the edited layer.
+        self._queue_circle_windows()
+
+    def _queue_circle_windows(self) -> None:
+        """Queue every hotkey of the edited layer for its CircleWindow to be created by time-boxed chunks."""
+
+        # Queue every hotkey for its CircleWindow to be created.
+        self._pending_hotkeys.extend(self._registry.bindings)
+        self._loading_progress_bar.setRange(0, len(self._pending_hotkeys))
+
+        #   Create the first chunk right away, and only if some CircleWindows
+        # remain to be created, display the progress bar and start the timer.
+        self._materialize_circle_windows_chunk()
+        if self._pending_hotkeys:
+            self._loading_progress_bar.setVisible(True)
+            self._materialization_timer.start()
+
+    def _materialize_circle_windows_chunk(self) -> None:
+        """Create the pending CircleWindows until the chunk duration is elapsed."""
+
+        # Create the pending CircleWindows until the chunk duration is elapsed.
+        deadline: float = time.perf_counter() + MATERIALIZATION_CHUNK_DURATION
+        bindings: Dict[str, Dict[str, Any]] = self._registry.bindings
+        while self._pending_hotkeys and time.perf_counter() < deadline:
+            # Retrieve the next hotkey, ignoring it if it got deleted meanwhile.
+            hotkey: str = self._pending_hotkeys.popleft()
+            if hotkey not in bindings:
+                continue
+
+            # Retrieve the CircleWindow's position and size.
+            position: QPoint = QPoint(bindings[hotkey]['x'], bindings[hotkey]['y'])
+            size: QSize = QSize(bindings[hotkey]['w'], bindings[hotkey]['h'])
+
+            # Instantiate a new CircleWindow, within an OverlayWindow if the overlay mode is enabled.
+            circle_window: CircleWindow = CircleWindow(
+                self,
+                hotkey,
+                position,
+                size,
+                parent=self._circle_window_parent(position - QPoint(size.width() // 2, size.height() // 2))
+            )
+
+            # Add it to the circle windows list.
+            self._circle_windows.append(circle_window)
+
+            #   Show it, unless it is a standalone CircleWindow while the CircleWindows
+            # are hidden. The OverlayWindows handle the visibility of their own ones.
+            if circle_window.parentWidget() is not None or self._circle_windows_visible:
+                circle_window.show()
+
+        # Update the progress bar.
+        self._loading_progress_bar.setValue(self._loading_progress_bar.maximum() - len(self._pending_hotkeys))
+
+        # Once every CircleWindow is created, stop the timer and hide the progress bar.
+        if not self._pending_hotkeys:
+            self._materialization_timer.stop()
+            self._loading_progress_bar.setVisible(False)
+
+        # Highlight the created CircleWindows matching the hotkeys search.
+        self.refresh_hotkeys_search()
 
     def _reset_status_bar_stylesheet(self, message: str) -> None:
         """
@@ -395,9 +772,10 @@ class IMainWindow(QMainWindow):
         :param str message: The new message that has been set to the StatusBar.
         """
 
-        # Reset the stylesheet if the message is being cleared.
+        #   Restyle the StatusBar if the message is being cleared, resetting
+        # the text color set by the logger without re-parsing any stylesheet.
         if not message:
-            self._set_status_bar_stylesheet()
+            stylesheet.repolish(self._status_bar)
 
     # ========================= #
     # Config read/write methods #
@@ -407,56 +785,124 @@ class IMainWindow(QMainWindow):
     # make it callable using QMetaObject.invokeMethod
     # to ensure this method is called in the main thread.
     @Slot()
-    def _load_config(self, no_load: bool = False) -> bool:
+    def _load_config(self, no_load: bool = False) -> None:
         """
         Restore the IMainWindow's attributes and widgets
         depending on the content of the json parsed config_file attribute.
-        Return the result of the loading.
+        The config file is parsed and validated by a ConfigLoaderThread, then
+        the config_loaded or config_loading_failed method is called back.
         If no_load is True, don't load but exist the current CONFIG dictionary.
 
         :param no_load: If True, don't load but exist the current CONFIG dictionary. By default, False.
         :type no_load: bool
-        :returns: The boolean result of the loading.$$
-        :rtype: bool
         """
 
-        # Reset the current config.
-        config.reset_config()
+        # Cancel any config loading in progress.
+        self._cancel_config_loading()
 
-        # Load the config_file attribute content.
-        # If the loading is a success, restore the
-        # CircleWindows and shortcuts.
-        if config.load_config() if not no_load else True:
-            # Reset the CircleWindows as well as the config.
-            self._reset_circle_windows()
-
-            # Restore the CircleWindow instances.
-            for hotkey in CONFIG["hotkeys"]:
-                # Instantiate a new CircleWindow.
-                circle_window: CircleWindow = CircleWindow(
-                    self,
-                    hotkey,
-                    QPoint(CONFIG["hotkeys"][hotkey]['x'], CONFIG["hotkeys"][hotkey]['y']),
-                    QSize(CONFIG["hotkeys"][hotkey]['w'], CONFIG["hotkeys"][hotkey]['h']),
-                )
-
-                # Add it to the circle windows list.
-                self._circle_windows.append(circle_window)
-
-                # Show it.
-                circle_window.show()
+        # If no_load is True, reset the current config and restore it directly.
+        if no_load:
+            config.reset_config()
+            self._config_loaded(None)
+            return
+
+        # Parse the config file from a ConfigLoaderThread.
+        self._config_loader = ConfigLoaderThread(CONFIG_FILE[0], self)
+        self._config_loader.loaded.connect(self._config_loaded)
+        self._config_loader.failed.connect(self._config_loading_failed)
+        self._config_loader.finished.connect(self._config_loader.deleteLater)
+        self._config_loader.start()
+
+    def _cancel_config_loading(self, wait: bool = False) -> None:
+        """
+        Ignore the result of the config loading in progress, if any.
+        If wait is True, wait for its ConfigLoaderThread to finish.
+
+        :param bool wait: If True, wait for the ConfigLoaderThread to finish. By default, False.
+        """
+
+        # If no config is being loaded, return here.
+        if self._config_loader is None:
+            return
+
+        # Disconnect the ConfigLoaderThread's result signals.
+        self._config_loader.loaded.disconnect(self._config_loaded)
+        self._config_loader.failed.disconnect(self._config_loading_failed)
+
+        # Wait for the ConfigLoaderThread to finish if required.
+        if wait:
+            self._config_loader.wait()
+        self._config_loader = None
+
+    def _config_loaded(self, loaded_config: Optional[Dict[str, Any]]) -> None:
+        """
+        Callback method when the config file has been parsed, applying it to the CONFIG
+        dictionary and restoring the CircleWindows. The hotkey routine, reading the
+        CONFIG dictionary, is live before any CircleWindow gets created.
+
+        :param loaded_config: The parsed config, or None to use the current CONFIG dictionary.
+        :type loaded_config: Dict[str, Any] or None
+        """
 
-            # Update the hotkey size slider.
-            self._hotkeys_radius_slider.setValue(CONFIG["radius"])
+        #   Ignore the result of a cancelled ConfigLoaderThread whose queued
+        # signal was already posted when it got disconnected, then forget it.
+        if self._is_stale_config_loader():
+            return
+        self._config_loader = None
+
+        # Apply the parsed config if any.
+        if loaded_config is not None:
+            config.apply_config(loaded_config)
+
+        # Update the hotkey size slider and the overlay mode menu button.
+        self._hotkeys_radius_slider.setValue(CONFIG["radius"])
+        self._menu_bar.update_overlay_mode_action(CONFIG["overlay_mode"])
+
+        # Update the builtin shortcuts.
+        self.update_builtin_shortcuts()
 
-            # Return here.
-            return True
+        # Restore the CircleWindow instances.
+        self._restore_circle_windows()
+
+        # List the recent profiles other than the config in use.
+        self._update_recent_profiles_menu()
+
+    def _config_loading_failed(self, error: str) -> None:
+        """
+        Callback method when the config file parsing failed, creating a new config file.
 
-        # The parsing is a failure: create a new
-        # config file and update the init error message.
+        :param str error: The description of the exception raised while parsing the config file.
+        """
+
+        #   Ignore the result of a cancelled ConfigLoaderThread whose queued
+        # signal was already posted when it got disconnected, then forget it.
+        if self._is_stale_config_loader():
+            return
+        self._config_loader = None
+
+        # Trace such an exception.
+        logger.error("Exception raised while loading the config file: " + error)
+        logger.error("Config file loading failed")
+
+        # Create a new config file from the default config.
+        config.reset_config()
+        self._restore_circle_windows()
         CONFIG_FILE[0] = utils.next_config_file_name_available(PATH / Path("configs"))
         config.save_config()
-        self._init_error_message = f"Config file corrupted, use a new \"{CONFIG_FILE[0].name}\" file"
+
+        # Trace.
+        logger.error(f"Config file corrupted, use a new \"{CONFIG_FILE[0].name}\" file")
+
+    def _is_stale_config_loader(self) -> bool:
+        """
+        Return True if the signal being handled got emitted by a ConfigLoaderThread other than
+        the current one, such a thread having been cancelled. A direct call is never stale.
+
+        :returns: True if the signal's sender is a cancelled ConfigLoaderThread.
+        :rtype: bool
+        """
+        sender: Optional[QObject] = self.sender()
+        return isinstance(sender, ConfigLoaderThread) and sender is not self._config_loader
 
     def _reset_config(self) -> None:
         """
@@ -474,21 +920,58 @@ class IMainWindow(QMainWindow):
         # Load the reset config.
         self._load_config(no_load=True)
 
+    def _remember_profile(self) -> Profile:
+        """
+        Cache the config in use as the most recently used profile, along with its compiled layers.
+
+        :returns: The cached profile.
+        :rtype: Profile
+        """
+
+        # Cache a copy of the config in use, compiling its layers.
+        profile: Profile = PROFILES.put(Profile(CONFIG_FILE[0], copy.deepcopy(CONFIG), config.CONFIG_FILE_STAMP))
+
+        # List the recent profiles other than the config in use.
+        self._update_recent_profiles_menu()
+        return profile
+
+    def _use_profile(self, profile: Profile) -> None:
+        """
+        Use the given cached profile's config, applied from memory without reading its config file.
+
+        :param Profile profile: The profile to use.
+        """
+
+        # Cancel any config loading in progress.
+        self._cancel_config_loading()
+
+        # Apply a copy of the profile's config, the cached one being kept unchanged.
+        CONFIG_FILE[0] = profile.file
+        self._config_loaded(copy.deepcopy(profile.config))
+
+        #   Restore the stamp the profile's config got parsed with, the config file possibly
+        # having changed since, so that saving the config never overwrites such changes unseen.
+        config.CONFIG_FILE_STAMP = profile.stamp
+
+    def _update_recent_profiles_menu(self) -> None:
+        """Fill the "File -> Recent profiles" menu with the cached profiles other than the config in use."""
+        self._menu_bar.update_recent_profiles([file for file in PROFILES.files if file != CONFIG_FILE[0]])
+
     # ===================== #
     # Pseudo Getter methods #
     # ===================== #
 
     @property
-    def hotkeys(self) -> List[str]:
+    def hotkeys(self) -> KeysView[str]:
         """
         Getter method for the hotkeys.
 
-        :returns: The hotkeys.
-        :rtype: List[str]
+        :returns: The hotkeys, as a live view of the CONFIG dictionary.
+        :rtype: KeysView[str]
         """
 
-        # Return the list of hotkeys from the CONFIG dictionary.
-        return list(CONFIG["hotkeys"].keys())
+        # Return the hotkeys view from the HotkeyRegistry.
+        return self._registry.keys
 
     # ============== #
     # Getter methods #
@@ -504,6 +987,36 @@ class IMainWindow(QMainWindow):
         """
         return self._circle_windows
 
+    @property
+    def spatial_grid(self) -> SpatialGrid:
+        """
+        Getter method for the spatial_grid attribute.
+
+        :returns: The spatial_grid attribute.
+        :rtype: SpatialGrid
+        """
+        return self._spatial_grid
+
+    @property
+    def registry(self) -> HotkeyRegistry:
+        """
+        Getter method for the registry attribute.
+
+        :returns: The registry attribute.
+        :rtype: HotkeyRegistry
+        """
+        return self._registry
+
+    @property
+    def is_loading_config(self) -> bool:
+        """
+        Pseudo getter method returning True while a config is being parsed or its CircleWindows created.
+
+        :returns: True while a config is being loaded.
+        :rtype: bool
+        """
+        return self._config_loader is not None or bool(self._pending_hotkeys)
+
     @property
     def last_hotkey(self) -> Optional[str]:
         """
@@ -17,7 +17,7 @@
 
 from PySide6.QtGui     import QAction
 from PySide6.QtWidgets import QMenu, QMenuBar, QWidget
-from src.config        import STYLE
+from pathlib           import Path
 import typing
 
 # =------------------------------------------------= #
@@ -57,12 +57,12 @@ class MainMenuBar(QMenuBar):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the MainMenuBar instance itself."""
 
+        # Set the object name selecting the MainMenuBar within the application-wide stylesheet.
+        self.setObjectName("main_menu_bar")
+
         # Initialize the "File" menu.
         file_menu: QMenu = self.addMenu("File")
 
@@ -76,11 +76,33 @@ class MainMenuBar(QMenuBar):
         self._open_action.setStatusTip("Open an existing config file")
         file_menu.addAction(self._open_action)
 
+        # Initialize and add the "Recent profiles" menu, disabled until a profile is recently used.
+        self._recent_profiles_menu: QMenu = file_menu.addMenu("Recent profiles")
+        self._recent_profiles_menu.setEnabled(False)
+        self._recent_profile_callback: typing.Optional[typing.Callable[[Path], typing.Any]] = None
+
         # Initialize and add the "Save as" action.
         self._save_as_action: QAction = QAction("Save As...", self)
         self._save_as_action.setStatusTip("Save the config file in use as...")
         file_menu.addAction(self._save_as_action)
 
+        # Initialize the "View" menu.
+        view_menu: QMenu = self.addMenu("View")
+
+        # Initialize and add the checkable "Overlay mode" action.
+        self._overlay_mode_action: QAction = QAction("Overlay mode", self)
+        self._overlay_mode_action.setCheckable(True)
+        self._overlay_mode_action.setStatusTip("Draw every hotkey on a single overlay per screen")
+        view_menu.addAction(self._overlay_mode_action)
+
+        # Initialize the "Tools" menu.
+        tools_menu: QMenu = self.addMenu("Tools")
+
+        # Initialize and add the "Calibrate click timing" action.
+        self._calibrate_action: QAction = QAction("Calibrate click timing", self)
+        self._calibrate_action.setStatusTip("Measure how long the cursor takes to arrive before clicking")
+        tools_menu.addAction(self._calibrate_action)
+
         # Initialize and add the "Settings" action.
         self._settings_menu_action: QAction = QAction("Settings", self)
         self._settings_menu_action.setStatusTip("Configure the software settings")
@@ -95,7 +117,10 @@ class MainMenuBar(QMenuBar):
             file_new_callback: typing.Callable[..., typing.Any],
             file_open_callback: typing.Callable[..., typing.Any],
             file_save_as_callback: typing.Callable[..., typing.Any],
-            settings_callback: typing.Callable[..., typing.Any]
+            overlay_mode_callback: typing.Callable[[bool], typing.Any],
+            settings_callback: typing.Callable[..., typing.Any],
+            recent_profile_callback: typing.Callable[[Path], typing.Any],
+            calibrate_callback: typing.Callable[..., typing.Any]
     ) -> None:
         """
         Set the given callback to the associated MenuBar buttons.
@@ -106,33 +131,60 @@ class MainMenuBar(QMenuBar):
         :type file_open_callback: typing.Callable[..., typing.Any]=
         :param file_save_as_callback: The optional "File -> Save As" button callback.
         :type file_save_as_callback: typing.Callable[..., typing.Any]
+        :param overlay_mode_callback: The optional "View -> Overlay mode" button callback.
+        :type overlay_mode_callback: typing.Callable[[bool], typing.Any]
         :param settings_callback: The optional "Settings" button \
 callback.
         :type settings_callback: typing.Callable[..., typing.Any]
+        :param recent_profile_callback: The "File -> Recent profiles" buttons callback, given the profile's config file.
+        :type recent_profile_callback: typing.Callable[[pathlib.Path], typing.Any]
+        :param calibrate_callback: The "Tools -> Calibrate click timing" button callback.
+        :type calibrate_callback: typing.Callable[..., typing.Any]
         """
 
         # Set the given callbacks.
         self._new_action.triggered.connect(file_new_callback)
         self._open_action.triggered.connect(file_open_callback)
         self._save_as_action.triggered.connect(file_save_as_callback)
+        self._overlay_mode_action.triggered.connect(overlay_mode_callback)
         self._settings_menu_action.triggered.connect(settings_callback)
+        self._recent_profile_callback = recent_profile_callback
+        self._calibrate_action.triggered.connect(calibrate_callback)
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
+    def update_overlay_mode_action(self, checked: bool) -> None:
+        """
+        Update the "View -> Overlay mode" button being checked or not without triggering its callback.
 
-    def _set_main_menu_bar_stylesheet(self) -> None:
-        """Set the MainMenuBar StyleSheet."""
+        :param bool checked: If True, check the "View -> Overlay mode" button.
+        """
+
+        # Update the checked state.
+        self._overlay_mode_action.setChecked(checked)
 
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["Custom"]["middleground-color"]};
-        """)
+    def set_calibrating(self, calibrating: bool) -> None:
+        """
+        Disable the "Tools -> Calibrate click timing" button while a calibration is running.
+
+        :param bool calibrating: If True, a calibration is running.
+        """
+        self._calibrate_action.setEnabled(not calibrating)
+
+    def update_recent_profiles(self, files: typing.List[Path]) -> None:
+        """
+        Fill the "File -> Recent profiles" menu with a button per given config file.
+
+        :param files: The config files of the recent profiles, from the most to the least recently used.
+        :type files: List[pathlib.Path]
+        """
 
-    def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
+        # Replace the buttons, each one calling the callback with its config file.
+        self._recent_profiles_menu.clear()
+        for file in files:
+            action: QAction = self._recent_profiles_menu.addAction(file.name)
+            action.setStatusTip(f"Switch to the profile \"{file}\"")
+            action.triggered.connect(lambda _=False, file=file: self._recent_profile_callback(file))
 
-        # Set the MainMenuBar StyleSheets.
-        self._set_main_menu_bar_stylesheet()
+        # Disable the menu if it is empty.
+        self._recent_profiles_menu.setEnabled(bool(files))
 
 # =-----------------------------------------------------------------------------------------= #
@@ -17,21 +17,26 @@
 # =--------------= #
 
 from typing             import Any, Callable, Dict
-from .IMainWindow       import IMainWindow
+from .IMainWindow       import CalibrationThread, IMainWindow
 from src.SettingsDialog import SettingsDialog
 from src.CircleWindow   import CircleWindow
 from src.config         import CONFIG
 from PySide6.QtCore     import Qt, QMetaObject, QPoint, QSize
-from PySide6.QtGui      import QCloseEvent, QCursor, QKeySequence, QShortcut
+from PySide6.QtGui      import QCloseEvent, QCursor, QGuiApplication, QKeySequence, QShortcut
 from PySide6.QtWidgets  import QFileDialog, QSystemTrayIcon
-from pynput.mouse       import Button, Controller
 from pathlib            import Path
 from src.config         import CONFIG_FILE
 from src.utils          import PATH
+from src.scheduler      import SCHEDULER
+from src.layers         import LAYERS
+from src.profiles       import PROFILES, Profile
 import typing
+import src.actions          as actions
 import src.logger           as logger
 import keyboard
 import src.config           as config
+import src.calibration      as calibration
+import src.stylesheet       as stylesheet
 import src.utils            as utils
 
 # =----------------------------------------------------------------------= #
@@ -46,9 +51,6 @@ import src.utils            as utils
 # Global variable #
 # =-------------= #
 
-# Declare the Mouse Controller.
-MOUSE: Controller = Controller()
-
 # Declare a hotkey routine flag.
 HOTKEY_ROUTINE_IS_RUNNING: bool = False
 
@@ -76,17 +78,30 @@ class MainWindow(IMainWindow):
         # Call the super class's initializer method.
         super().__init__()
 
+        #   Initialize the config file of the profile cycled to being reloaded, its compiled
+        # layers being outdated, so the hotkey routine uses the reloaded ones once parsed.
+        self._reloaded_profile_file: typing.Optional[Path] = None
+
         # Connect the different widgets to the corresponding callback methods.
         self._menu_bar.set_menu_callbacks(
             self._file_new_callback,
             self._file_open_callback,
             self._file_save_as_callback,
-            self._settings_callback
+            self._overlay_mode_callback,
+            self._settings_callback,
+            self._open_profile,
+            self._calibrate_callback
         )
         self._hotkeys_radius_slider.valueChanged.connect(self._slider_value_change)
         self._new_hotkey_button.clicked.connect(self._new_hotkey)
+        self._layers_combo_box.currentIndexChanged.connect(
+            lambda index: self._edit_layer(self._layers_combo_box.itemData(index))
+        )
+        self._new_layer_button.clicked.connect(self._new_layer)
+        self._hotkeys_search_edit.textChanged.connect(self._search_hotkeys)
         self._start_button.clicked.connect(self._start)
         self._tray_icon.activated.connect(self._tray_icon_activated)
+        self.profile_cycled.connect(self._profile_cycled)
 
         # Initialize and associate the logger to this window.
         logger.init_logger(self._status_bar)
@@ -97,6 +112,9 @@ class MainWindow(IMainWindow):
         # Load the theme file.
         config.load_style()
 
+        # Load the click timings calibrated for each mouse backend and screen setup.
+        calibration.load_calibrations()
+
         # Initialize the UI style.
         self.set_stylesheets()
 
@@ -106,12 +124,9 @@ class MainWindow(IMainWindow):
         # Initialize the main hotkey routine.
         self._hook: typing.Callable[[], None] = keyboard.on_press(self._hotkey_routine)
 
-        # Display a successful message on the StatusBar if the init_error_message
-        # attribute is None, otherwise display such an error message.
-        if self._init_error_message is None:
-            logger.info("HotClick successfully launched!")
-        else:
-            logger.error(self._init_error_message)
+        #   Display a successful message on the StatusBar. Any config
+        # loading error will be displayed once the config got parsed.
+        logger.info("HotClick successfully launched!")
 
     # ================== #
     # Overridden methods #
@@ -125,12 +140,38 @@ class MainWindow(IMainWindow):
         :param PySide6.QtGui.QCloseEvent event: The QCloseEvent received.
         """
 
-        # Unhook the hotkey_routine keyboard callback method.
+        # Unhook the hotkey_routine keyboard callback method and cancel the running sequences.
         utils.unhook(self._hotkey_routine)
+        SCHEDULER.cancel_all()
+
+        # Wait for any running calibration to finish.
+        if self._calibration_thread is not None:
+            self._calibration_thread.wait()
 
         # Call the super class's closeEvent method.
         super().closeEvent(event)
 
+    def _config_loaded(self, loaded_config: typing.Optional[typing.Dict[str, Any]]) -> None:
+        """
+        Overridden _config_loaded method.
+        Also compile the loaded config into the hotkey routine's layers if it is the profile cycled to
+        being reloaded, its config file having been edited since it got cached.
+
+        :param loaded_config: The parsed config, or None to use the current CONFIG dictionary.
+        :type loaded_config: Dict[str, Any] or None
+        """
+
+        # Call the super class's _config_loaded method.
+        super()._config_loaded(loaded_config)
+
+        #   Use the reloaded profile's layers if the routine still runs, unless the config
+        # got ignored, as a cancelled loading's one, or is another config file's one.
+        if self._config_loader is None and self._reloaded_profile_file == CONFIG_FILE[0]:
+            self._reloaded_profile_file = None
+            if HOTKEY_ROUTINE_IS_RUNNING:
+                LAYERS.use(self._remember_profile().layers)
+                logger.info(f"Profile \"{CONFIG_FILE[0].name}\" reloaded")
+
     # ============== #
     # Public methods #
     # ============== #
@@ -160,6 +201,11 @@ class MainWindow(IMainWindow):
                 )
                 self._builtin_shortcuts[action].activated.connect(tmp[action])
 
+        # Index the shortcuts for the hotkeys conflicts of every layer to be checked against.
+        self._registry.update_shortcuts()
+        for _, registry, _ in self._layer_views.values():
+            registry.update_shortcuts()
+
     # =============== #
     # Private methods #
     # =============== #
@@ -167,12 +213,18 @@ class MainWindow(IMainWindow):
     def _new_hotkey(self) -> None:
         """Create a new instance of CircleWindow."""
 
-        # Instantiate a new CircleWindow.
+        # Retrieve the new CircleWindow's position.
+        position: typing.Optional[QPoint] = QPoint(CONFIG["last_position"][0], CONFIG["last_position"][1]) if \
+            CONFIG["last_position"] is not None else None
+
+        # Instantiate a new CircleWindow, within an OverlayWindow if the overlay mode is enabled.
         circle_window: CircleWindow = CircleWindow(
             self,
-            position=QPoint(CONFIG["last_position"][0], CONFIG["last_position"][1]) if
-            CONFIG["last_position"] is not None else None,
-            size=QSize(CONFIG["radius"], CONFIG["radius"])
+            position=position,
+            size=QSize(CONFIG["radius"], CONFIG["radius"]),
+            parent=self._circle_window_parent(
+                position - QPoint(CONFIG["radius"] // 2, CONFIG["radius"] // 2) if position is not None else None
+            )
         )
 
         # Show it.
@@ -181,16 +233,35 @@ class MainWindow(IMainWindow):
         # Add it to the circle windows list.
         self._circle_windows.append(circle_window)
 
-        # Add it to the config dictionary.
+        # Add its binding to the config dictionary.
         circle_window_position: QPoint = circle_window.position
         circle_window_size: QSize = circle_window.size
-        CONFIG["hotkeys"][circle_window.hotkey.lower()] = {
-            "type": "Click",
-            'x': circle_window_position.x(),
-            'y': circle_window_position.y(),
-            'w': circle_window_size.width(),
-            'h': circle_window_size.height(),
-        }
+        self._registry.update_binding(
+            circle_window.hotkey,
+            x=circle_window_position.x(),
+            y=circle_window_position.y(),
+            w=circle_window_size.width(),
+            h=circle_window_size.height()
+        )
+
+        # Highlight it if it matches the hotkeys search.
+        self.refresh_hotkeys_search()
+
+    def _new_layer(self) -> None:
+        """Create a new empty layer, named after the first "Layer X" name available, and edit it."""
+
+        # Retrieve the first layer name available.
+        number: int = 1
+        while f"Layer {number}" in CONFIG["layers"]:
+            number += 1
+        layer: str = f"Layer {number}"
+
+        # Add the layer to the config dictionary and save it.
+        CONFIG["layers"][layer] = {}
+        config.save_config()
+
+        # Edit the new layer.
+        self._edit_layer(layer)
 
     def _slider_value_change(self) -> None:
         """Callback function when the hotkey size slider is updated."""
@@ -207,23 +278,31 @@ class MainWindow(IMainWindow):
         logger.info(f"""Hotkeys default radius: {CONFIG["radius"]}""")
 
     def _start(self) -> None:
-        """Close every instance of CircleWindow and start the hotkey program."""
+        """Hide every instance of CircleWindow and start the hotkey program."""
 
         # Make the HOTKEY_ROUTINE_IS_RUNNING global variable writable.
         global HOTKEY_ROUTINE_IS_RUNNING
 
-        # Ensure no CircleWindow has no associated hotkey
-        # before to start the main hotkeys routine.
-        if "" in self.hotkeys:
+        # Ensure no CircleWindow of any layer has no associated
+        # hotkey before to start the main hotkeys routine.
+        if "" in CONFIG["hotkeys"] or any("" in hotkeys for hotkeys in CONFIG["layers"].values()):
             logger.warning("Some hotkeys are not assigned!")
             return
 
-        # Reset the CircleWindows.
-        self._reset_circle_windows()
+        # Hide the CircleWindows, keeping them for the restoration.
+        self._hide_circle_windows()
 
         # Save the config.
         config.save_config()
 
+        #   Compile the hotkeys of every layer and the custom shortcuts into the tries matching their chords
+        # sequences, starting from the base layer, the config being cached as the most recent profile.
+        LAYERS.use(self._remember_profile().layers)
+
+        # Use the click delay calibrated for the mouse backend and screen setup, if any.
+        if calibration.apply_calibration(actions.BACKEND, self._setup_key()) is None:
+            logger.info("Click timing not calibrated for this setup, see \"Tools -> Calibrate click timing\"")
+
         # Set the MainWindow instance visible on the tray.
         self._tray_icon.setVisible(True)
 
@@ -236,6 +315,50 @@ class MainWindow(IMainWindow):
         # Trace.
         logger.info("Program started")
 
+    def _setup_key(self) -> str:
+        """
+        Return the key of the mouse backend and screen setup in use, the click timing being calibrated for both.
+
+        :returns: The setup key.
+        :rtype: str
+        """
+        return calibration.setup_key(actions.BACKEND, [
+            (geometry.x(), geometry.y(), geometry.width(), geometry.height(), screen.devicePixelRatio())
+            for screen in QGuiApplication.screens() for geometry in (screen.geometry(),)
+        ])
+
+    def _calibrated(self, result: typing.Dict[str, float]) -> None:
+        """
+        Callback method when the click timing has been calibrated, tracing the measured times.
+
+        :param result: The calibration, made of the click delay and the distribution of the measured times.
+        :type result: Dict[str, float]
+        """
+
+        # Forget the CalibrationThread.
+        self._calibration_thread = None
+        self._menu_bar.set_calibrating(False)
+
+        # Trace.
+        logger.info(
+            f"Click delay calibrated to {result['delay'] * 1000:.2f} ms (arrival times: "
+            f"median {result['median'] * 1000:.2f} ms, max {result['max'] * 1000:.2f} ms, {result['lost']} lost)"
+        )
+
+    def _calibration_failed(self, error: str) -> None:
+        """
+        Callback method when the click timing calibration failed.
+
+        :param str error: The description of the exception raised while calibrating.
+        """
+
+        # Forget the CalibrationThread.
+        self._calibration_thread = None
+        self._menu_bar.set_calibrating(False)
+
+        # Trace.
+        logger.error("Click timing calibration failed: " + error)
+
     def _tray_icon_activated(self, reason: QSystemTrayIcon.ActivationReason.Trigger) -> None:
         """
         Callback method when the tray icon get activated through any mouse click.
@@ -256,11 +379,16 @@ class MainWindow(IMainWindow):
             # $self._tray_icon.hide()
             QMetaObject.invokeMethod(self._tray_icon, typing.cast(bytes, "hide"), Qt.ConnectionType.QueuedConnection)
 
-            # Set HOTKEY_ROUTINE_IS_RUNNING to False.$
+            # Set HOTKEY_ROUTINE_IS_RUNNING to False and cancel the running sequences.$
             HOTKEY_ROUTINE_IS_RUNNING = False
+            SCHEDULER.cancel_all()
 
-            # Restore the CircleWindow by reloading the config file.
-            QMetaObject.invokeMethod(self, typing.cast(bytes, "_load_config"), Qt.ConnectionType.QueuedConnection)
+            # Show the CircleWindow again, reloading the config file only if it changed.
+            QMetaObject.invokeMethod(
+                self,
+                typing.cast(bytes, "_show_circle_windows"),
+                Qt.ConnectionType.QueuedConnection
+            )
 
             # Display a successful message on the StatusBar.
             logger.info("HotClick successfully restored!")
@@ -289,8 +417,10 @@ class MainWindow(IMainWindow):
         if event_hotkey.endswith('+'):
             return
 
-        # Update the last hotkey attribute.
+        #   Update the last hotkey attribute and notify the widgets capturing
+        # a shortcut, the signal being queued to the Qt main loop.
         self._last_hotkey = event_hotkey
+        self.hotkey_pressed.emit(event_hotkey)
 
         # If the event hotkey is the "Restore Application" shortcut,
         # even if the HOTKEY_ROUTINE_IS_RUNNING global variable is
@@ -322,42 +452,95 @@ class MainWindow(IMainWindow):
             self._tray_icon_activated(QSystemTrayIcon.ActivationReason.Trigger)
             return
 
-        # If the event_hotkey match a previously defined CircleWindow's position, click it.
-        if event_hotkey in CONFIG["hotkeys"]:
-            # Get the current mouse position before clicking.
-            original_position = MOUSE.position
+        # If the event hotkey is the "Cycle Profiles" shortcut,
+        # switch to the next recent profile and return here.
+        if event_hotkey.upper() == CONFIG["shortcuts"]["builtin"].get("Cycle Profiles"):
+            self._cycle_profile()
+            return
+
+        #   If the event hotkey completes the sequence of a hotkey of the active layer or a custom
+        # shortcut, execute its action, compiled when the hotkeys routine started.
+        action: typing.Optional[actions.Action] = LAYERS.active.feed(event_hotkey)
+        if action is not None:
+            actions.BACKEND.trigger = original_event_hotkey
+            action.execute(actions.BACKEND)
 
-            # Initialize a flag for pressing the
-            # left mouse button only is the key
-            # is pressed during this callback iteration.
-            flag: bool = False
+            # Trace.
+            logger.info(f"Hotkey {event_hotkey} pressed")
 
-            while keyboard.is_pressed(original_event_hotkey):
-                # Update the flag variable.
-                flag = True
+    def _cycle_profile(self) -> None:
+        """
+        Switch the hotkey routine to the least recently used profile, cycling through the recent profiles.
+        Only the compiled layers get swapped, without any disk I/O, the profile's config being applied to
+        the MainWindow from the Qt main loop afterwards.
+        """
 
-                # Move the mouse to the location to click on.
-                MOUSE.position = (
-                    CONFIG["hotkeys"][event_hotkey]['x']-int(CONFIG["hotkeys"][event_hotkey]['w']/2),
-                    CONFIG["hotkeys"][event_hotkey]['y']-int(CONFIG["hotkeys"][event_hotkey]['h']/2)
-                )
+        #   Retrieve the least recently used profile, marked as the most recent one
+        # at once, ensuring it isn't the profile in use.
+        profile: typing.Optional[Profile] = PROFILES.cycle()
+        if profile is None:
+            logger.warning("No other recent profile to cycle to")
+            return
 
-            # Simulate a Left Click if flag is True.
-            if flag:
-                MOUSE.click(Button.left)
+        # Cancel the running sequences, then use the profile's compiled layers.
+        SCHEDULER.cancel_all()
+        LAYERS.use(profile.layers)
 
-                # Move the mouse back to its original position.
-                MOUSE.position = original_position
+        # Apply its config from the Qt main loop, the signal being queued.
+        self.profile_cycled.emit(str(profile.file))
 
-                # Trace.
-                logger.info(f"Hotkey {event_hotkey} pressed")
-        # Otherwise, if the event_hotkey match a custom shortcut, execute it.
-        elif event_hotkey in CONFIG["shortcuts"]["custom"]:
-            bind_to: str = CONFIG["shortcuts"]["custom"][event_hotkey]
-            if bind_to == "LeftButton":
-                MOUSE.click(Button.left)
-            elif bind_to == "RightButton":
-                MOUSE.click(Button.right)
+        # Trace.
+        logger.info(f"Profile \"{profile.file.name}\" in use")
+
+    def _profile_cycled(self, file: str) -> None:
+        """
+        Callback method when the hotkey routine cycled to the profile of the given config file,
+        applying its cached config to restore its CircleWindows once the MainWindow gets restored.
+        If its config file changed since it got cached, reload it instead, the hotkey routine then
+        using the reloaded config's layers.
+
+        :param str file: The config file of the profile cycled to.
+        """
+
+        # Apply the cached profile's config, if still cached and if its config file didn't change.
+        profile: typing.Optional[Profile] = PROFILES.get(Path(file))
+        if profile is None:
+            return
+        if profile.stamp == config.config_file_stamp(profile.file):
+            self._use_profile(profile)
+            return
+
+        # Otherwise, forget it and reload its config file, then trace.
+        PROFILES.discard(profile.file)
+        CONFIG_FILE[0] = profile.file
+        self._reloaded_profile_file = profile.file
+        self._load_config()
+        logger.info(f"Profile \"{profile.file.name}\" changed on disk, reloading it...")
+
+    def _open_profile(self, file: Path) -> None:
+        """
+        Save the config in use and cache it as a recent profile, then use the given config file.
+        If it is cached and didn't change since it got parsed, use it from memory, otherwise load it.
+
+        :param pathlib.Path file: The config file to use.
+        """
+
+        # Save the config and cache it as the most recent profile.
+        config.save_config()
+        self._remember_profile()
+
+        # Use the cached profile if its config file didn't change, and trace.
+        profile: typing.Optional[Profile] = PROFILES.get(file)
+        if profile is not None and profile.stamp == config.config_file_stamp(file):
+            self._use_profile(profile)
+            logger.info(f"Profile \"{file.name}\" restored from memory")
+            return
+
+        # Otherwise, forget it and load the config file, then trace.
+        PROFILES.discard(file)
+        CONFIG_FILE[0] = file
+        self._load_config()
+        logger.info(f"Loading the config file \"{CONFIG_FILE[0].name}\"...")
 
     # ======================== #
     # MenuBar callback methods #
@@ -366,8 +549,9 @@ class MainWindow(IMainWindow):
     def _file_new_callback(self) -> None:
         """Callback function when the "File -> New" button get clicked."""
 
-        # Save the config.
+        # Save the config and cache it as the most recent profile.
         config.save_config()
+        self._remember_profile()
 
         # Close and remove every element from the circle windows list.
         self._reset_circle_windows()
@@ -399,12 +583,8 @@ class MainWindow(IMainWindow):
             logger.warning("No config file has been selected")
             return
 
-        # Open and use the selected config file.
-        CONFIG_FILE[0] = Path(file_path)
-        self._load_config()
-
-        # Trace.
-        logger.info(f"Config file \"{CONFIG_FILE[0].name}\" loaded!")
+        # Use the selected config file, from memory if it is a recent profile.
+        self._open_profile(Path(file_path))
 
     def _file_save_as_callback(self) -> None:
         """Callback function when the "File -> Save As" button get clicked."""
@@ -431,11 +611,51 @@ class MainWindow(IMainWindow):
         # Trace.
         logger.info(f"Config file \"{old_config_file.name}\" saved as \"{CONFIG_FILE[0].name}\"!")
 
+    def _overlay_mode_callback(self, checked: bool) -> None:
+        """
+        Callback function when the "View -> Overlay mode" button get clicked.
+
+        :param bool checked: If True, the overlay mode get enabled.
+        """
+
+        # Update and save the config.
+        CONFIG["overlay_mode"] = checked
+        config.save_config()
+
+        # Recreate the CircleWindows within or without the OverlayWindows.
+        self._restore_circle_windows()
+
+        # Trace.
+        logger.info(f"""Overlay mode {"enabled" if checked else "disabled"}""")
+
+    def _calibrate_callback(self) -> None:
+        """Callback function when the "Tools -> Calibrate click timing" button get clicked."""
+
+        # If a calibration is already running, return here.
+        if self._calibration_thread is not None:
+            return
+
+        #   Calibrate the click timing of the mouse backend and screen setup in use
+        # from a CalibrationThread, the mouse being moved meanwhile.
+        self._calibration_thread = CalibrationThread(actions.BACKEND, self._setup_key(), self)
+        self._calibration_thread.calibrated.connect(self._calibrated)
+        self._calibration_thread.failed.connect(self._calibration_failed)
+        self._calibration_thread.finished.connect(self._calibration_thread.deleteLater)
+        self._menu_bar.set_calibrating(True)
+        self._calibration_thread.start()
+
+        # Trace.
+        logger.info("Calibrating the click timing, don't move the mouse...")
+
     def _settings_callback(self) -> None:
         """Callback function when the "Settings" button get clicked."""
 
-        # Execute the SettingsDialog menu.
-        self._settings_dialog = SettingsDialog(self)
+        #   Execute the SettingsDialog menu, created once then kept
+        # alive and refreshed from the CONFIG dictionary on reopen.
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self)
+        else:
+            self._settings_dialog.refresh()
         self._settings_dialog.open()
 
     # =================== #
@@ -443,25 +663,40 @@ class MainWindow(IMainWindow):
     # =================== #
 
     def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
+        """Apply the application-wide stylesheet and update every widget painted from the theme."""
 
-        # Set the MainWindow StyleSheets.
-        self._set_main_window_stylesheet()
-        self._set_hotkeys_menu_stylesheet()
-        self._set_new_hotkey_button_stylesheet()
-        self._set_hotkeys_radius_label_stylesheet()
-        self._set_hotkeys_radius_slider_stylesheet()
-        self._set_start_button_stylesheet()
-        self._set_status_bar_stylesheet()
+        #   Apply the application-wide stylesheet, compiled
+        # once per theme and only applied if the theme changed.
+        stylesheet.apply_stylesheet()
 
         # Set the SettingsDialog Stylesheets.
         if self._settings_dialog is not None:
             self._settings_dialog.set_stylesheets()
 
-        # Set the CircleWindow Stylesheets calling
-        # its repaint method to invoke the overridden
-        # paintEvent method from the CircleWindow.
+        #   Schedule the CircleWindows painting, their update
+        # calls being batched by Qt into the next paint events.
         for circle_window in self._circle_windows:
-            circle_window.repaint()
+            circle_window.update()
+
+    def theme_changed(self, keys: typing.Tuple[str, ...]) -> None:
+        """
+        Restyle only the widgets depending on the STYLE value accessed by the given keys,
+        from the theme dependency map, instead of every widget of the application.
+
+        :param keys: The keys to access the changed STYLE value.
+        :type keys: Tuple[str, ...]
+        """
+
+        # Restyle the affected widgets of the MainWindow, including the SettingsDialog.
+        stylesheet.restyle(self, keys)
+
+        # Set the SettingsDialog Stylesheets not handled by the application-wide stylesheet.
+        if self._settings_dialog is not None:
+            self._settings_dialog.set_stylesheets()
+
+        # Schedule the CircleWindows painting only if they are painted from the changed value.
+        if tuple(keys) in CircleWindow.THEME_KEYS:
+            for circle_window in self._circle_windows:
+                circle_window.update()
 
 # =---------------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    OverlayWindow class used by the HotClick software.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing            import List
+from PySide6.QtCore    import Qt, QChildEvent, QEvent, QLine, QObject, QRect, QTimer
+from PySide6.QtGui     import QColor, QPainter, QPaintEvent, QPen, QRegion, QScreen
+from PySide6.QtWidgets import QWidget
+from src.config        import STYLE
+
+# =---------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-----------------= #
+# OverlayWindow class #
+# =-----------------= #
+
+class OverlayWindow(QWidget):
+    """
+    Overlay Window class that represent a transparent frameless
+    window covering a whole screen. The CircleWindows it contains
+    are non-native child widgets, drawn and hit-tested through
+    this single window whatever the number of hotkeys.
+    The window is masked to its children so that any click
+    outside of them reaches the windows below.
+    It also draws the alignment guides of the dragged CircleWindows,
+    whether they are its children or standalone windows.
+    """
+
+    # =================== #
+    # Initializer methods #
+    # =================== #
+
+    def __init__(self, screen: QScreen) -> None:
+        """
+        Initializer method.
+
+        :param screen: The screen covered by the OverlayWindow to instantiate.
+        :type screen: PySide6.QtGui.QScreen
+        """
+
+        # Call the super class's initializer method.
+        super().__init__()
+
+        # Initialize the straight-forward attributes.
+        self._screen: QScreen = screen
+        self._active: bool = False
+        self._mask_update_pending: bool = False
+        self._guides: List[QLine] = []
+
+        # Initialize the UI.
+        self._init_ui()
+
+    def _init_ui(self) -> None:
+        """Initialize the UI of the OverlayWindow instance itself."""
+
+        # Set the Window Flags, the Tool flag keeping it out of the taskbar.
+        self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
+
+        # Set the Translucent Background attribute.
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+        # Cover the whole screen and follow its geometry changes.
+        self.setGeometry(self._screen.geometry())
+        self._screen.geometryChanged.connect(self.setGeometry)
+
+    # ================== #
+    # Overridden methods #
+    # ================== #
+
+    def childEvent(self, event: QChildEvent) -> None:
+        """
+        Overridden childEvent method.
+        This method is called when a child get added to or removed from the OverlayWindow.
+
+        :param PySide6.QtCore.QChildEvent event: The QChildEvent received.
+        """
+
+        # Call the super class childEvent method.
+        super().childEvent(event)
+
+        # Watch the geometry and visibility of every new child.
+        if event.added() and event.child().isWidgetType():
+            event.child().installEventFilter(self)
+
+        # Update the mask once the control returns to the event loop.
+        if event.added() or event.removed():
+            self._schedule_mask_update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Overridden paintEvent method.
+        This method is called when the OverlayWindow need to update its painting.
+
+        :param PySide6.QtGui.QPaintEvent event: The QPaintEvent received.
+        """
+
+        # If there are no alignment guides, there is nothing to paint.
+        if not self._guides:
+            return
+
+        # Draw the alignment guides as dashed lines.
+        qp: QPainter = QPainter(self)
+        qp.setPen(QPen(QColor(STYLE["Custom"]["middleground-color"]), 1, Qt.DashLine))
+        qp.drawLines(self._guides)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """
+        Overridden eventFilter method.
+        This method is called for every event received by a child of the OverlayWindow.
+
+        :param PySide6.QtCore.QObject watched: The child receiving the event.
+        :param PySide6.QtCore.QEvent event: The QEvent received.
+        """
+
+        # Update the mask when a child get moved, resized, shown or hidden.
+        if event.type() in (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide):
+            self._schedule_mask_update()
+
+        # Handle the event normally.
+        return super().eventFilter(watched, event)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def set_active(self, active: bool) -> None:
+        """
+        Set whether the OverlayWindow should be displayed.
+        An active OverlayWindow is only shown while it contains any visible child.
+
+        :param bool active: If True, display the OverlayWindow.
+        """
+
+        # Update the active attribute and the mask.
+        self._active = active
+        self._schedule_mask_update()
+
+    def set_guides(self, guides: List[QLine]) -> None:
+        """
+        Set the alignment guides to draw, in global coordinates.
+
+        :param guides: The alignment guides, an empty list to remove them.
+        :type guides: List[PySide6.QtCore.QLine]
+        """
+
+        # If both the previous and new guides are empty, return here.
+        if not guides and not self._guides:
+            return
+
+        # Update the guides attribute, the mask and the painting.
+        self._guides = [guide.translated(-self.geometry().topLeft()) for guide in guides]
+        self._schedule_mask_update()
+        self.update()
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _schedule_mask_update(self) -> None:
+        """Schedule a single mask update for all the changes of the current event loop iteration."""
+
+        # If an update is already pending, return here.
+        if self._mask_update_pending:
+            return
+
+        # Update the mask once the control returns to the event loop.
+        self._mask_update_pending = True
+        QTimer.singleShot(0, self._update_mask)
+
+    def _update_mask(self) -> None:
+        """Mask the OverlayWindow to its visible children and update its visibility."""
+
+        # Reset the pending flag.
+        self._mask_update_pending = False
+
+        # Compute the region covered by the visible children, if active.
+        region: QRegion = QRegion()
+        if self._active:
+            for child in self.children():
+                if child.isWidgetType() and not child.isHidden():
+                    region = region.united(child.geometry())
+
+        # Add the region covered by the alignment guides.
+        for guide in self._guides:
+            region = region.united(QRect(guide.p1(), guide.p2()).normalized().adjusted(-1, -1, 1, 1))
+
+        #   Hide the OverlayWindow if it is empty, an empty
+        # mask would otherwise cover the whole screen.
+        if region.isEmpty():
+            self.hide()
+            return
+
+        # Set the mask and show the OverlayWindow.
+        self.setMask(region)
+        self.show()
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def screen_(self) -> QScreen:
+        """
+        Getter method for the screen attribute.
+
+        :returns: The screen attribute.
+        :rtype: PySide6.QtGui.QScreen
+        """
+        return self._screen
+
+# =--------------------------------------------------------------------------------------= #
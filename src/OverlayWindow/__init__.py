@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    __init__.py file of the OverlayWindow directory.
+    Allow importing the OverlayWindow class directly
+    from the OverlayWindow directory.
+"""
+
+# Allow importing the OverlayWindow class directly
+# from the OverlayWindow directory.
+from .OverlayWindow import OverlayWindow
@@ -113,9 +113,26 @@ class ISettingsContentWidget(QWidget):
         # Clear the SettingsDialog's layout.
         utils.clear_layout(self.layout())
 
-    # ============= #
-    # Public method #
-    # ============= #
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def refresh(self) -> None:
+        """
+        Refresh the widgets from the CONFIG and STYLE dictionaries,
+        which may have changed since the ISettingsContentWidget has
+        been created, as when its SettingsDialog get reopened.
+        """
+
+        # Reset the settings_changed, old_config and old_style attributes.
+        self._settings_changed = False
+        self._old_config = copy.deepcopy(CONFIG)
+        self._old_style = copy.deepcopy(STYLE)
+
+        # Reset the widgets content and update the save button being disabled or not.
+        self._reset_widgets()
+        if self._save_button is not None:
+            self._save_button.setEnabled(self._is_valid())
 
     def ask_for_saving(self) -> bool:
         """
@@ -200,8 +217,8 @@ class ISettingsContentWidget(QWidget):
         This method can be overridden to update the CONFIG/STYLE dictionaries
         when the widget changes, by calling this method directly when it happens.
 
-        :param widgets_content: The changed row of widgets from the config_list.
-        :type widgets_content: Tuple[QLabel or QPushButtonShortcut, QPushButtonShortcut]
+        :param widgets_content: The values of the changed row from the shortcut table.
+        :type widgets_content: str
         """
 
         # Update the save button being disabled or not.
@@ -222,6 +239,7 @@ class ISettingsContentWidget(QWidget):
             text="Save",
             parent=self
         )
+        self._save_button.setObjectName("save_button")
         self._save_button.clicked.connect(self._save)
         self._save_button.setEnabled(self._is_valid())
 
@@ -261,54 +279,12 @@ class ISettingsContentWidget(QWidget):
     # Stylesheets method #
     # ================== #
 
-    def _set_settings_header_widget_stylesheet(self) -> None:
-        """Set the settings header widget Stylesheet."""
-
-        # Set the Stylesheet.
-        self._settings_header_widget.set_stylesheets()
-
-    def _set_save_button_stylesheet(self) -> None:
-        """Set the save button Stylesheet."""
-
-        # Set the Stylesheet.
-        self._save_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                                  stop: 0 #4a4a4a, stop: 0.5 #3a3a3a, stop: 1 #4a4a4a);
-                border-radius: 10px;
-                border: 2px solid #3a3a3a;
-                color: white;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-            }}
-            
-            QPushButton:hover {{
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                                  stop: 0 #5a5a5a, stop: 0.5 #4a4a4a, stop: 1 #5a5a5a);
-                border: 2px solid #4a4a4a;
-            }}
-            
-            QPushButton:pressed {{
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                                  stop: 0 #3a3a3a, stop: 0.5 #2a2a2a, stop: 1 #3a3a3a);
-                border: 2px solid #2a2a2a;
-            }}
-            
-            QPushButton:disabled {{
-                background-color: #808080;
-                border: 2px solid #606060;
-                color: #a0a0a0;
-            }}
-        """)
-
     def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the StyleSheets.
-        self._set_settings_header_widget_stylesheet()
-        self._set_save_button_stylesheet()
+        """
+        Set the stylesheets not handled by the application-wide stylesheet.
+        This method should be overridden in child classes.
+        """
+        pass
 
     # ============= #
     # Getter method #
@@ -16,11 +16,11 @@
 # =--------------= #
 
 from ...ISettingsContentWidget import ISettingsContentWidget
-from src.UtilityWidgets        import QConfigList, QPushButtonShortcut
+from src.UtilityWidgets        import ShortcutTable
 from PySide6.QtCore            import Qt
 from PySide6.QtGui             import QCloseEvent, QKeyEvent
-from PySide6.QtWidgets         import QDialog, QVBoxLayout, QWidget
-from src.config                import CONFIG, STYLE
+from PySide6.QtWidgets         import QDialog, QLineEdit, QVBoxLayout, QWidget
+from src.config                import CONFIG
 import src.utils                   as utils
 
 # =----------------------------------------------------------------= #
@@ -144,44 +144,41 @@ class CustomKeyMappingWidget(ISettingsContentWidget):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the SettingsWidget instance itself."""
 
         # Call the super class's init_ui method.
         super()._init_ui()
 
+        # Set the object name selecting the CustomKeyMappingWidget within the application-wide stylesheet.
+        self.setObjectName("custom_key_mapping_widget")
+
         # Retrieve the main layout inherited from ISettingsContentWidget.
         main_layout: QVBoxLayout = self.layout()
 
-        # Create the QConfigList.
-        self._config_list: QConfigList = QConfigList(
-            n=2,
+        #   Create the ShortcutTable of the custom shortcuts, whose bound keys are unique,
+        # keeping an empty row at the end for adding new custom shortcuts.
+        self._shortcut_table: ShortcutTable = ShortcutTable(
             header_texts=("Bind ...", "To ..."),
+            rows=CONFIG["shortcuts"]["custom"].items(),
             no_duplicates=[1],
-            row_widgets=(
-                lambda parent_: QPushButtonShortcut(),
-                lambda parent_: QPushButtonShortcut(allow_mouse_buttons=True))
-            ,
-            initial=tuple(
-                (
-                    QPushButtonShortcut(text=bind),
-                    QPushButtonShortcut(text=CONFIG["shortcuts"]["custom"][bind], allow_mouse_buttons=True),
-                )
-                for bind in CONFIG["shortcuts"]["custom"]
-            ),
-            validity_function=lambda *widgets: all(widget.text() for widget in widgets),
-            widget_edited_callback=self.settings_just_changed,
-            only_one_empty_cell=True,
-            no_verif=True,
-            style=STYLE,
+            validity_function=lambda *values: all(values),
+            mouse_buttons_columns=[2],
+            only_one_empty_row=True,
             parent=self
         )
+        self._shortcut_table.model().row_edited.connect(lambda _row: self.settings_just_changed())
 
-        # Add the QConfigList to the main layout.
-        main_layout.addWidget(self._config_list)
+        # Create the QLineEdit filtering the ShortcutTable as the text is typed.
+        self._shortcut_search_edit: QLineEdit = QLineEdit(self)
+        self._shortcut_search_edit.setPlaceholderText("Search shortcuts...")
+        self._shortcut_search_edit.setClearButtonEnabled(True)
+        self._shortcut_search_edit.setObjectName("shortcut_search_edit")
+        self._shortcut_search_edit.textChanged.connect(self._shortcut_table.filter)
+
+        # Add the search QLineEdit and the ShortcutTable to the main layout.
+        main_layout.addWidget(self._shortcut_search_edit)
+        main_layout.addWidget(self._shortcut_table)
 
         # Create and add the save button to the main layout.
         self._add_save_button()
@@ -206,12 +203,7 @@ class CustomKeyMappingWidget(ISettingsContentWidget):
 
     def _reset_widgets(self) -> None:
         """Reset the widgets of the ISettingsContentWidget."""
-        for row_widgets in self._config_list.widgets:
-            try:
-                setattr(row_widgets[1], "shortcut", (CONFIG["shortcuts"]["custom"][getattr(row_widgets[0], "text")()]))
-                getattr(row_widgets[1], "setText")(CONFIG["shortcuts"]["custom"][getattr(row_widgets[0], "text")()])
-            except KeyError:
-                continue
+        self._shortcut_table.set_rows(CONFIG["shortcuts"]["custom"].items())
 
     def _save(self) -> None:
         """Callback method when the save button get clicked."""
@@ -220,7 +212,7 @@ class CustomKeyMappingWidget(ISettingsContentWidget):
             CONFIG,
             "shortcuts",
             "custom",
-            value={e[0]: e[1] for e in self._config_list.widgets_content}
+            value={e[0]: e[1] for e in self._shortcut_table.rows_content}
         )
 
         # Calling the super class's save method.
@@ -235,32 +227,14 @@ class CustomKeyMappingWidget(ISettingsContentWidget):
         Return True if the content of the ISettingsContentWidget is valid and can be saved.
         This method should be overridden in child classes.
         """
-        return self._config_list.is_valid
-
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
-
-    def _set_custom_key_mapping_dialog_stylesheet(self) -> None:
-        """Set the CustomKeyMappingWidget StyleSheet."""
-
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["Custom"]["middleground-color"]};
-        """)
-
-    def _set_config_list_stylesheet(self) -> None:
-        """Set the config list StyleSheet."""
+        return self._shortcut_table.is_valid
 
-        # Set the StyleSheet.
-        self._config_list.set_stylesheets()
+    # ================== #
+    # Stylesheets method #
+    # ================== #
 
     def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the CustomKeyMappingWidget StyleSheets.
-        super().set_stylesheets()
-        self._set_custom_key_mapping_dialog_stylesheet()
-        self._set_config_list_stylesheet()
+        """Repaint the ShortcutTable, whose invalid cells are painted from the theme."""
+        self._shortcut_table.viewport().update()
 
 # =-----------------------------------------------------------------------------------------= #
@@ -15,13 +15,13 @@
 # Libraries import #
 # =--------------= #
 
-from typing                   import Any, Tuple
+from typing                   import Any
 from .CustomKeyMappingDialog  import CustomKeyMappingDialog
 from ..ISettingsContentWidget import ISettingsContentWidget
-from src.UtilityWidgets       import QConfigList, QPushButtonShortcut
+from src.UtilityWidgets       import ShortcutTable
 from PySide6.QtCore           import Qt
-from PySide6.QtWidgets        import QLabel, QPushButton, QVBoxLayout, QWidget
-from src.config               import CONFIG, STYLE
+from PySide6.QtWidgets        import QLineEdit, QPushButton, QVBoxLayout, QWidget
+from src.config               import CONFIG
 import src.config                 as config
 import src.utils                  as utils
 
@@ -67,45 +67,48 @@ class KeyMappingWidget(ISettingsContentWidget):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the SettingsDialog instance itself."""
 
         # Call the super class's init_ui method.
         super()._init_ui()
 
+        # Set the object name selecting the KeyMappingWidget within the application-wide stylesheet.
+        self.setObjectName("key_mapping_widget")
+
         # Retrieve the main layout inherited from ISettingsContentWidget.
         main_layout: QVBoxLayout = self.layout()
 
-        # Create the QConfigList.
-        self._config_list: QConfigList = QConfigList(
-            n=2,
+        #   Create the ShortcutTable of the builtin shortcuts, whose
+        # action column is read-only and whose shortcuts are unique.
+        self._shortcut_table: ShortcutTable = ShortcutTable(
             header_texts=("Action", "Shortcut"),
+            rows=CONFIG["shortcuts"]["builtin"].items(),
             no_duplicates=[2],
-            initial=tuple(
-                (
-                    QLabel(text=bind),
-                    QPushButtonShortcut(text=CONFIG["shortcuts"]["builtin"][bind]),
-                )
-                for bind in CONFIG["shortcuts"]["builtin"]
-            ),
-            widget_edited_callback=(lambda _action, *widgets: self.settings_just_changed(*widgets)),
-            no_buttons=True,
-            no_verif=True,
-            style=STYLE,
+            editable_columns=[2],
             parent=self
         )
+        self._shortcut_table.model().row_edited.connect(
+            lambda row: self.settings_just_changed(*self._shortcut_table.model().row(row))
+        )
 
-        # Add the QConfigList to the main layout.
-        main_layout.addWidget(self._config_list)
+        # Create the QLineEdit filtering the ShortcutTable as the text is typed.
+        self._shortcut_search_edit: QLineEdit = QLineEdit(self)
+        self._shortcut_search_edit.setPlaceholderText("Search shortcuts...")
+        self._shortcut_search_edit.setClearButtonEnabled(True)
+        self._shortcut_search_edit.setObjectName("shortcut_search_edit")
+        self._shortcut_search_edit.textChanged.connect(self._shortcut_table.filter)
+
+        # Add the search QLineEdit and the ShortcutTable to the main layout.
+        main_layout.addWidget(self._shortcut_search_edit)
+        main_layout.addWidget(self._shortcut_table)
 
         # Create the custom key mapping button.
         self._custom_key_mapping_button: QPushButton = QPushButton(
             text="Customize your custom key mapping",
             parent=self
         )
+        self._custom_key_mapping_button.setObjectName("custom_key_mapping_button")
         self._custom_key_mapping_button.clicked.connect(self._open_custom_key_mapping_dialog)
 
         # Add the custom key mapping button to the main layout.
@@ -123,8 +126,8 @@ class KeyMappingWidget(ISettingsContentWidget):
         Set the settings_changed attribute to True and update both
         the save_button being disabled or not and the CONFIG dictionary.
 
-        :param widgets_content: The changed row of widgets from the config_list.
-        :type widgets_content: Tuple[QLabel or QPushButtonShortcut, QPushButtonShortcut]
+        :param widgets_content: The values of the changed row from the shortcut table.
+        :type widgets_content: str
         """
 
         # Call the super class's settings_just_changed method.
@@ -138,16 +141,14 @@ class KeyMappingWidget(ISettingsContentWidget):
 
     def _reset_widgets(self) -> None:
         """Reset the widgets of the ISettingsContentWidget."""
-        for row_widgets in self._config_list.widgets:
-            setattr(row_widgets[1], "shortcut", (CONFIG["shortcuts"]["builtin"][getattr(row_widgets[0], "text")()]))
-            getattr(row_widgets[1], "setText")(CONFIG["shortcuts"]["builtin"][getattr(row_widgets[0], "text")()])
+        self._shortcut_table.set_rows(CONFIG["shortcuts"]["builtin"].items())
 
     def _is_valid(self) -> bool:
         """
         Return True if the content of the ISettingsContentWidget is valid and can be saved.
         This method should be overridden in child classes.
         """
-        return self._config_list.is_valid
+        return self._shortcut_table.is_valid
 
     # ================ #
     # Callback methods #
@@ -160,49 +161,12 @@ class KeyMappingWidget(ISettingsContentWidget):
         custom_key_mapping_dialog: CustomKeyMappingDialog = CustomKeyMappingDialog(self)
         custom_key_mapping_dialog.open()
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
-
-    def _set_key_mapping_widget_stylesheet(self) -> None:
-        """Set the KeyMappingWidget StyleSheet."""
-
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["Custom"]["middleground-color"]};
-        """)
-
-    def _set_config_list_stylesheet(self) -> None:
-        """Set the config list StyleSheet."""
-
-        # Set the StyleSheet.
-        self._config_list.set_stylesheets()
-
-    def _set_custom_key_mapping_button_stylesheet(self) -> None:
-        """Set the custom key mapping Stylesheet."""
-
-        # Set the Stylesheet.
-        self._custom_key_mapping_button.setStyleSheet(f"""
-            QPushButton {{
-                color: {STYLE["color"]};    
-                font-size: 18px;
-                font-style: italic;
-                font-weight: bolder;
-                border: 2px solid rgb(255, 255, 255);
-                border-radius: 10px;
-                padding: 10px;
-                margin-top: 15px;
-                margin-bottom: 15px;
-            }}
-        """)
+    # ================== #
+    # Stylesheets method #
+    # ================== #
 
     def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the SettingsDialog StyleSheets.
-        super().set_stylesheets()
-        self._set_key_mapping_widget_stylesheet()
-        self._set_config_list_stylesheet()
-        self._set_custom_key_mapping_button_stylesheet()
+        """Repaint the ShortcutTable, whose invalid cells are painted from the theme."""
+        self._shortcut_table.viewport().update()
 
 # =------------------------------------------------------------------------------------------------------------------= #
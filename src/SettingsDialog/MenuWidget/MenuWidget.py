@@ -19,7 +19,6 @@ from typing             import Callable, Dict
 from PySide6.QtCore     import Qt
 from PySide6.QtGui      import QCloseEvent
 from PySide6.QtWidgets  import QPushButton, QVBoxLayout, QWidget
-from src.config         import STYLE
 import src.utils            as utils
 
 # =-----------------------------------------------------------------------------------------------------= #
@@ -58,18 +57,19 @@ class MenuWidget(QWidget):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the MenuWidget instance itself."""
 
+        # Set the object name selecting the MenuWidget within the application-wide stylesheet.
+        self.setObjectName("menu_widget")
+
         # Create the main layout of the MenuWidget.
         main_layout: QVBoxLayout = QVBoxLayout()
 
         # Create a Theme button.
         theme_button = QPushButton("Theme", self)
         theme_button.setCheckable(True)
+        theme_button.setObjectName("menu_button")
         theme_button.clicked.connect(lambda: self._menu_selected_callback(theme_button))
 
         # Add the Theme button to the menu_buttons list.
@@ -81,6 +81,7 @@ class MenuWidget(QWidget):
         # Create a Shortcut button.
         shortcut_button = QPushButton("Shortcut", self)
         shortcut_button.setCheckable(True)
+        shortcut_button.setObjectName("menu_button")
         shortcut_button.clicked.connect(lambda: self._menu_selected_callback(shortcut_button))
 
         # Add the Shortcut button to the menu_buttons list.
@@ -114,67 +115,6 @@ class MenuWidget(QWidget):
         # Clear the MenuWidget's layout.
         utils.clear_layout(self.layout())
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
-
-    def _set_theme_widget_stylesheet(self) -> None:
-        """Set the SettingsDialog StyleSheet."""
-
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["background-color"]};
-        """)
-
-    @staticmethod
-    def _set_menu_button_stylesheet(menu_button: QPushButton) -> None:
-        """
-        Set the given menu button StyleSheet.
-
-        :param menu_button: The style button to set the StyleSheet.
-        :type menu_button: PySide6.QtWidgets.QPushButton
-        """
-
-        # Set the StyleSheet depending on the button being checked.
-        if menu_button.isChecked():
-            menu_button.setStyleSheet(f"""\
-                QPushButton {{
-                    background-color: {STYLE["QPushButton:checked"]["background-color"]};
-                    color: {STYLE["color"]};
-                    font-family: {STYLE["font-family"]};
-                    font-size: 16px;
-                    width: 250px;
-                    border: 2px solid rgb(255, 255, 255);
-                    border-radius: 10px;
-                    padding: 2px;
-                    margin-left: 10px;
-                    margin-right: 10px;
-                }}
-            """)
-        else:
-            menu_button.setStyleSheet(f"""\
-                QPushButton {{
-                    background-color: {STYLE["background-color"]};
-                    color: {STYLE["color"]};
-                    font-family: {STYLE["font-family"]};
-                    font-size: 16px;
-                    width: 250px;
-                    border: 2px solid rgb(255, 255, 255);
-                    border-radius: 10px;
-                    padding: 2px;
-                    margin-left: 10px;
-                    margin-right: 10px;
-                }}
-            """)
-
-    def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the StyleSheets.
-        self._set_theme_widget_stylesheet()
-        for button in self._menu_buttons.values():
-            MenuWidget._set_menu_button_stylesheet(button)
-
     # ============= #
     # Getter method #
     # ============= #
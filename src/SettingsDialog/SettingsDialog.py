@@ -15,16 +15,17 @@
 # Libraries import #
 # =--------------= #
 
-from typing                  import Optional, Union
+from typing                  import Callable, Dict, Optional, Union
+from .ISettingsContentWidget import ISettingsContentWidget
 from .KeyMappingWidget       import KeyMappingWidget
 from .MenuWidget             import MenuWidget
 from .ThemeWidget            import ThemeWidget
 from PySide6.QtCore          import Qt
 from PySide6.QtGui           import QCloseEvent, QResizeEvent
 from PySide6.QtWidgets       import QDialog, QPushButton, QSplitter, QStackedLayout, QVBoxLayout, QWidget
-from src.config              import CONFIG, STYLE
+from src.config              import CONFIG
 import src.config                as config
-import src.utils                 as utils
+import src.stylesheet            as stylesheet
 
 # =---------------------------------------------------------------------------------------------------= #
 
@@ -34,6 +35,19 @@ import src.utils                 as utils
 # =--------------------------------------------------= #
 
 
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Factories of the menu pages, by menu button text, called when a page get selected the first time.
+MENU_PAGES: Dict[str, Callable[[QWidget], ISettingsContentWidget]] = {
+    "Theme": ThemeWidget,
+    "Shortcut": KeyMappingWidget
+}
+
+# =-----------------------------------------------------------------------------------------------= #
+
+
 # =------------------= #
 # SettingsDialog class #
 # =------------------= #
@@ -60,8 +74,9 @@ class SettingsDialog(QDialog):
         # Call the super class's initializer method.
         super().__init__(parent)
 
-        # Initialize the straight-forward attribute.
+        # Initialize the straight-forward attributes.
         self._settings_changed: bool = False
+        self._pages: Dict[str, ISettingsContentWidget] = {}
 
         # Initialize the UI.
         self._init_ui()
@@ -75,6 +90,9 @@ class SettingsDialog(QDialog):
         # Set the title of the Window.
         self.setWindowTitle("Settings")
 
+        # Set the object name selecting the SettingsDialog within the application-wide stylesheet.
+        self.setObjectName("settings_dialog")
+
         # Set the layout of the SettingsDialog.
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -86,14 +104,14 @@ class SettingsDialog(QDialog):
         # Create the menu and menu content widgets.
         self._menu_widget: MenuWidget = MenuWidget(self, self._menu_button_selected)
         self._menu_content_widget: Union[QWidget, ThemeWidget, KeyMappingWidget] = QWidget(self)
+        self._menu_content_widget.setObjectName("menu_content_widget")
 
         # Create the menu content stacked layout.
         self._menu_content_stacked_layout: QStackedLayout = QStackedLayout(self)
 
-        # Add the different widgets to the stacked layout.
-        self._menu_content_stacked_layout.addWidget(QWidget(self))           # No selection.
-        self._menu_content_stacked_layout.addWidget(ThemeWidget(self))       # Theme widget.
-        self._menu_content_stacked_layout.addWidget(KeyMappingWidget(self))  # Shortcut widget.
+        #   Add the no selection widget to the stacked layout, the
+        # menu pages being added when they get selected the first time.
+        self._menu_content_stacked_layout.addWidget(QWidget(self))
 
         # Set the menu_content_stacked_layout as the menu_content_widget's layout.
         self._menu_content_widget.setLayout(self._menu_content_stacked_layout)
@@ -165,13 +183,40 @@ class SettingsDialog(QDialog):
         if hasattr(self.parent(), "update_builtin_shortcuts"):
             self.parent().update_builtin_shortcuts()
 
-        # Clear the SettingsDialog's layout.
-        utils.clear_layout(self.layout())
+        #   Merge the theme edits restyled widget by widget
+        # meanwhile into the application-wide stylesheet.
+        stylesheet.apply_stylesheet()
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def refresh(self) -> None:
+        """Refresh the already created menu pages from the CONFIG and STYLE dictionaries, before reopening."""
+        for page in self._pages.values():
+            page.refresh()
 
     # =============== #
     # Private methods #
     # =============== #
 
+    def _page(self, name: str) -> ISettingsContentWidget:
+        """
+        Return the menu page of the given menu button text, creating it and
+        adding it to the menu content stacked layout the first time only.
+
+        :param str name: The text of the menu button.
+        :returns: The menu page.
+        :rtype: ISettingsContentWidget
+        """
+
+        # Create the page if it hasn't been yet.
+        if name not in self._pages:
+            page: ISettingsContentWidget = MENU_PAGES[name](self)
+            self._menu_content_stacked_layout.addWidget(page)
+            self._pages[name] = page
+        return self._pages[name]
+
     def _update_spliter_widets_size_restrictions(self) -> None:
         """Update the size restrictions of the splitter's widgets."""
 
@@ -231,51 +276,22 @@ class SettingsDialog(QDialog):
         # Save the CONFIG dictionary.
         config.save_config()
 
-        # Update the SettingsDialog display.
-        self.set_stylesheets()
-
-        # Display the corresponding menu on the menu
-        # content widget and update its StyleSheet.
+        #   Display the corresponding menu on the menu content widget, the checked
+        # menu button being styled by the application-wide stylesheet.
         button_text: str = button.text()
-        if button_text == "Theme":
-            self._menu_content_stacked_layout.setCurrentIndex(1)
-        elif button_text == "Shortcut":
-            self._menu_content_stacked_layout.setCurrentIndex(2)
+        if button_text in MENU_PAGES:
+            self._menu_content_stacked_layout.setCurrentWidget(self._page(button_text))
 
     # =================== #
     # Stylesheets methods #
     # =================== #
 
-    def _set_settings_stylesheet(self) -> None:
-        """Set the SettingsDialog StyleSheet."""
-
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["background-color"]};
-        """)
-
-    def _set_menu_content_widget_stylesheet(self) -> None:
+    def set_stylesheets(self) -> None:
         """
-        Set the menu content widget StyleSheet.
-        This style may be overridden once a menu
-        content is displayed.
+        Set the stylesheets not handled by the application-wide stylesheet,
+        the SettingsDialog's own widgets being styled by their object name.
         """
 
-        # Set the StyleSheet.
-        self._menu_content_widget.setStyleSheet(f"""
-            background-color: {STYLE["Custom"]["middleground-color"]};
-        """)
-
-    def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the SettingsDialog StyleSheets.
-        self._set_settings_stylesheet()
-        self._set_menu_content_widget_stylesheet()
-
-        # Set the MenuWidget Stylesheets.
-        self._menu_widget.set_stylesheets()
-
         # Set the currently displayed menu content widget Stylesheets.
         menu_content_widget = self._menu_content_stacked_layout.currentWidget()
         if hasattr(menu_content_widget, "set_stylesheets"):
@@ -18,9 +18,11 @@
 from typing                   import Dict, Optional, Tuple
 from ..ISettingsContentWidget import ISettingsContentWidget
 from PySide6.QtGui            import QColor
-from PySide6.QtWidgets        import QColorDialog, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtWidgets        import QColorDialog, QComboBox, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 from src.config               import STYLE
+from src.themes               import CompiledTheme, THEME_LIBRARY
 import src.config                 as config
+import src.stylesheet             as stylesheet
 import src.utils                  as utils
 
 # =-------------------------------------------------------------------------------------------= #
@@ -68,47 +70,43 @@ class ThemeWidget(ISettingsContentWidget):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the ThemeWidget instance itself."""
 
         # Call the super class's init_ui method.
         super()._init_ui()
 
+        # Set the object name selecting the ThemeWidget within the application-wide stylesheet.
+        self.setObjectName("theme_widget")
+
         # Retrieve the main layout inherited from ISettingsContentWidget.
         main_layout: QVBoxLayout = self.layout()
 
+        # Create the themes combo box, switching to any theme of the themes library.
+        self._themes_combo_box: QComboBox = QComboBox(self)
+        self._themes_combo_box.setObjectName("themes_combo_box")
+        self._themes_combo_box.setPlaceholderText("Preset themes")
+        self._themes_combo_box.addItems(THEME_LIBRARY.names)
+        self._themes_combo_box.setCurrentIndex(-1)
+        self._themes_combo_box.setEnabled(bool(THEME_LIBRARY.names))
+        self._themes_combo_box.textActivated.connect(self._theme_selected)
+        main_layout.addWidget(self._themes_combo_box)
+
         # Initialize every style button.
-        for styles in [
-            [("background-color", "Background color"), ("Custom", "middleground-color", "Middleground color")],
-            [("Custom", "selected-background-color", "Selected background color"), ("color", "Text color")],
-            [
-                ("QStatusBar", "background-color", "Status bar background color"),
-                ("QPushButton:checked", "background-color", "Selected settings menu button background color")
-            ],
-            [
-                ("QPushButton", "background-color", "Buttons background color"),
-                ("QPushButton:pressed", "background-color", "Pressed buttons background color")
-            ],
-            [
-                ("QPushButton:hover", "border-color", "Buttons hover border color"),
-                ("Custom", "circlewindow-background-color", "Hotkeys circle background color")
-            ],
-        ]:
+        for styles in config.THEME_BUTTONS:
             # Create a horizontal layout for the style button to be created.
             horizontal_layout: QHBoxLayout = QHBoxLayout(self)
 
             # Create the style buttons.
             for style in styles:
+                #   Create the style button, displaying the color it edits
+                # through its object name within the application-wide stylesheet.
                 style_button: QPushButton = QPushButton(style[-1], self)
+                style_button.setObjectName(stylesheet.theme_button_object_name(style[:-1]))
 
                 # Connect the style button to the style_button_clicked callback method.
                 style_button.clicked.connect(
-                    lambda checked=False, style_button_=style_button, style_=style[:-1]: self._style_button_clicked(
-                        style_button_
-                    )
+                    lambda checked=False, style_button_=style_button: self._style_button_clicked(style_button_)
                 )
 
                 # Add the style button to the style_button dictionary.
@@ -127,55 +125,45 @@ class ThemeWidget(ISettingsContentWidget):
         # Create and add the save button to the main layout.
         self._add_save_button()
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
+    # ============== #
+    # Private method #
+    # ============== #
 
-    def _set_theme_widget_stylesheet(self) -> None:
-        """Set the SettingsDialog StyleSheet."""
+    def _reset_widgets(self) -> None:
+        """Reset the themes combo box, the STYLE dictionary being reset."""
+        self._themes_combo_box.setCurrentIndex(-1)
 
-        # Set the StyleSheet.
-        self.setStyleSheet(f"""
-            background-color: {STYLE["Custom"]["middleground-color"]};
-        """)
+    # ================ #
+    # Callback methods #
+    # ================ #
 
-    def _set_style_button_stylesheet(self, style_button: QPushButton) -> None:
+    def _theme_selected(self, name: str) -> None:
         """
-        Set the given style button StyleSheet.
+        Callback method used when a theme get selected from the themes combo box.
+        The theme is compiled once, switching back to it doesn't touch the disk anymore.
 
-        :param style_button: The style button to set the StyleSheet.
-        :type style_button: PySide6.QtWidgets.QPushButton
+        :param str name: The name of the selected theme.
         """
 
-        # Set the StyleSheet.
-        background_color: str = utils.access_dict(STYLE, *(self._style_buttons[style_button]))
-        style_button.setStyleSheet(f"""\
-            QPushButton {{
-                background-color: {background_color};
-                color: {utils.opposite_hex_color(background_color)};
-                font-family: {STYLE["font-family"]};
-                font-size: 16px;
-                width: 250px;
-                border: 2px solid rgb(255, 255, 255);
-                border-radius: 10px;
-                padding: 2px;
-                margin-left: 10px;
-                margin-right: 10px;
-            }}
-        """)
-
-    def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the StyleSheets.
-        super().set_stylesheets()
-        self._set_theme_widget_stylesheet()
-        for button in self._style_buttons.keys():
-            self._set_style_button_stylesheet(button)
+        # Retrieve the compiled theme, returning here if it can't be loaded.
+        theme: Optional[CompiledTheme] = THEME_LIBRARY.get(name)
+        if theme is None:
+            return
 
-    # ================ #
-    # Callback methods #
-    # ================ #
+        # Make it the current theme.
+        theme.apply()
+
+        # Update the whole HotClick software stylesheets, already compiled for such a theme.
+        parent: Optional[QWidget] = self
+        while parent.parent() is not None:
+            parent = parent.parent()
+        if hasattr(parent, "set_stylesheets"):
+            parent.set_stylesheets()
+        else:
+            stylesheet.apply_stylesheet()
+
+        # Update the settings_changes attribute.
+        self._settings_changed = True
 
     def _style_button_clicked(self, style_button: QPushButton) -> None:
         """
@@ -200,15 +188,15 @@ class ThemeWidget(ISettingsContentWidget):
         # Update the style dictionary.
         utils.update_dict(STYLE, *keys, value=color.name())
 
-        # Save the style file.
-        config.save_style()
-
-        # Update the whole HotClick software stylesheets.
+        #   Restyle only the widgets depending on the edited value, the
+        # style file being written once, when the save button get clicked.
         parent: Optional[QWidget] = self
         while parent.parent() is not None:
             parent = parent.parent()
-        if hasattr(parent, "set_stylesheets"):
-            parent.set_stylesheets()
+        if hasattr(parent, "theme_changed"):
+            parent.theme_changed(keys)
+        else:
+            stylesheet.restyle(parent, keys)
 
         # Update the settings_changes attribute.
         self._settings_changed = True
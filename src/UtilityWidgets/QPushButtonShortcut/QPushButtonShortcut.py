@@ -18,11 +18,10 @@
 # Libraries import #
 # =--------------= #
 
-from typing            import Optional, Type, Union
-from PySide6.QtCore    import Qt, QEvent, QThread, Signal
-from PySide6.QtGui     import QColor, QFont, QIcon, QPainter, QPaintEvent, QPixmap, QMouseEvent
+from typing            import Dict, List, Optional, Tuple, Type, Union
+from PySide6.QtCore    import Qt, QEvent, Signal
+from PySide6.QtGui     import QColor, QFont, QIcon, QPainter, QPaintEvent, QPixmap, QMouseEvent, QScreen
 from PySide6.QtWidgets import QApplication, QDialog, QPushButton, QWidget
-import time
 
 # =-----------------------------------------------------------------------------------------= #
 
@@ -33,87 +32,24 @@ import time
 
 __author__       = "Quentin Raimbaud"
 __contact__      = "quentin.raimbaud.contact@gmail.com"
-__date__         = "2024-03-23"
+__date__         = "2026-10-19"
 __license__      = "LGPL-2.1"
 __maintainer__   = "Quentin Raimbaud"
 __status__       = "Development"
-__version__      = "1.0.0"
+__version__      = "1.1.0"
 
 # =-------------------------------------------------= #
 
 
-# =------------------= #
-# KeyboardThread class #
-# =------------------= #
+# =-------------= #
+# Global variable #
+# =-------------= #
 
-class KeyboardThread(QThread):
-    """
-    KeyboardThread QThread used for handling a
-    hotkey from a different thread than the one
-    used by the Qt main loop, allowing to use
-    the keyboard python library thread-safely.
-    """
-
-    # Declare the signal to send
-    # once a hotkey is pressed;
-    key_pressed = Signal(str)
-
-    # =================== #
-    # Initializer methods #
-    # =================== #
-
-    def __init__(self, parent: QWidget) -> None:
-        """Initializer method."""
-
-        # Call the super class's initializer method.
-        super().__init__(parent)
-
-        # Set the straight-forward attribute.
-        self._stop_requested: bool = False
-
-    # ================= #
-    # Overridden method #
-    # ================= #
-
-    def run(self) -> None:
-        """
-        Overridden run method.
-        This method is called when the KeyboardThread starts.
-        """
-
-        # Retrieve the MainWindow widget.
-        parent: Optional[QWidget] = self.parent().virtual_parent
-        while parent.parent() is not None:
-            parent = parent.parent()
-
-        # Enter a loop waiting for a
-        # new valid hotkey to be pressed
-        if hasattr(parent, "clear_last_hotkey"):
-            parent.clear_last_hotkey()
-        if hasattr(parent, "last_hotkey"):
-            current_hotkey: Optional[str] = parent.last_hotkey
-            while current_hotkey == parent.last_hotkey:
-                # If stop_requested is True, return.
-                if self._stop_requested:
-                    return
-                time.sleep(0.01)
-
-            # Emit such a new valid hotkey to
-            # the TransparentFullscreenWindow parent.
-            self.key_pressed.emit(parent.last_hotkey)
-
-        # No more code to use, the
-        # KeyboardThread stops.
-
-    # ============== #
-    # Private method #
-    # ============== #
-
-    def stop(self) -> None:
-        """Update the stop_requested to True."""
-        self._stop_requested = True
+#   Pooled TransparentFullscreenWindows, one per screen, reused
+# by every shortcut capture instead of being created each time.
+CAPTURE_OVERLAYS: Dict[QScreen, "TransparentFullscreenWindow"] = {}
 
-# =----------------------------------------------------------= #
+# =---------------------------------------------------------------------= #
 
 
 # =-------------------------------= #
@@ -124,48 +60,94 @@ class TransparentFullscreenWindow(QDialog):
     """
     TransparentFullScreenWindow Dialog used for
     handling a hotkey from a QPushButtonShortcut.
+    One instance is pooled per screen, its appearance
+    being pre-rendered for its screen geometry, and the
+    one capturing the shortcut only filters the application
+    events for the duration of the capture.
     """
 
     # =================== #
     # Initializer methods #
     # =================== #
 
-    def __init__(self, _allow_mouse_buttons: bool = False, parent: QWidget = None) -> None:
-        """Initializer method."""
+    def __init__(self, screen: QScreen) -> None:
+        """
+        Initializer method.
+
+        :param PySide6.QtGui.QScreen screen: The screen covered by the TransparentFullscreenWindow.
+        """
 
         # Call the super class's initializer method.
         super().__init__()
 
         # Set the straight-forward attributes.
-        self._allow_mouse_buttons: bool = _allow_mouse_buttons
-        self._virtual_parent: QWidget = parent
+        self._screen: QScreen = screen
+        self._allow_mouse_buttons: bool = False
+        self._virtual_parent: Optional[QWidget] = None
+        self._main_window: Optional[QWidget] = None
+        self._capturing: bool = False
         self._shortcut: str = ""
         self._to_be_closed: bool = False
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_key: Optional[Tuple[int, int, float]] = None
 
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the KeyboardThread.
-        self._keyboard_thread: KeyboardThread = KeyboardThread(self)
-        self._keyboard_thread.key_pressed.connect(self._handle_hotkey)
-        self._keyboard_thread.start()
-
     def _init_ui(self) -> None:
-        """Initialize the QPushButtonShortcut's UI."""
+        """Initialize the TransparentFullscreenWindow's UI."""
 
         # Set the Window Flags.
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setMouseTracking(True)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def cover(self) -> None:
+        """Show the TransparentFullscreenWindow over its whole screen, without capturing anything."""
+        self.setGeometry(self._screen.geometry())
         self.showFullScreen()
 
-        self.setMouseTracking(True)
+    def capture(self, allow_mouse_buttons: bool, virtual_parent: Optional[QWidget]) -> str:
+        """
+        Cover the screen and wait for a shortcut to be input, then return it.
+
+        :param bool allow_mouse_buttons: If True, allow the mouse buttons as shortcuts.
+        :param virtual_parent: The QPushButtonShortcut the shortcut is captured for.
+        :type virtual_parent: QWidget or None
+        :returns: The shortcut input.
+        :rtype: str
+        """
+
+        # Reset the capture state.
+        self._allow_mouse_buttons = allow_mouse_buttons
+        self._virtual_parent = virtual_parent
+        self._shortcut = ""
+        self._to_be_closed = False
+        self._capturing = True
+
+        # Cover the screen and grab the mouse.
+        self.cover()
         self.grabMouse()
 
-        # Use an event filter to ensure this Window
-        # receive any keyboard input & mouse event
-        # if the allow_mouse_buttons attribute is True.
+        #   Use an event filter to ensure this Window receive any keyboard input & mouse
+        # event if the allow_mouse_buttons attribute is True, for the capture's duration only.
         QApplication.instance().installEventFilter(self)
 
+        #   Subscribe to the hotkeys pressed, sent by the MainWindow's keyboard
+        # hook and queued to the Qt main loop, so the capture wakes up only
+        # when a hotkey is pressed.
+        self._main_window = self._retrieve_main_window()
+        if self._main_window is not None:
+            self._main_window.hotkey_pressed.connect(self._handle_hotkey)
+
+        # Wait for the shortcut and return it.
+        self.exec()
+        return self._shortcut
+
     # ================== #
     # Overridden methods #
     # ================== #
@@ -189,6 +171,26 @@ class TransparentFullscreenWindow(QDialog):
         # Ensure the event is not handled by watched.
         return True
 
+    def done(self, result: int) -> None:
+        """
+        Overridden done method.
+        This method is called when the TransparentFullscreenWindow get closed, whatever the way.
+
+        :param int result: The result code of the dialog.
+        """
+
+        # End the capture, removing the event filter and unsubscribing from the hotkeys pressed.
+        if self._capturing:
+            self._capturing = False
+            QApplication.instance().removeEventFilter(self)
+            self.releaseMouse()
+            if self._main_window is not None:
+                self._main_window.hotkey_pressed.disconnect(self._handle_hotkey)
+                self._main_window = None
+
+        # Call the super class's done method.
+        super().done(result)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
         Overridden mousePressEvent method.
@@ -239,10 +241,6 @@ class TransparentFullscreenWindow(QDialog):
         # Handle the click event if the
         # allow_mouse_buttons is True.
         if self._allow_mouse_buttons and self._to_be_closed:
-            # Stop the keyboard thread.
-            self._keyboard_thread.stop()
-            # Wait for it to stop definitely.
-            time.sleep(0.01)
             # Close the window when any mouse button is released.
             self.close()
 
@@ -258,36 +256,68 @@ class TransparentFullscreenWindow(QDialog):
         :param PySide6.QtGui.QPaintEvent event: The QPaintEvent received.
         """
 
-        # Initialize a QPainter instance.
+        # Re-render the cached pixmap only if the screen geometry or its device pixel ratio changed.
+        ratio: float = self.devicePixelRatioF()
+        pixmap_key: Tuple[int, int, float] = (self.width(), self.height(), ratio)
+        if pixmap_key != self._pixmap_key:
+            self._pixmap = self._render_pixmap(ratio)
+            self._pixmap_key = pixmap_key
+
+        # Draw the cached pixmap.
         qp: QPainter = QPainter(self)
+        qp.drawPixmap(0, 0, self._pixmap)
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _render_pixmap(self, ratio: float) -> QPixmap:
+        """
+        Render the TransparentFullscreenWindow appearance for its current size into a pixmap.
+
+        :param float ratio: The device pixel ratio to render the pixmap for.
+        :returns: The rendered pixmap.
+        :rtype: PySide6.QtGui.QPixmap
+        """
+
+        # Initialize a transparent pixmap at the device pixel ratio.
+        pixmap: QPixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
-        # Set the QPainter instance antialiasing and brush color.
+        # Initialize a QPainter instance with antialiasing.
+        qp: QPainter = QPainter(pixmap)
         qp.setRenderHint(QPainter.Antialiasing)
+
+        # Draw a rectangle that covers the whole screen.
         qp.setBrush(QColor(50, 50, 50, 127))
+        qp.drawRect(self.rect())
 
-        # Initialize the variables to calculate the
-        # total width and height of all screens.
-        total_width: int = 0
-        total_height: int = 0
+        # Draw the text "Input your shortcut" centered on the screen, large enough to be readable.
+        qp.setFont(QFont("Arial", 70, QFont.Bold))
+        qp.drawText(self.rect(), Qt.AlignCenter, "Input your shortcut")
+        qp.end()
 
-        # Iterate over all screens and draw the text on each one.
-        for screen in QApplication.screens():
-            # Set the font size to be large enough to be readable.
-            qp.setFont(QFont("Arial", 70, QFont.Bold))
+        # Return the rendered pixmap.
+        return pixmap
 
-            # Draw the text "Input your shortcut" centered on the current screen.
-            qp.drawText(screen.geometry(), Qt.AlignCenter, "Input your shortcut")
+    def _retrieve_main_window(self) -> Optional[QWidget]:
+        """
+        Return the root window of the virtual parent if it sends the hotkeys pressed, otherwise None.
 
-            # Increment the size computing variables.
-            total_width += screen.geometry().width()
-            total_height = max(total_height, screen.geometry().height())
+        :returns: The MainWindow, or None.
+        :rtype: QWidget or None
+        """
 
-        # Draw a rectangle that covers all screens
-        qp.drawRect(0, 0, total_width, total_height)
+        # Walk up to the root window of the virtual parent.
+        parent: Optional[QWidget] = self._virtual_parent
+        if parent is None:
+            return None
+        while parent.parent() is not None:
+            parent = parent.parent()
 
-    # ============== #
-    # Private method #
-    # ============== #
+        # Return it if it sends the hotkeys pressed.
+        return parent if hasattr(parent, "hotkey_pressed") else None
 
     def _handle_hotkey(self, hotkey: str) -> None:
         """
@@ -326,10 +356,54 @@ class TransparentFullscreenWindow(QDialog):
         """
         return self._virtual_parent
 
-
 # =-----------------------------------------------------------------------------------------------= #
 
 
+# =-----------------------= #
+# Shortcut capture function #
+# =-----------------------= #
+
+def capture_shortcut(allow_mouse_buttons: bool = False, virtual_parent: Optional[QWidget] = None) -> str:
+    """
+    Cover every screen with its pooled TransparentFullscreenWindow and wait
+    for a shortcut to be input from the one of the virtual parent's screen.
+
+    :param bool allow_mouse_buttons: If True, allow the mouse buttons as shortcuts. By default, False.
+    :param virtual_parent: The QPushButtonShortcut the shortcut is captured for. By default, None.
+    :type virtual_parent: QWidget or None
+    :returns: The shortcut input.
+    :rtype: str
+    """
+
+    # Drop the TransparentFullscreenWindows of the disconnected screens, and create the ones of the new screens.
+    screens: List[QScreen] = QApplication.screens()
+    for screen in list(CAPTURE_OVERLAYS.keys()):
+        if screen not in screens:
+            CAPTURE_OVERLAYS.pop(screen).deleteLater()
+    for screen in screens:
+        if screen not in CAPTURE_OVERLAYS:
+            CAPTURE_OVERLAYS[screen] = TransparentFullscreenWindow(screen)
+
+    # Retrieve the TransparentFullscreenWindow capturing the shortcut, on the virtual parent's screen.
+    screen: QScreen = virtual_parent.screen() if virtual_parent is not None else QApplication.primaryScreen()
+    capturing_overlay: TransparentFullscreenWindow = CAPTURE_OVERLAYS.get(screen, CAPTURE_OVERLAYS[screens[0]])
+
+    # Cover the other screens during the capture.
+    overlays: List[TransparentFullscreenWindow] = [
+        overlay for overlay in CAPTURE_OVERLAYS.values() if overlay is not capturing_overlay
+    ]
+    for overlay in overlays:
+        overlay.cover()
+    shortcut: str = capturing_overlay.capture(allow_mouse_buttons, virtual_parent)
+    for overlay in overlays:
+        overlay.hide()
+
+    # Return the shortcut input.
+    return shortcut
+
+# =------------------------------------------------------------------------------------------------------------= #
+
+
 # =-----------------------= #
 # QPushButtonShortcut class #
 # =-----------------------= #
@@ -337,6 +411,9 @@ class TransparentFullscreenWindow(QDialog):
 class QPushButtonShortcut(QPushButton):
     """QPushButtonShortcut class representing a shortcut QPushButton."""
 
+    # Declare the signal to send once a new shortcut is captured.
+    shortcut_changed = Signal(str)
+
     # =================== #
     # Initializer methods #
     # =================== #
@@ -415,18 +492,8 @@ class QPushButtonShortcut(QPushButton):
         :type event: QMouseEvent
         """
 
-        # Create and show the transparent window
-        # to handle any keyboard or mouse input.
-        transparent_window = TransparentFullscreenWindow(
-            _allow_mouse_buttons=self._allow_mouse_buttons,
-            parent=self
-        )
-        transparent_window.exec()
-
-        # Retrieve and update both the
-        # QPushButtonShortcut text and shortcut attribute.
-        self._shortcut = transparent_window.shortcut
-        self.setText(self._shortcut.upper() if self._display_upper else self._shortcut)
+        # Capture a new shortcut.
+        self.capture()
 
         # Continue propagating the MousePressEvent.
         super().mousePressEvent(event)
@@ -442,6 +509,23 @@ class QPushButtonShortcut(QPushButton):
         """
         return self._shortcut
 
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def capture(self) -> None:
+        """
+        Show the pooled transparent windows to handle any keyboard or mouse input, then update
+        both the QPushButtonShortcut text and shortcut attribute and emit the shortcut_changed signal.
+        """
+
+        # Capture the shortcut, then update the text and the shortcut attribute.
+        self._shortcut = capture_shortcut(self._allow_mouse_buttons, self)
+        self.setText(self._shortcut.upper() if self._display_upper else self._shortcut)
+
+        # Notify the new shortcut.
+        self.shortcut_changed.emit(self._shortcut)
+
     # ==================== #
     # Pseudo getter method #
     # ==================== #
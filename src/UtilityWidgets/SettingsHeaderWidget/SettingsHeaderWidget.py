@@ -17,7 +17,6 @@
 
 from PySide6.QtGui           import QCloseEvent
 from PySide6.QtWidgets       import QLabel, QVBoxLayout, QWidget
-from src.config              import STYLE
 import src.utils                 as utils
 
 # =----------------------------------------------------------= #
@@ -64,9 +63,6 @@ class SettingsHeaderWidget(QWidget):
         # Initialize the UI.
         self._init_ui()
 
-        # Initialize the UI style.
-        self.set_stylesheets()
-
     def _init_ui(self) -> None:
         """Initialize the UI of the ThemeWidget instance itself."""
 
@@ -75,6 +71,7 @@ class SettingsHeaderWidget(QWidget):
 
         # Create the header label.
         self._header_label: QLabel = QLabel(text=self._title, parent=self)
+        self._header_label.setObjectName("settings_header_label")
 
         # Add the header label to the main layout.
         main_layout.addWidget(self._header_label)
@@ -82,6 +79,7 @@ class SettingsHeaderWidget(QWidget):
         # Create the description label.
         self._description_label: QLabel = QLabel(text=self._description, parent=self)
         self._description_label.setWordWrap(True)
+        self._description_label.setObjectName("settings_description_label")
 
         # Add the description label to the main layout.
         main_layout.addWidget(self._description_label)
@@ -104,42 +102,4 @@ class SettingsHeaderWidget(QWidget):
         # Clear the SettingsDialog's layout.
         utils.clear_layout(self.layout())
 
-    # =================== #
-    # Stylesheets methods #
-    # =================== #
-
-    def _set_header_label_stylesheet(self) -> None:
-        """Set the header label Stylesheet."""
-
-        # Set the StyleSheet.
-        self._header_label.setStyleSheet(f"""
-            QLabel {{
-                color: {STYLE["color"]};    
-                font-size: 18px;
-                font-weight: bold;
-            }}
-        """)
-
-    def _set_description_label_stylesheet(self) -> None:
-        """Set the description label Stylesheet."""
-
-        # Set the StyleSheet.
-        self._description_label.setStyleSheet(f"""
-            QLabel {{
-                color: {STYLE["color"]};   
-                font-size: 16px;
-                font-style: italic;
-                font-weight: bolder;
-                margin-top: 15px;
-                margin-bottom: 20px;
-            }}
-        """)
-
-    def set_stylesheets(self) -> None:
-        """Call every set_stylesheet method."""
-
-        # Set the StyleSheets.
-        self._set_header_label_stylesheet()
-        self._set_description_label_stylesheet()
-
 # =---------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,725 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    ShortcutTable class used by the HotClick software.
+    The ShortcutTable displays the shortcuts mappings from
+    a table model painted by a delegate, an editor being
+    created only for the cell being edited, so tables of
+    thousands of mappings open instantly and scroll smoothly.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing              import Any, Callable, Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from collections         import Counter
+from ..QPushButtonShortcut import QPushButtonShortcut
+from PySide6.QtCore      import Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex
+from PySide6.QtCore      import QTimer, Signal
+from PySide6.QtGui       import QColor, QKeyEvent
+from PySide6.QtWidgets   import QAbstractItemView, QHeaderView, QStyledItemDelegate, QStyleOptionViewItem
+from PySide6.QtWidgets   import QTableView, QWidget
+from src.config          import STYLE
+from src.search          import SearchIndex
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-----------------------= #
+# ShortcutTableModel class #
+# =-----------------------= #
+
+class ShortcutTableModel(QAbstractTableModel):
+    """
+    Shortcut Table Model class holding the shortcuts mappings as rows of strings.
+    The values of the columns without duplicates are counted within an index, and
+    the invalid rows are tracked, so the duplicate and validity checks only visit
+    the edited row instead of the whole table. The rows are also kept within a search
+    index, built on the first search and then updated along with the edited rows.
+    """
+
+    # Declare the signal to send once a row got edited, with its index.
+    row_edited = Signal(int)
+
+    # =================== #
+    # Initializer methods #
+    # =================== #
+
+    def __init__(
+            self,
+            header_texts: Sequence[str],
+            no_duplicates: Collection[int] = (),
+            validity_function: Optional[Callable[..., bool]] = None,
+            editable_columns: Optional[Collection[int]] = None,
+            only_one_empty_row: bool = False,
+            parent: Optional[QWidget] = None
+    ) -> None:
+        """
+        Initializer method.
+
+        :param header_texts: The header text of each column.
+        :type header_texts: Sequence[str]
+        :param no_duplicates: The numbers, starting at 1, of the columns without duplicates. By default, none.
+        :type no_duplicates: Collection[int]
+        :param validity_function: The optional function returning True if the values of a row are valid.
+        :type validity_function: Callable[..., bool] or None
+        :param editable_columns: The numbers, starting at 1, of the editable columns. By default, every column.
+        :type editable_columns: Collection[int] or None
+        :param bool only_one_empty_row: If True, keep exactly one empty row at the end for adding new rows.
+        :param parent: The optional parent of the ShortcutTableModel. By default, None.
+        :type parent: QWidget or None
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Set the straight-forward attributes.
+        self._header_texts: Tuple[str, ...] = tuple(header_texts)
+        self._no_duplicates: Tuple[int, ...] = tuple(column - 1 for column in no_duplicates)
+        self._validity_function: Optional[Callable[..., bool]] = validity_function
+        self._editable_columns: Set[int] = set(
+            range(len(self._header_texts)) if editable_columns is None else (column - 1 for column in editable_columns)
+        )
+        self._only_one_empty_row: bool = only_one_empty_row
+        self._rows: List[List[str]] = []
+        self._counts: Dict[int, Counter] = {column: Counter() for column in self._no_duplicates}
+        self._duplicates: int = 0
+        self._invalid_rows: Set[int] = set()
+        self._search_index: Optional[SearchIndex] = None
+
+        # Add the empty row if required.
+        self.set_rows(())
+
+    # ================== #
+    # Overridden methods #
+    # ================== #
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Overridden rowCount method.
+
+        :param PySide6.QtCore.QModelIndex parent: The parent index, invalid for a table.
+        :returns: The number of rows.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Overridden columnCount method.
+
+        :param PySide6.QtCore.QModelIndex parent: The parent index, invalid for a table.
+        :returns: The number of columns.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._header_texts)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """
+        Overridden headerData method.
+
+        :param int section: The header section.
+        :param PySide6.QtCore.Qt.Orientation orientation: The header orientation.
+        :param int role: The data role. By default, Qt.DisplayRole.
+        :returns: The header text of the column, or None.
+        :rtype: Any
+        """
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._header_texts[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """
+        Overridden data method.
+        The duplicate values and the invalid rows are displayed with the theme's invalid color.
+
+        :param PySide6.QtCore.QModelIndex index: The index of the cell.
+        :param int role: The data role. By default, Qt.DisplayRole.
+        :returns: The data of the cell for the given role, or None.
+        :rtype: Any
+        """
+
+        # Return the value of the cell, the shortcuts being displayed uppercase.
+        value: str = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return value.upper() if index.column() in self._editable_columns else value
+        if role == Qt.EditRole:
+            return value
+
+        # Return the invalid color for the duplicates and the invalid rows.
+        if role == Qt.BackgroundRole and (
+                self.is_duplicate(index.row(), index.column()) or index.row() in self._invalid_rows
+        ):
+            return QColor(STYLE["Custom"]["invalid-color"])
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        """
+        Overridden setData method.
+        Update the indexes from the edited row only, and add an empty row if the last one got filled.
+
+        :param PySide6.QtCore.QModelIndex index: The index of the edited cell.
+        :param Any value: The new value of the cell.
+        :param int role: The data role. By default, Qt.EditRole.
+        :returns: True if the cell got edited.
+        :rtype: bool
+        """
+
+        # Ignore the unchanged cells.
+        row: int = index.row()
+        if role != Qt.EditRole or not index.isValid() or self._rows[row][index.column()] == str(value):
+            return False
+
+        # Update the row along with the indexes.
+        column: int = index.column()
+        previous_key: str = self._rows[row][column].lower()
+        self._unindex_row(row)
+        self._rows[row][column] = str(value)
+        self._index_row(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+        #   If the previous or the new value is shared with other rows, their duplicate state may have
+        # changed: notify the whole column, the view only repainting its visible cells.
+        if column in self._counts and (
+                self._counts[column][previous_key] or self._counts[column][str(value).lower()] > 1
+        ):
+            self.dataChanged.emit(self.index(0, column), self.index(len(self._rows) - 1, column), [Qt.BackgroundRole])
+
+        # Keep an empty row at the end if required.
+        if self._only_one_empty_row and row == len(self._rows) - 1 and any(self._rows[row]):
+            self._append_row([""] * self.columnCount())
+
+        # Notify the edited row.
+        self.row_edited.emit(row)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """
+        Overridden flags method.
+
+        :param PySide6.QtCore.QModelIndex index: The index of the cell.
+        :returns: The flags of the cell, editable for the editable columns.
+        :rtype: PySide6.QtCore.Qt.ItemFlag
+        """
+        flags: Qt.ItemFlag = super().flags(index)
+        return flags | Qt.ItemIsEditable if index.column() in self._editable_columns else flags
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def set_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Replace every row of the model, rebuilding the indexes once.
+
+        :param rows: The rows of values.
+        :type rows: Iterable[Sequence[str]]
+        """
+
+        # Replace the rows and rebuild the indexes.
+        self.beginResetModel()
+        self._rows = [list(row) for row in rows]
+        if self._only_one_empty_row:
+            self._rows.append([""] * self.columnCount())
+        for counts in self._counts.values():
+            counts.clear()
+        self._duplicates = 0
+        self._invalid_rows.clear()
+        self._search_index = None
+        for row in range(len(self._rows)):
+            self._index_row(row)
+        self.endResetModel()
+
+    def remove_row(self, row: int) -> None:
+        """
+        Remove the given row, except the empty row kept at the end.
+
+        :param int row: The index of the row to remove.
+        """
+
+        # Ignore the empty row kept at the end.
+        if self._only_one_empty_row and row == len(self._rows) - 1:
+            return
+
+        # Remove the row, shifting the invalid rows and the searched rows after it.
+        self._unindex_row(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._invalid_rows = {invalid_row - (invalid_row > row) for invalid_row in self._invalid_rows}
+        if self._search_index is not None:
+            self._search_index.remove(len(self._rows))
+            for shifted_row in range(row, len(self._rows)):
+                self._search_index.update(shifted_row, *self._rows[shifted_row])
+        self.endRemoveRows()
+
+        # Notify the cells whose duplicate state may have changed.
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, self.columnCount() - 1))
+        self.row_edited.emit(row)
+
+    def row(self, row: int) -> Tuple[str, ...]:
+        """
+        Return the values of the given row.
+
+        :param int row: The index of the row.
+        :returns: The values of the row.
+        :rtype: Tuple[str, ...]
+        """
+        return tuple(self._rows[row])
+
+    def is_duplicate(self, row: int, column: int) -> bool:
+        """
+        Return True if the given cell's value is duplicated within its column without duplicates.
+
+        :param int row: The row of the cell.
+        :param int column: The column of the cell.
+        :returns: True if the cell's value is a duplicate.
+        :rtype: bool
+        """
+        key: str = self._rows[row][column].lower()
+        return column in self._counts and bool(key) and self._counts[column][key] > 1
+
+    def search(self, query: str) -> Set[int]:
+        """
+        Return the indexes of the rows with a value containing each word of the given query, case-insensitively.
+        The search index is built on the first search, then kept up to date along with the rows.
+
+        :param str query: The text to search.
+        :returns: The indexes of the matching rows.
+        :rtype: Set[int]
+        """
+
+        # Build the search index if needed, then search it.
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            for row, values in enumerate(self._rows):
+                self._search_index.update(row, *values)
+        return self._search_index.search(query)
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _index_row(self, row: int) -> None:
+        """
+        Add the given row's values to the duplicates index and to the search index, if built, and check its validity.
+
+        :param int row: The index of the row.
+        """
+
+        # Count the values, an empty value never being a duplicate.
+        for column, counts in self._counts.items():
+            key: str = self._rows[row][column].lower()
+            if key:
+                counts[key] += 1
+                self._duplicates += counts[key] == 2
+
+        # Update the row within the search index, if built.
+        if self._search_index is not None:
+            self._search_index.update(row, *self._rows[row])
+
+        # Check the validity of the row, the empty row kept at the end being valid.
+        if self._validity_function is not None and not self._is_trailing_empty_row(row) and \
+                not self._validity_function(*self._rows[row]):
+            self._invalid_rows.add(row)
+
+    def _unindex_row(self, row: int) -> None:
+        """
+        Remove the given row's values from the duplicates index and from the invalid rows.
+
+        :param int row: The index of the row.
+        """
+
+        # Uncount the values.
+        for column, counts in self._counts.items():
+            key: str = self._rows[row][column].lower()
+            if key:
+                self._duplicates -= counts[key] == 2
+                counts[key] -= 1
+                if not counts[key]:
+                    del counts[key]
+
+        # Forget the row's validity.
+        self._invalid_rows.discard(row)
+
+    def _append_row(self, values: List[str]) -> None:
+        """
+        Append the given row.
+
+        :param values: The values of the row.
+        :type values: List[str]
+        """
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
+        self._rows.append(values)
+        self._index_row(len(self._rows) - 1)
+        self.endInsertRows()
+
+    def _is_trailing_empty_row(self, row: int) -> bool:
+        """
+        Return True if the given row is the empty row kept at the end.
+
+        :param int row: The index of the row.
+        :returns: True if the row is the empty row kept at the end.
+        :rtype: bool
+        """
+        return self._only_one_empty_row and row == len(self._rows) - 1 and not any(self._rows[row])
+
+    # ============== #
+    # Getter methods #
+    # ============== #
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Getter method for the validity of the whole model, from the indexes.
+
+        :returns: True if there is neither duplicate nor invalid row.
+        :rtype: bool
+        """
+        return not self._duplicates and not self._invalid_rows
+
+    @property
+    def rows_content(self) -> List[Tuple[str, ...]]:
+        """
+        Getter method for the values of every row, except the empty row kept at the end.
+
+        :returns: The values of every row.
+        :rtype: List[Tuple[str, ...]]
+        """
+        return [tuple(row) for index, row in enumerate(self._rows) if not self._is_trailing_empty_row(index)]
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------------= #
+# ShortcutDelegate class #
+# =--------------------= #
+
+class ShortcutDelegate(QStyledItemDelegate):
+    """
+    Shortcut Delegate class painting the shortcut cells as text, and creating a
+    QPushButtonShortcut editor, capturing its shortcut right away, only for the
+    cell being edited.
+    """
+
+    # =================== #
+    # Initializer methods #
+    # =================== #
+
+    def __init__(self, mouse_buttons_columns: Collection[int] = (), parent: Optional[QWidget] = None) -> None:
+        """
+        Initializer method.
+
+        :param mouse_buttons_columns: The numbers, starting at 1, of the columns accepting the mouse buttons.
+        :type mouse_buttons_columns: Collection[int]
+        :param parent: The optional parent of the ShortcutDelegate. By default, None.
+        :type parent: QWidget or None
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Set the straight-forward attribute.
+        self._mouse_buttons_columns: Set[int] = {column - 1 for column in mouse_buttons_columns}
+
+    # ================== #
+    # Overridden methods #
+    # ================== #
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        """
+        Overridden createEditor method.
+        Create a QPushButtonShortcut capturing its shortcut once shown, committing it once captured.
+
+        :param QWidget parent: The parent of the editor.
+        :param PySide6.QtWidgets.QStyleOptionViewItem option: The style options of the cell.
+        :param PySide6.QtCore.QModelIndex index: The index of the edited cell.
+        :returns: The editor.
+        :rtype: QWidget
+        """
+
+        # Create the editor, committing the captured shortcut and closing itself.
+        editor: QPushButtonShortcut = QPushButtonShortcut(
+            parent=parent,
+            text=index.data(Qt.EditRole),
+            allow_mouse_buttons=index.column() in self._mouse_buttons_columns
+        )
+        editor.shortcut_changed.connect(lambda _shortcut, editor_=editor: self._commit_and_close(editor_))
+
+        # Capture the shortcut once the editor is shown.
+        QTimer.singleShot(0, editor.capture)
+        return editor
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        """
+        Overridden setEditorData method.
+
+        :param QWidget editor: The QPushButtonShortcut editor.
+        :param PySide6.QtCore.QModelIndex index: The index of the edited cell.
+        """
+        editor.shortcut = index.data(Qt.EditRole)
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex) -> None:
+        """
+        Overridden setModelData method.
+
+        :param QWidget editor: The QPushButtonShortcut editor.
+        :param PySide6.QtCore.QAbstractItemModel model: The model of the edited cell.
+        :param PySide6.QtCore.QModelIndex index: The index of the edited cell.
+        """
+        if editor.shortcut:
+            model.setData(index, editor.shortcut, Qt.EditRole)
+
+    # ============== #
+    # Private method #
+    # ============== #
+
+    def _commit_and_close(self, editor: QPushButtonShortcut) -> None:
+        """
+        Commit the editor's captured shortcut to the model and close the editor.
+
+        :param QPushButtonShortcut editor: The QPushButtonShortcut editor.
+        """
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QStyledItemDelegate.NoHint)
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-----------------= #
+# ShortcutTable class #
+# =-----------------= #
+
+class ShortcutTable(QTableView):
+    """
+    Shortcut Table class displaying a ShortcutTableModel through a ShortcutDelegate.
+    Only the visible rows are painted, whatever the number of mappings.
+    The rows can be removed with the Delete key when the table has an empty row to add new ones.
+    The rows can be filtered by a search text, only the rows whose visibility changed being updated.
+    """
+
+    # =================== #
+    # Initializer methods #
+    # =================== #
+
+    def __init__(
+            self,
+            header_texts: Sequence[str],
+            rows: Iterable[Sequence[str]] = (),
+            no_duplicates: Collection[int] = (),
+            validity_function: Optional[Callable[..., bool]] = None,
+            editable_columns: Optional[Collection[int]] = None,
+            mouse_buttons_columns: Collection[int] = (),
+            only_one_empty_row: bool = False,
+            parent: Optional[QWidget] = None
+    ) -> None:
+        """
+        Initializer method.
+
+        :param header_texts: The header text of each column.
+        :type header_texts: Sequence[str]
+        :param rows: The initial rows of values. By default, none.
+        :type rows: Iterable[Sequence[str]]
+        :param no_duplicates: The numbers, starting at 1, of the columns without duplicates. By default, none.
+        :type no_duplicates: Collection[int]
+        :param validity_function: The optional function returning True if the values of a row are valid.
+        :type validity_function: Callable[..., bool] or None
+        :param editable_columns: The numbers, starting at 1, of the editable columns. By default, every column.
+        :type editable_columns: Collection[int] or None
+        :param mouse_buttons_columns: The numbers, starting at 1, of the columns accepting the mouse buttons.
+        :type mouse_buttons_columns: Collection[int]
+        :param bool only_one_empty_row: If True, keep exactly one empty row at the end for adding new rows.
+        :param parent: The optional parent of the ShortcutTable. By default, None.
+        :type parent: QWidget or None
+        """
+
+        # Call the super class's initializer method.
+        super().__init__(parent)
+
+        # Create the model and the delegate.
+        self._model: ShortcutTableModel = ShortcutTableModel(
+            header_texts=header_texts,
+            no_duplicates=no_duplicates,
+            validity_function=validity_function,
+            editable_columns=editable_columns,
+            only_one_empty_row=only_one_empty_row,
+            parent=self
+        )
+        self._model.set_rows(rows)
+        self._delegate: ShortcutDelegate = ShortcutDelegate(mouse_buttons_columns, self)
+        self._only_one_empty_row: bool = only_one_empty_row
+        self._filter_text: str = ""
+        self._visible_rows: Optional[Set[int]] = None
+
+        # Initialize the UI.
+        self._init_ui()
+
+    def _init_ui(self) -> None:
+        """Initialize the UI of the ShortcutTable instance itself."""
+
+        # Set the object name selecting the ShortcutTable within the application-wide stylesheet.
+        self.setObjectName("shortcut_table")
+
+        # Set the model and the delegate.
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+
+        #   Stretch the columns and give every row the same fixed height,
+        # so the view never measures the rows' content.
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(32)
+        self.verticalHeader().hide()
+
+        # Edit a single cell at once, scrolling per pixel.
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed
+        )
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Keep the filtered rows up to date as the rows get replaced, added or removed.
+        self._model.modelReset.connect(self._model_reset)
+        self._model.rowsInserted.connect(self._rows_inserted)
+        self._model.rowsRemoved.connect(self._rows_removed)
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """
+        Overridden keyPressEvent method.
+        Remove the current row when the Delete key is pressed, if the rows can be added.
+
+        :param event: The QKeyEvent received.
+        :type event: QKeyEvent
+        """
+        if self._only_one_empty_row and event.key() == Qt.Key_Delete and self.currentIndex().isValid():
+            self._model.remove_row(self.currentIndex().row())
+        else:
+            super().keyPressEvent(event)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def set_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Replace every row of the ShortcutTable.
+
+        :param rows: The rows of values.
+        :type rows: Iterable[Sequence[str]]
+        """
+        self._model.set_rows(rows)
+
+    def filter(self, text: str) -> None:
+        """
+        Show only the rows with a value containing the given text, case-insensitively, along
+        with the empty row kept at the end. An empty text shows every row. Only the rows whose
+        visibility changed since the previous filter are shown or hidden.
+
+        :param str text: The text to search.
+        """
+
+        # Retrieve the matching rows, every row matching an empty text.
+        self._filter_text = text.strip()
+        visible_rows: Optional[Set[int]] = self._model.search(self._filter_text) if self._filter_text else None
+        if visible_rows is not None and self._only_one_empty_row:
+            visible_rows.add(self._model.rowCount() - 1)
+
+        #   Retrieve the rows whose visibility changed, every row being visible without
+        # filter. Only entering or leaving the unfiltered state visits every row.
+        shown_rows: Set[int] = set()
+        hidden_rows: Set[int] = set()
+        if self._visible_rows is None and visible_rows is not None:
+            hidden_rows = set(range(self._model.rowCount())) - visible_rows
+        elif self._visible_rows is not None and visible_rows is None:
+            shown_rows = set(range(self._model.rowCount())) - self._visible_rows
+        elif self._visible_rows is not None and visible_rows is not None:
+            shown_rows = visible_rows - self._visible_rows
+            hidden_rows = self._visible_rows - visible_rows
+
+        # Update the visibility of these rows only.
+        for row in shown_rows:
+            self.setRowHidden(row, False)
+        for row in hidden_rows:
+            self.setRowHidden(row, True)
+        self._visible_rows = visible_rows
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _model_reset(self) -> None:
+        """Callback method when the rows got replaced, every row being visible again, filtering them again."""
+        self._visible_rows = None
+        if self._filter_text:
+            self.filter(self._filter_text)
+
+    def _rows_inserted(self, _parent: QModelIndex, first: int, last: int) -> None:
+        """
+        Callback method when rows got inserted, keeping them visible until the next filter.
+
+        :param PySide6.QtCore.QModelIndex _parent: The parent index, invalid for a table.
+        :param int first: The index of the first inserted row.
+        :param int last: The index of the last inserted row.
+        """
+        if self._visible_rows is not None:
+            count: int = last - first + 1
+            self._visible_rows = {row + count * (row >= first) for row in self._visible_rows}
+            self._visible_rows.update(range(first, last + 1))
+
+    def _rows_removed(self, _parent: QModelIndex, first: int, last: int) -> None:
+        """
+        Callback method when rows got removed, shifting the visible rows after them.
+
+        :param PySide6.QtCore.QModelIndex _parent: The parent index, invalid for a table.
+        :param int first: The index of the first removed row.
+        :param int last: The index of the last removed row.
+        """
+        if self._visible_rows is not None:
+            count: int = last - first + 1
+            self._visible_rows = {
+                row - count * (row > last) for row in self._visible_rows if not first <= row <= last
+            }
+
+    # ============== #
+    # Getter methods #
+    # ============== #
+
+    @property
+    def rows_content(self) -> List[Tuple[str, ...]]:
+        """
+        Getter method for the values of every row, except the empty row kept at the end.
+
+        :returns: The values of every row.
+        :rtype: List[Tuple[str, ...]]
+        """
+        return self._model.rows_content
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Getter method for the validity of the ShortcutTable's content.
+
+        :returns: True if there is neither duplicate nor invalid row.
+        :rtype: bool
+        """
+        return self._model.is_valid
+
+# =---------------------------------------------------------------------------------------------------------= #
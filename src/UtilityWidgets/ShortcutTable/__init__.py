@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    __init__.py file of the ShortcutTable widget.
+    Allow importing the ShortcutTable and ShortcutTableModel
+    classes directly from the ShortcutTable directory.
+"""
+
+# Allow importing the ShortcutTable and ShortcutTableModel
+# classes directly from the ShortcutTable directory.
+from .ShortcutTable import ShortcutTable, ShortcutTableModel
@@ -5,16 +5,19 @@
 """
     __init__.py file of the UtilityWidgets directory.
     Allow importing the QConfigList, QPushButtonShortcut,
-    SettingsHeaderWidget and YesNoCancelDialog classes as well
-    as the AddRemoveEditEnum and YesNoCancelEnum enum directly
-    from the UtilityWidgets directory.
+    SettingsHeaderWidget, ShortcutTable, ShortcutTableModel and
+    YesNoCancelDialog classes as well as the AddRemoveEditEnum
+    and YesNoCancelEnum enum directly from the UtilityWidgets
+    directory.
 """
 
 # Allow importing the QConfigList, QPushButtonShortcut,
-# SettingsHeaderWidget and YesNoCancelDialog classes as well
-# as the AddRemoveEditEnum and YesNoCancelEnum enum directly
-# from the UtilityWidgets directory.
+# SettingsHeaderWidget, ShortcutTable, ShortcutTableModel and
+# YesNoCancelDialog classes as well as the AddRemoveEditEnum
+# and YesNoCancelEnum enum directly from the UtilityWidgets
+# directory.
 from .QConfigList          import AddRemoveEditEnum, QConfigList
 from .QPushButtonShortcut  import QPushButtonShortcut
 from .SettingsHeaderWidget import SettingsHeaderWidget
+from .ShortcutTable        import ShortcutTable, ShortcutTableModel
 from .YesNoCancelDialog    import YesNoCancelDialog, YesNoCancelEnum
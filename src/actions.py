@@ -0,0 +1,1065 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    actions executed by the hotkeys and the custom
+    shortcuts of the HotClick software.
+    Every binding is compiled once, when the hotkeys
+    routine starts, into an action object from the
+    factory registered for its type, so pressing a
+    hotkey only looks its action up and executes it.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing        import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from functools     import partial
+from pynput.mouse  import Button, Controller
+from src.scheduler import SCHEDULER, ScheduledRun, TokenBucket, periodic_steps
+from src.pixels    import PixelCondition
+import keyboard
+import time
+import src.logger  as logger
+
+# =-----------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Mouse buttons by name, as written within the bindings.
+BUTTONS: Dict[str, Button] = {"left": Button.left, "right": Button.right, "middle": Button.middle}
+
+# Mouse buttons by Qt name, as captured for the custom shortcuts (e.g.: "LeftButton").
+QT_BUTTONS: Dict[str, Button] = {"LeftButton": Button.left, "RightButton": Button.right, "MiddleButton": Button.middle}
+
+# Interval, in seconds, between two checks of the trigger key while an action waits for its release.
+RELEASE_POLL_INTERVAL: float = 0.005
+
+#   Default time, in seconds, given to the cursor to arrive after being moved before a button is pressed,
+# until the click timing gets calibrated for the mouse backend and screen setup in use.
+DEFAULT_CLICK_DELAY: float = 0.005
+
+# Maximum number of clicks per second of a single auto-clicker.
+MAX_AUTO_CLICK_RATE: float = 500
+
+#   Clicks per second shared by every running auto-clicker, along with the largest burst,
+# so several auto-clickers at once can't flood the system nor starve the keyboard hook.
+AUTO_CLICK_BUDGET: TokenBucket = TokenBucket(rate=500, capacity=25)
+
+# =-------------------------------------------------------------------------------------------------= #
+
+
+# =----------------= #
+# InputBackend class #
+# =----------------= #
+
+class InputBackend:
+    """
+    Input Backend class through which the actions simulate the mouse and keyboard inputs.
+    The trigger is the key whose press is being handled, the held actions waiting for its release.
+    Pressing a button right after moving the cursor first waits for the click delay since the move,
+    the time the cursor takes to arrive, as calibrated for the mouse backend and screen setup.
+    """
+
+    __slots__ = ("mouse", "trigger", "click_delay", "_moved_at")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+
+        # Initialize the straight-forward attributes.
+        self.mouse: Controller = Controller()
+        self.trigger: Optional[str] = None
+        self.click_delay: float = DEFAULT_CLICK_DELAY
+        self._moved_at: float = 0.0
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def trigger_pressed(self) -> bool:
+        """
+        Return True if the key whose press is being handled is still pressed.
+
+        :returns: True if the trigger key is pressed.
+        :rtype: bool
+        """
+        return self.trigger is not None and self.is_pressed(self.trigger)
+
+    def wait_trigger_release(self) -> None:
+        """Wait for the key whose press is being handled to be released."""
+        while self.trigger_pressed():
+            time.sleep(RELEASE_POLL_INTERVAL)
+
+    def move(self, position: Tuple[int, int]) -> None:
+        """
+        Move the cursor to the given position, keeping in memory when for the next button press to wait for it.
+
+        :param position: The coordinates to move the cursor to.
+        :type position: Tuple[int, int]
+        """
+        self.mouse.position = position
+        self._moved_at = time.perf_counter()
+
+    def settle(self) -> None:
+        """Wait for the cursor to arrive, until the click delay since the last move is elapsed."""
+        deadline: float = self._moved_at + self.click_delay
+        if time.perf_counter() < deadline:
+            SCHEDULER.wait_until(deadline)
+
+    def click(self, button: Button, count: int = 1) -> None:
+        """
+        Click the given mouse button once the cursor arrived.
+
+        :param pynput.mouse.Button button: The mouse button to click.
+        :param int count: The number of clicks. By default, 1.
+        """
+        self.settle()
+        self.mouse.click(button, count)
+
+    def press(self, button: Button) -> None:
+        """
+        Press the given mouse button once the cursor arrived.
+
+        :param pynput.mouse.Button button: The mouse button to press.
+        """
+        self.settle()
+        self.mouse.press(button)
+
+    def release(self, button: Button) -> None:
+        """
+        Release the given mouse button once the cursor arrived.
+
+        :param pynput.mouse.Button button: The mouse button to release.
+        """
+        self.settle()
+        self.mouse.release(button)
+
+    @staticmethod
+    def is_pressed(key: str) -> bool:
+        """
+        Return True if the given key is pressed.
+
+        :param str key: The key to check.
+        :returns: True if the key is pressed.
+        :rtype: bool
+        """
+        return keyboard.is_pressed(key)
+
+    @staticmethod
+    def tap(key: str) -> None:
+        """
+        Press and release the given key or key combination (e.g.: "ctrl+c").
+
+        :param str key: The key or key combination to tap.
+        """
+        keyboard.send(key)
+
+# =----------------------------------------------------------------------------------------------= #
+
+
+# =----------= #
+# Action class #
+# =----------= #
+
+class Action:
+    """
+    Action class, the base class of every action a hotkey or a custom shortcut can execute.
+    The actions are compiled once from their binding, holding nothing but prebuilt values.
+    """
+
+    __slots__ = ()
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "Action":
+        """
+        Return the action compiled from the given binding.
+        Raise a KeyError or a ValueError if the binding lacks a value or holds an invalid one.
+        This method should be overridden in child classes.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: Action
+        """
+        raise NotImplementedError
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+        This method should be overridden in child classes.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        raise NotImplementedError
+
+# =----------------------------------------------------------------------------------------------= #
+
+
+# =----------------------= #
+# Action utility functions #
+# =----------------------= #
+
+def binding_target(binding: Mapping[str, Any]) -> Tuple[int, int]:
+    """
+    Return the screen coordinates a hotkey's binding targets, at the center of its circle.
+
+    :param binding: The binding of the hotkey.
+    :type binding: Mapping[str, Any]
+    :returns: The targeted coordinates.
+    :rtype: Tuple[int, int]
+    """
+    return int(binding['x']) - int(int(binding['w']) / 2), int(binding['y']) - int(int(binding['h']) / 2)
+
+
+def binding_button(binding: Mapping[str, Any], default: str = "left") -> Button:
+    """
+    Return the mouse button of the given binding, raising a ValueError if it is unknown.
+
+    :param binding: The binding holding the optional "button" value.
+    :type binding: Mapping[str, Any]
+    :param str default: The name of the button if the binding has none. By default, "left".
+    :returns: The mouse button.
+    :rtype: pynput.mouse.Button
+    """
+    name: str = str(binding.get("button", default)).lower()
+    if name not in BUTTONS:
+        raise ValueError(f"Unknown mouse button \"{name}\"")
+    return BUTTONS[name]
+
+# =---------------------------------------------------------------------------------------------------= #
+
+
+# =------------------= #
+# Mouse action classes #
+# =------------------= #
+
+class ClickAction(Action):
+    """
+    Click Action class clicking a mouse button one or several times.
+    When it targets a position, the mouse follows the target while the trigger key is held,
+    then clicks once it is released and goes back. Otherwise, it clicks where the mouse is.
+    """
+
+    __slots__ = ("position", "button", "count")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, position: Optional[Tuple[int, int]], button: Button = Button.left, count: int = 1) -> None:
+        """
+        Initializer method.
+
+        :param position: The optional coordinates to click at, or None to click where the mouse is.
+        :type position: Tuple[int, int] or None
+        :param pynput.mouse.Button button: The mouse button to click. By default, the left one.
+        :param int count: The number of clicks. By default, 1.
+        """
+        self.position: Optional[Tuple[int, int]] = position
+        self.button: Button = button
+        self.count: int = count
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any], button: str = "left", count: int = 1) -> "ClickAction":
+        """
+        Return the action compiled from the given binding.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :param str button: The name of the button, if the binding has none. By default, "left".
+        :param int count: The number of clicks. By default, 1.
+        :returns: The compiled action.
+        :rtype: ClickAction
+        """
+        return cls(binding_target(binding), binding_button(binding, button), count)
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+
+        # Click where the mouse is if no position is targeted.
+        if self.position is None:
+            backend.click(self.button, self.count)
+            return
+
+        #   Follow the target while the trigger key is held, clicking only if it was held,
+        # sleeping between the checks rather than keeping the keyboard hook's thread busy.
+        original_position: Tuple[int, int] = backend.mouse.position
+        pressed: bool = False
+        while backend.trigger_pressed():
+            pressed = True
+            backend.move(self.position)
+            time.sleep(RELEASE_POLL_INTERVAL)
+
+        # Click once the cursor arrived, then move the mouse back to its original position.
+        if pressed:
+            backend.click(self.button, self.count)
+            backend.mouse.position = original_position
+
+
+class MoveAction(Action):
+    """Move Action class moving the mouse to a position."""
+
+    __slots__ = ("position",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, position: Tuple[int, int]) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates to move the mouse to.
+        :type position: Tuple[int, int]
+        """
+        self.position: Tuple[int, int] = position
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "MoveAction":
+        """
+        Return the action compiled from the given binding.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: MoveAction
+        """
+        return cls(binding_target(binding))
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        backend.move(self.position)
+
+
+class HoldAction(Action):
+    """Hold Action class holding a mouse button down at a position until the trigger key is released."""
+
+    __slots__ = ("position", "button")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, position: Tuple[int, int], button: Button = Button.left) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates to hold the button at.
+        :type position: Tuple[int, int]
+        :param pynput.mouse.Button button: The mouse button to hold. By default, the left one.
+        """
+        self.position: Tuple[int, int] = position
+        self.button: Button = button
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "HoldAction":
+        """
+        Return the action compiled from the given binding.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: HoldAction
+        """
+        return cls(binding_target(binding), binding_button(binding))
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        original_position: Tuple[int, int] = backend.mouse.position
+        backend.move(self.position)
+        backend.press(self.button)
+        try:
+            backend.wait_trigger_release()
+        finally:
+            backend.mouse.release(self.button)
+            backend.mouse.position = original_position
+
+
+class ScrollAction(Action):
+    """Scroll Action class scrolling the mouse wheel at a position."""
+
+    __slots__ = ("position", "dx", "dy")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, position: Tuple[int, int], dx: int, dy: int) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates to scroll at.
+        :type position: Tuple[int, int]
+        :param int dx: The horizontal scroll steps.
+        :param int dy: The vertical scroll steps, positive upwards.
+        """
+        self.position: Tuple[int, int] = position
+        self.dx: int = dx
+        self.dy: int = dy
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "ScrollAction":
+        """
+        Return the action compiled from the given binding, scrolling one step down by default.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: ScrollAction
+        """
+        return cls(binding_target(binding), int(binding.get("dx", 0)), int(binding.get("dy", -1)))
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        original_position: Tuple[int, int] = backend.mouse.position
+        backend.move(self.position)
+        backend.settle()
+        backend.mouse.scroll(self.dx, self.dy)
+        backend.mouse.position = original_position
+
+
+class DragAction(Action):
+    """Drag Action class dragging with a mouse button held from a position to another one."""
+
+    __slots__ = ("position", "destination", "button")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, position: Tuple[int, int], destination: Tuple[int, int], button: Button = Button.left) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates to start dragging from.
+        :type position: Tuple[int, int]
+        :param destination: The coordinates to drop at.
+        :type destination: Tuple[int, int]
+        :param pynput.mouse.Button button: The mouse button to drag with. By default, the left one.
+        """
+        self.position: Tuple[int, int] = position
+        self.destination: Tuple[int, int] = destination
+        self.button: Button = button
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "DragAction":
+        """
+        Return the action compiled from the given binding, dropping at its "to_x" and "to_y" screen coordinates.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: DragAction
+        """
+        return cls(binding_target(binding), (int(binding["to_x"]), int(binding["to_y"])), binding_button(binding))
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        original_position: Tuple[int, int] = backend.mouse.position
+        backend.move(self.position)
+        backend.press(self.button)
+        try:
+            backend.move(self.destination)
+        finally:
+            backend.release(self.button)
+            backend.mouse.position = original_position
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------------= #
+# Keyboard action class #
+# =-------------------= #
+
+class KeyTapAction(Action):
+    """Key Tap Action class pressing and releasing a key or a key combination."""
+
+    __slots__ = ("key",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, key: str) -> None:
+        """
+        Initializer method.
+
+        :param str key: The key or key combination to tap (e.g.: "ctrl+c").
+        """
+        self.key: str = key
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "KeyTapAction":
+        """
+        Return the action compiled from the given binding.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: KeyTapAction
+        """
+        key: str = str(binding["key"]).lower()
+        if not key:
+            raise ValueError("The key to tap is empty")
+        return cls(key)
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        backend.tap(self.key)
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =---------------------= #
+# Sequence action classes #
+# =---------------------= #
+
+class TriggerWatch:
+    """
+    Trigger Watch class telling whether a running sequence must stop because its trigger key got released.
+    It also keeps in memory whether the trigger key got released since the sequence started, so holding the
+    key, whose press gets repeated by the system, isn't mistaken for pressing it again.
+    """
+
+    __slots__ = ("backend", "trigger", "cancel_on_release", "released")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, backend: InputBackend, trigger: Optional[str], cancel_on_release: bool) -> None:
+        """
+        Initializer method.
+
+        :param InputBackend backend: The backend checking the trigger key.
+        :param trigger: The trigger key, or None if the sequence has none.
+        :type trigger: str or None
+        :param bool cancel_on_release: If True, the sequence must stop once the trigger key is released.
+        """
+        self.backend: InputBackend = backend
+        self.trigger: Optional[str] = trigger
+        self.cancel_on_release: bool = cancel_on_release
+        self.released: bool = trigger is None
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def __call__(self) -> bool:
+        """
+        Return True if the sequence must stop, the trigger key having just been released.
+
+        :returns: True if the sequence must stop.
+        :rtype: bool
+        """
+        if self.released or self.backend.is_pressed(self.trigger):
+            return False
+        self.released = True
+        return self.cancel_on_release
+
+
+class SequenceAction(Action):
+    """
+    Sequence Action class, the base class of the actions running timed steps on the scheduler.
+    The sequence is cancelled by pressing its hotkey again, or, if required, by releasing it.
+    """
+
+    __slots__ = ("cancel_on_release",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, cancel_on_release: bool = False) -> None:
+        """
+        Initializer method.
+
+        :param bool cancel_on_release: If True, releasing the hotkey cancels the sequence. By default, False.
+        """
+        self.cancel_on_release: bool = cancel_on_release
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def scheduled_steps(self, backend: InputBackend) -> Iterable[Tuple[float, Callable[[], Optional[bool]]]]:
+        """
+        Return the steps to run, each one as its offset in seconds from the start and its function.
+        This method should be overridden in child classes.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        :returns: The steps to run.
+        :rtype: Iterable[Tuple[float, Callable[[], Optional[bool]]]]
+        """
+        raise NotImplementedError
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Start the sequence on the scheduler, or cancel it if the hotkey
+        got pressed again, after being released, while it is running.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+
+        #   Cancel the running sequence if its hotkey got released since it
+        # started, otherwise ignore the repeated presses of the held hotkey.
+        run: Optional[ScheduledRun] = SCHEDULER.get(self)
+        if run is not None:
+            if not isinstance(run.condition, TriggerWatch) or run.condition.released:
+                SCHEDULER.cancel(self)
+            return
+
+        # Start the sequence, watching the release of its hotkey.
+        SCHEDULER.start(
+            self, self.scheduled_steps(backend), TriggerWatch(backend, backend.trigger, self.cancel_on_release)
+        )
+
+
+class MacroAction(SequenceAction):
+    """Macro Action class running an ordered sequence of steps, each one at its offset from the start."""
+
+    __slots__ = ("steps",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, steps: Tuple[Tuple[float, Action], ...], cancel_on_release: bool = False) -> None:
+        """
+        Initializer method.
+
+        :param steps: The steps, each one as its offset in seconds from the start and its action.
+        :type steps: Tuple[Tuple[float, Action], ...]
+        :param bool cancel_on_release: If True, releasing the hotkey cancels the sequence. By default, False.
+        """
+        super().__init__(cancel_on_release)
+        self.steps: Tuple[Tuple[float, Action], ...] = steps
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "MacroAction":
+        """
+        Return the action compiled from the given binding, whose "steps" list holds the steps in order.
+        Each step has a "type" among the MACRO_STEP_TYPES ones and runs right after the previous one,
+        unless it has an "at" offset in milliseconds from the start. A "Wait" step delays the next ones
+        by its "ms" duration. The optional "cancel" value set to "release" makes releasing the hotkey
+        cancel the sequence.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: MacroAction
+        """
+
+        # Compile every step at its offset, the offsets never decreasing.
+        steps: List[Tuple[float, Action]] = []
+        offset: float = 0.0
+        for step in binding["steps"]:
+            if "at" in step:
+                if float(step["at"]) / 1000 < offset:
+                    raise ValueError(f"The step offset {step['at']} ms is before the previous steps")
+                offset = float(step["at"]) / 1000
+            if step["type"] == "Wait":
+                offset += float(step["ms"]) / 1000
+                continue
+            factory: Optional[Callable[[Mapping[str, Any]], Tuple[Action, ...]]] = MACRO_STEP_TYPES.get(step["type"])
+            if factory is None:
+                raise ValueError(f"Unknown step type \"{step['type']}\"")
+            steps.extend((offset, action) for action in factory(step))
+
+        # Build the action.
+        return cls(tuple(steps), binding.get("cancel") == "release")
+
+    def scheduled_steps(self, backend: InputBackend) -> Iterable[Tuple[float, Callable[[], Optional[bool]]]]:
+        """
+        Return the steps to run, each one as its offset in seconds from the start and its function.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        :returns: The steps to run.
+        :rtype: Iterable[Tuple[float, Callable[[], Optional[bool]]]]
+        """
+        return [(offset, partial(action.execute, backend)) for offset, action in self.steps]
+
+
+class AutoClickAction(SequenceAction):
+    """
+    Auto Click Action class clicking at a position at a target rate, while the hotkey is held or until it is
+    pressed again. The clicks are timed from the start of the sequence so the rate never drifts, and every
+    running auto-clicker takes its clicks from the AUTO_CLICK_BUDGET, the clicks beyond it being dropped.
+    """
+
+    __slots__ = ("position", "button", "interval")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(
+            self,
+            position: Tuple[int, int],
+            button: Button = Button.left,
+            rate: float = 20,
+            cancel_on_release: bool = True
+    ) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates to click at.
+        :type position: Tuple[int, int]
+        :param pynput.mouse.Button button: The mouse button to click. By default, the left one.
+        :param float rate: The target number of clicks per second. By default, 20.
+        :param bool cancel_on_release: If True, releasing the hotkey stops the clicks. By default, True.
+        """
+        super().__init__(cancel_on_release)
+        self.position: Tuple[int, int] = position
+        self.button: Button = button
+        self.interval: float = 1 / rate
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "AutoClickAction":
+        """
+        Return the action compiled from the given binding, clicking at its "cps" rate, up to MAX_AUTO_CLICK_RATE.
+        The clicks go on while the hotkey is held, or until it is pressed again if its "mode" is "toggle".
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: AutoClickAction
+        """
+        rate: float = float(binding.get("cps", 20))
+        if not 0 < rate <= MAX_AUTO_CLICK_RATE:
+            raise ValueError(f"The clicks rate must be between 0 and {MAX_AUTO_CLICK_RATE} per second")
+        return cls(binding_target(binding), binding_button(binding), rate, binding.get("mode", "hold") != "toggle")
+
+    def scheduled_steps(self, backend: InputBackend) -> Iterable[Tuple[float, Callable[[], Optional[bool]]]]:
+        """
+        Return the endless clicks, each one as its offset in seconds from the start and its function.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        :returns: The steps to run.
+        :rtype: Iterable[Tuple[float, Callable[[], Optional[bool]]]]
+        """
+        return periodic_steps(self.interval, partial(self._click, backend))
+
+    # ============== #
+    # Private method #
+    # ============== #
+
+    def _click(self, backend: InputBackend) -> bool:
+        """
+        Click at the position, if the AUTO_CLICK_BUDGET has a click left.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        :returns: True if the click got performed, False if it got dropped.
+        :rtype: bool
+        """
+        if not AUTO_CLICK_BUDGET.try_acquire():
+            return False
+        backend.move(self.position)
+        backend.click(self.button)
+        return True
+
+
+def _click_step(step: Mapping[str, Any]) -> Tuple[Action, ...]:
+    """
+    Return the actions of the given macro "Click" step, moving the mouse first if it has "x" and "y" coordinates.
+
+    :param step: The step to compile.
+    :type step: Mapping[str, Any]
+    :returns: The actions of the step.
+    :rtype: Tuple[Action, ...]
+    """
+    click: ClickAction = ClickAction(None, binding_button(step), int(step.get("count", 1)))
+    return (MoveAction((int(step["x"]), int(step["y"]))), click) if "x" in step and "y" in step else (click,)
+
+
+# Factories compiling a macro step into its actions, by step type, the "Wait" steps only delaying the next ones.
+MACRO_STEP_TYPES: Dict[str, Callable[[Mapping[str, Any]], Tuple[Action, ...]]] = {
+    "Move": lambda step: (MoveAction((int(step["x"]), int(step["y"]))),),
+    "Click": _click_step,
+    "Key Tap": lambda step: (KeyTapAction.from_binding(step),)
+}
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =------------------= #
+# Guarded action class #
+# =------------------= #
+
+class GuardedAction(Action):
+    """
+    Guarded Action class executing an action only if all its conditions are met when its hotkey is pressed,
+    each condition being a prebuilt predicate checked right before the action, in order, the first unmet
+    one skipping the action. A sequence in progress always gets its hotkey press, so it can be stopped
+    whatever its conditions (e.g.: toggling an auto-clicker off).
+    """
+
+    __slots__ = ("action", "conditions")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, action: Action, conditions: Tuple[Callable[[], bool], ...]) -> None:
+        """
+        Initializer method.
+
+        :param Action action: The guarded action.
+        :param conditions: The predicates to check before executing the action.
+        :type conditions: Tuple[Callable[[], bool], ...]
+        """
+        self.action: Action = action
+        self.conditions: Tuple[Callable[[], bool], ...] = conditions
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the guarded action through the given backend if all the conditions are met,
+        or right away if it is a sequence in progress, the press then stopping it.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+
+        # Skip the action as soon as a condition isn't met, unless it is a sequence in progress.
+        if SCHEDULER.get(self.action) is None:
+            for condition in self.conditions:
+                if not condition():
+                    logger.info("Action skipped, its condition not being met")
+                    return
+
+        # Execute the guarded action.
+        self.action.execute(backend)
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------= #
+# Action registry #
+# =-------------= #
+
+# Factories compiling a binding into an action, by binding type.
+ACTION_TYPES: Dict[str, Callable[[Mapping[str, Any]], Action]] = {}
+
+
+def register_action_type(name: str, factory: Callable[[Mapping[str, Any]], Action]) -> None:
+    """
+    Register the given factory as the one compiling the bindings of the given type.
+    Registering an already registered type replaces its factory.
+
+    :param str name: The binding type (e.g.: "Click").
+    :param factory: The function compiling a binding of such type into an action.
+    :type factory: Callable[[Mapping[str, Any]], Action]
+    """
+    ACTION_TYPES[name] = factory
+
+
+# Factories compiling a binding's optional condition into a predicate, by binding key.
+CONDITION_TYPES: Dict[str, Callable[[Mapping[str, Any]], Callable[[], bool]]] = {}
+
+
+def register_condition_type(key: str, factory: Callable[[Mapping[str, Any]], Callable[[], bool]]) -> None:
+    """
+    Register the given factory as the one compiling the conditions held by the bindings' given key.
+    Registering an already registered key replaces its factory.
+
+    :param str key: The binding key holding such conditions (e.g.: "pixel").
+    :param factory: The function compiling a binding holding such a condition into a predicate.
+    :type factory: Callable[[Mapping[str, Any]], Callable[[], bool]]
+    """
+    CONDITION_TYPES[key] = factory
+
+
+# Register the builtin action types.
+register_action_type("Click", ClickAction.from_binding)
+register_action_type("Right Click", lambda binding: ClickAction.from_binding(binding, "right"))
+register_action_type("Middle Click", lambda binding: ClickAction.from_binding(binding, "middle"))
+register_action_type("Double Click", lambda binding: ClickAction.from_binding(binding, count=2))
+register_action_type("Hold", HoldAction.from_binding)
+register_action_type("Scroll", ScrollAction.from_binding)
+register_action_type("Drag", DragAction.from_binding)
+register_action_type("Key Tap", KeyTapAction.from_binding)
+register_action_type("Move", MoveAction.from_binding)
+register_action_type("Macro", MacroAction.from_binding)
+register_action_type("Auto Click", AutoClickAction.from_binding)
+
+# Register the builtin condition types.
+register_condition_type(
+    "pixel", lambda binding: PixelCondition.from_binding(binding["pixel"], binding_target(binding)).matches
+)
+
+
+def compile_binding(binding: Mapping[str, Any]) -> Action:
+    """
+    Return the action compiled from the given hotkey's binding, a binding without type being a "Click" one,
+    guarded by the binding's optional conditions, if any (e.g.: its "pixel" one).
+    Raise a ValueError if its type is unknown, or if it lacks a value or holds an invalid one.
+
+    :param binding: The binding to compile.
+    :type binding: Mapping[str, Any]
+    :returns: The compiled action.
+    :rtype: Action
+    """
+
+    # Retrieve the factory of the binding's type.
+    factory: Optional[Callable[[Mapping[str, Any]], Action]] = ACTION_TYPES.get(binding.get("type", "Click"))
+    if factory is None:
+        raise ValueError(f"Unknown action type \"{binding.get('type')}\"")
+
+    #   Compile the binding along with its conditions, guarding the action only if the
+    # binding holds any, reporting any missing or invalid value as a ValueError.
+    try:
+        action: Action = factory(binding)
+        conditions: Tuple[Callable[[], bool], ...] = tuple(
+            condition_factory(binding) for key, condition_factory in CONDITION_TYPES.items() if key in binding
+        )
+        return GuardedAction(action, conditions) if conditions else action
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid \"{binding.get('type', 'Click')}\" binding: {e}") from e
+
+
+def compile_custom_shortcut(bind_to: str) -> Action:
+    """
+    Return the action compiled from the given custom shortcut's target, either a mouse
+    button (e.g.: "LeftButton" or "DoubleLeftButton") clicked where the mouse is, or a key
+    or key combination to tap.
+
+    :param str bind_to: The target of the custom shortcut.
+    :returns: The compiled action.
+    :rtype: Action
+    """
+
+    # Compile the mouse buttons, possibly double-clicked.
+    count: int = 2 if bind_to.startswith("Double") else 1
+    button: Optional[Button] = QT_BUTTONS.get(bind_to[len("Double"):] if count == 2 else bind_to)
+    if button is not None:
+        return ClickAction(None, button, count)
+
+    # Otherwise, compile the key or key combination.
+    return KeyTapAction.from_binding({"key": bind_to})
+
+
+def compile_dispatch_table(
+        hotkeys: Mapping[str, Mapping[str, Any]],
+        custom_shortcuts: Mapping[str, str]
+) -> Dict[str, Action]:
+    """
+    Return the table of the action to execute by lowercase hotkey, compiled from the given
+    hotkeys' bindings and custom shortcuts, a hotkey taking precedence over a custom shortcut.
+    The invalid bindings are reported and left out.
+
+    :param hotkeys: The bindings by hotkey.
+    :type hotkeys: Mapping[str, Mapping[str, Any]]
+    :param custom_shortcuts: The targets by custom shortcut.
+    :type custom_shortcuts: Mapping[str, str]
+    :returns: The action of each hotkey.
+    :rtype: Dict[str, Action]
+    """
+
+    # Compile the custom shortcuts, then the hotkeys over them.
+    dispatch_table: Dict[str, Action] = {}
+    for shortcut, bind_to in custom_shortcuts.items():
+        try:
+            dispatch_table[shortcut.lower()] = compile_custom_shortcut(bind_to)
+        except ValueError as e:
+            logger.error(f"Custom shortcut \"{shortcut.upper()}\" ignored: " + str(e))
+    for hotkey, binding in hotkeys.items():
+        try:
+            dispatch_table[hotkey.lower()] = compile_binding(binding)
+        except ValueError as e:
+            logger.error(f"Hotkey \"{hotkey.upper()}\" ignored: " + str(e))
+    return dispatch_table
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-----------= #
+# Input backend #
+# =-----------= #
+
+# The backend simulating the inputs of the actions.
+BACKEND: InputBackend = InputBackend()
+
+# =------------------------------------------= #
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the click
+    timing calibration used by the HotClick software.
+    The calibration moves the cursor through the mouse
+    backend, listens for the resulting motion events and
+    measures how long the cursor takes to arrive, the
+    click delay being the safe upper bound of such times.
+    A click delay is kept per mouse backend and screen
+    setup within the calibration.json file.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing       import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib      import Path
+from pynput.mouse import Listener
+from src.actions  import DEFAULT_CLICK_DELAY, InputBackend
+from src.utils    import PATH
+import json
+import math
+import statistics
+import threading
+import time
+import src.logger as logger
+import src.utils  as utils
+
+# =-----------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# File keeping the calibrated click timings by mouse backend and screen setup.
+CALIBRATION_FILE: Path = PATH / Path("calibration.json")
+
+# Number of cursor moves measured by a calibration.
+CALIBRATION_SAMPLES: int = 60
+
+# Distance, in pixels, the cursor is moved by back and forth from its position.
+CALIBRATION_OFFSET: int = 8
+
+# Distance, in pixels, under which a motion event is considered as reaching the target.
+CALIBRATION_TOLERANCE: int = 2
+
+# Time, in seconds, after which a move whose motion event isn't received is considered as lost.
+CALIBRATION_TIMEOUT: float = 0.25
+
+#   Percentile of the measured times the click delay is computed from, along with
+# the factor applied to it, so the cursor arrives in time even on a slower run.
+CALIBRATION_PERCENTILE: float = 0.99
+CALIBRATION_SAFETY_FACTOR: float = 1.5
+
+# Maximum click delay, in seconds, whatever the measured times.
+MAX_CLICK_DELAY: float = 0.05
+
+# Calibrated click timings, by setup key.
+CALIBRATIONS: Dict[str, Dict[str, float]] = {}
+
+# =-------------------------------------------------------------------------------------------------= #
+
+
+# =---------------------------= #
+# Calibration utility functions #
+# =---------------------------= #
+
+def setup_key(backend: InputBackend, screens: Iterable[Tuple[int, int, int, int, float]]) -> str:
+    """
+    Return the key of the given mouse backend and screen setup, the click timings depending on both.
+
+    :param InputBackend backend: The backend moving the cursor.
+    :param screens: The geometry of every screen, as (x, y, width, height, device pixel ratio) tuples.
+    :type screens: Iterable[Tuple[int, int, int, int, float]]
+    :returns: The setup key.
+    :rtype: str
+    """
+    return type(backend.mouse).__module__ + '|' + ';'.join(
+        f"{x},{y},{width}x{height}@{ratio:g}" for x, y, width, height, ratio in sorted(screens)
+    )
+
+
+def measure_latencies(
+        backend: InputBackend,
+        samples: int = CALIBRATION_SAMPLES,
+        timeout: float = CALIBRATION_TIMEOUT
+) -> Tuple[List[float], int]:
+    """
+    Move the cursor back and forth through the given backend and return the time, in seconds, each motion
+    event took to report the cursor at its target, along with the number of moves whose event got lost.
+    The cursor is moved back to its original position afterwards. It mustn't be moved meanwhile.
+
+    :param InputBackend backend: The backend moving the cursor.
+    :param int samples: The number of moves to measure. By default, CALIBRATION_SAMPLES.
+    :param float timeout: The time after which a move's event is considered as lost. By default, CALIBRATION_TIMEOUT.
+    :returns: The measured times and the number of lost events.
+    :rtype: Tuple[List[float], int]
+    """
+
+    # Report the first motion event reaching the target from the listener's thread.
+    target: List[Tuple[int, int]] = [(0, 0)]
+    arrived: threading.Event = threading.Event()
+
+    def on_move(x: float, y: float) -> None:
+        """Set the arrived event if the reported cursor position is the target."""
+        if abs(x - target[0][0]) <= CALIBRATION_TOLERANCE and abs(y - target[0][1]) <= CALIBRATION_TOLERANCE:
+            arrived.set()
+
+    # Move the cursor back and forth, measuring the time until each target is reported.
+    origin: Tuple[int, int] = tuple(int(axis) for axis in backend.mouse.position)
+    latencies: List[float] = []
+    lost: int = 0
+    with Listener(on_move=on_move) as listener:
+        listener.wait()
+        try:
+            for index in range(samples):
+                target[0] = (origin[0] + CALIBRATION_OFFSET * (index % 2 == 0), origin[1])
+                arrived.clear()
+                moved_at: float = time.perf_counter()
+                backend.mouse.position = target[0]
+                if arrived.wait(timeout):
+                    latencies.append(time.perf_counter() - moved_at)
+                else:
+                    lost += 1
+        finally:
+            backend.mouse.position = origin
+    return latencies, lost
+
+
+def calibrate(backend: InputBackend, key: str) -> Dict[str, float]:
+    """
+    Measure the times the cursor takes to arrive through the given backend, then store and apply the resulting
+    click delay for the given setup key. Raise a RuntimeError if too many motion events got lost.
+
+    :param InputBackend backend: The backend moving the cursor.
+    :param str key: The setup key, as returned by the setup_key function.
+    :returns: The calibration, made of the click delay and the distribution of the measured times, in seconds.
+    :rtype: Dict[str, float]
+    """
+
+    # Measure the times, requiring at least half the motion events to be received.
+    latencies: List[float]
+    lost: int
+    latencies, lost = measure_latencies(backend)
+    if len(latencies) < max(lost, 1):
+        raise RuntimeError(f"{lost} motion events out of {lost + len(latencies)} got lost")
+
+    # Compute the click delay from the high percentile of the times.
+    latencies.sort()
+    percentile: float = latencies[min(len(latencies), math.ceil(CALIBRATION_PERCENTILE * len(latencies))) - 1]
+    calibration: Dict[str, float] = {
+        "delay": min(percentile * CALIBRATION_SAFETY_FACTOR, MAX_CLICK_DELAY),
+        "min": latencies[0],
+        "median": statistics.median(latencies),
+        "percentile": percentile,
+        "max": latencies[-1],
+        "samples": len(latencies),
+        "lost": lost
+    }
+
+    # Store and apply the calibration.
+    CALIBRATIONS[key] = calibration
+    save_calibrations()
+    backend.click_delay = calibration["delay"]
+    return calibration
+
+
+def apply_calibration(backend: InputBackend, key: str) -> Optional[Dict[str, float]]:
+    """
+    Apply the click delay calibrated for the given setup key to the given backend, or the default one
+    if the setup isn't calibrated yet, and return the calibration, or None.
+
+    :param InputBackend backend: The backend to apply the click delay to.
+    :param str key: The setup key, as returned by the setup_key function.
+    :returns: The calibration of the setup, or None.
+    :rtype: Dict[str, float] or None
+    """
+    calibration: Optional[Dict[str, float]] = CALIBRATIONS.get(key)
+    backend.click_delay = calibration["delay"] if calibration is not None else DEFAULT_CLICK_DELAY
+    return calibration
+
+
+def load_calibrations() -> bool:
+    """
+    Load the CALIBRATION_FILE to the CALIBRATIONS dictionary
+    and return the boolean result of such a parsing.
+
+    :returns: The boolean result of the parsing
+    :rtype: bool
+    """
+
+    # If no setup got calibrated yet, return False.
+    if not CALIBRATION_FILE.exists():
+        return False
+
+    # Try to load the calibrations, keeping only the valid ones.
+    try:
+        with open(CALIBRATION_FILE) as calibration_file:
+            loaded_calibrations: Dict[str, Any] = json.load(calibration_file)
+        CALIBRATIONS.clear()
+        CALIBRATIONS.update({
+            key: calibration for key, calibration in loaded_calibrations.items()
+            if isinstance(calibration, dict) and isinstance(calibration.get("delay"), (int, float))
+        })
+        return True
+
+    except (OSError, ValueError, AttributeError) as e:
+        # Trace such an exception.
+        logger.error("Exception raised while loading the calibration file: " + str(e))
+        return False
+
+
+def save_calibrations() -> None:
+    """
+    Save the CALIBRATIONS dictionary to the CALIBRATION_FILE.
+    This function is a wrapper to utils.json_write.
+    """
+    utils.json_write(CALIBRATIONS, CALIBRATION_FILE)
+
+# =--------------------------------------------------------------------------------------------------------------= #
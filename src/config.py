@@ -19,9 +19,10 @@
 # Libraries import #
 # =--------------= #
 
-from typing       import Any, Dict, List, Union
+from typing       import Any, Dict, List, Optional, Set, Tuple, Type, Union
 from pathlib      import Path
 from src.utils    import PATH
+import os
 import copy
 import json
 import src.logger     as logger
@@ -42,12 +43,23 @@ import src.utils      as utils
 # CONFIG_FILE path.
 CONFIG_FILE: List[Path] = [Path(r"C:\Users\quent\Desktop\HotClick\configs\config.json")]
 
+#   CONFIG_FILE stamp (path, modification time and size) as
+# lastly loaded or saved, to detect any external modification.
+CONFIG_FILE_STAMP: Optional[Tuple[str, int, int]] = None
+
+# Exceptions raised by an invalid config file.
+CONFIG_ERRORS: Tuple[Type[Exception], ...] = (
+    FileNotFoundError, PermissionError, IsADirectoryError, json.JSONDecodeError, TypeError, KeyError
+)
+
 # CONFIG and DEFAULT_CONFIG dictionaries.
 DEFAULT_CONFIG: Dict[str, Union[int, str, List[int], Dict[str, Dict[str, Union[str, int]]], Dict[str, str]]] = {
     "radius": 60,
     "last_position": None,
     "last_setting_menu": None,
+    "overlay_mode": False,
     "hotkeys": {},
+    "layers": {},
     "shortcuts": {
         "builtin": {
             "New": "CTRL+N",
@@ -58,6 +70,7 @@ DEFAULT_CONFIG: Dict[str, Union[int, str, List[int], Dict[str, Dict[str, Union[s
             "Start": 'S',
             "Disable Hotkeys": '*',
             "Restore Application": '$',
+            "Cycle Profiles": "CTRL+ALT+P",
         },
         "custom": {}
     }
@@ -96,6 +109,25 @@ DEFAULT_STYLE: Dict[str, Union[str, Dict[str, str]]] = {
 }
 STYLE = copy.deepcopy(DEFAULT_STYLE)
 
+#   Rows of the theme buttons editing the STYLE dictionary, each button
+# being the keys to access its color followed by its displayed text.
+THEME_BUTTONS: List[List[Tuple[str, ...]]] = [
+    [("background-color", "Background color"), ("Custom", "middleground-color", "Middleground color")],
+    [("Custom", "selected-background-color", "Selected background color"), ("color", "Text color")],
+    [
+        ("QStatusBar", "background-color", "Status bar background color"),
+        ("QPushButton:checked", "background-color", "Selected settings menu button background color")
+    ],
+    [
+        ("QPushButton", "background-color", "Buttons background color"),
+        ("QPushButton:pressed", "background-color", "Pressed buttons background color")
+    ],
+    [
+        ("QPushButton:hover", "border-color", "Buttons hover border color"),
+        ("Custom", "circlewindow-background-color", "Hotkeys circle background color")
+    ],
+]
+
 # =------------------------------------------= #
 
 
@@ -103,6 +135,137 @@ STYLE = copy.deepcopy(DEFAULT_STYLE)
 # Config utility functions #
 # =----------------------= #
 
+def parse_config(file: Path) -> Dict[str, Any]:
+    """
+    Read, parse and validate the given config file and return its content.
+    This function neither logs nor touches the CONFIG dictionary,
+    making it safe to be called from a background thread.
+    Raise any of the CONFIG_ERRORS exceptions if the config file is invalid.
+
+    :param file: The config file to parse.
+    :type file: pathlib.Path
+    :returns: The parsed config.
+    :rtype: Dict[str, Any]
+    """
+
+    # Open the config file and read its json-parsed content.
+    with open(file, 'r') as config_file:
+        loaded_config: Dict[Any, Any] = json.load(config_file)
+
+    # Ensure the config contains the "radius", "last_position" and "last_setting_menu" values.
+    for key in ("radius", "last_position", "last_setting_menu"):
+        if key not in loaded_config:
+            raise KeyError(key)
+
+    # Ensure every hotkey of the base layer contains the required values.
+    _validate_hotkeys(loaded_config["hotkeys"])
+
+    # Ensure every hotkey of the optional other layers contains the required values.
+    if not isinstance(loaded_config.get("layers", {}), dict):
+        raise TypeError("The layers must be a mapping")
+    for layer, hotkeys in loaded_config.get("layers", {}).items():
+        if not layer:
+            raise KeyError("Unnamed layer")
+        _validate_hotkeys(hotkeys, f" (layer \"{layer}\")")
+
+    # Ensure both the builtin and custom shortcuts are mappings.
+    for key in ("builtin", "custom"):
+        if not isinstance(loaded_config["shortcuts"][key], dict):
+            raise TypeError(f"The {key} shortcuts must be a mapping")
+
+    # Return the parsed config.
+    return loaded_config
+
+
+def _validate_hotkeys(hotkeys: Any, layer: str = "") -> None:
+    """
+    Ensure the given hotkeys are a mapping whose every binding contains the required values.
+    Raise any of the CONFIG_ERRORS exceptions otherwise.
+
+    :param Any hotkeys: The hotkeys to validate.
+    :param str layer: The description of the hotkeys' layer within the error messages. By default, none.
+    """
+    if not isinstance(hotkeys, dict):
+        raise TypeError(f"The hotkeys{layer} must be a mapping")
+    for hotkey, binding in hotkeys.items():
+        if not isinstance(binding, dict):
+            raise TypeError(f"Hotkey \"{hotkey}\"{layer} must be a mapping")
+        for key in ("type", 'x', 'y', 'w', 'h'):
+            if key not in binding:
+                raise KeyError(f"{key} (hotkey \"{hotkey}\"{layer})")
+        if not all(isinstance(binding[key], int) for key in ('x', 'y', 'w', 'h')):
+            raise TypeError(f"Hotkey \"{hotkey}\"{layer} coordinates must be integers")
+
+
+def merge_config(loaded_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of the default config updated with the given parsed config, the missing values being the default ones.
+    The builtin shortcuts are merged one by one, so a config saved before a builtin shortcut existed gets its default.
+
+    :param loaded_config: The parsed config, as returned by the parse_config function.
+    :type loaded_config: Dict[str, Any]
+    :returns: The merged config.
+    :rtype: Dict[str, Any]
+    """
+
+    # Update a copy of the default config with the parsed config's values.
+    merged_config: Dict[str, Any] = copy.deepcopy(DEFAULT_CONFIG)
+    merged_config.update(loaded_config)
+
+    #   Add the default builtin shortcuts the parsed config misses (e.g.: the ones added since it got saved),
+    # unless their hotkey is already taken, without altering the parsed config itself.
+    shortcuts: Optional[Dict[str, Any]] = loaded_config.get("shortcuts")
+    if shortcuts is not None:
+        taken: Set[str] = {
+            hotkey.upper()
+            for hotkey in [*shortcuts["builtin"].values(), *shortcuts["custom"], *loaded_config.get("hotkeys", {})]
+        }
+        builtin: Dict[str, str] = dict(shortcuts["builtin"])
+        for name, hotkey in DEFAULT_CONFIG["shortcuts"]["builtin"].items():
+            if name not in builtin and hotkey.upper() not in taken:
+                builtin[name] = hotkey
+        merged_config["shortcuts"] = {**shortcuts, "builtin": builtin}
+    return merged_config
+
+
+def apply_config(loaded_config: Dict[str, Any]) -> None:
+    """
+    Replace the CONFIG dictionary content with the given parsed config,
+    the missing values being the default ones. Every value is assigned
+    directly, so the CONFIG dictionary is never seen empty by the hotkey
+    routine running from the keyboard thread.
+
+    :param loaded_config: The parsed config, as returned by the parse_config function.
+    :type loaded_config: Dict[str, Any]
+    """
+
+    # Merge the parsed config into a copy of the default one.
+    merged_config: Dict[str, Any] = merge_config(loaded_config)
+
+    # Update the CONFIG dictionary, removing the values that don't exist anymore.
+    for key in merged_config:
+        utils.update_dict(CONFIG, key, value=merged_config[key])
+    for key in [key for key in CONFIG if key not in merged_config]:
+        utils.update_dict(CONFIG, key, delete=True)
+
+    # Keep in memory the stamp of the loaded file.
+    global CONFIG_FILE_STAMP
+    CONFIG_FILE_STAMP = config_file_stamp()
+
+    # Trace.
+    logger.info(f"""Loaded radius: {CONFIG["radius"]}""")
+    logger.info(f"""Loaded last position: {CONFIG["last_position"]}""")
+    logger.info(f"""Loaded last setting menu: {CONFIG["last_setting_menu"]}""")
+    logger.info(f"""Loaded {len(CONFIG["hotkeys"])} hotkeys""")
+    for layer, hotkeys in CONFIG["layers"].items():
+        logger.info(f"""Loaded layer "{layer}" with {len(hotkeys)} hotkeys""")
+    for shortcut in CONFIG["shortcuts"]["builtin"]:
+        logger.info(f"""Loaded builtin shortcut: [{shortcut}: {CONFIG["shortcuts"]["builtin"][shortcut]}]""")
+    logger.info(f"""Loaded {len(CONFIG["shortcuts"]["custom"])} custom shortcuts""")
+    logger.info(f"Open the config inside \"{CONFIG_FILE[0].parent}\" directory")
+    logger.info(f"Open the config called \"{CONFIG_FILE[0].name}\"")
+
+
 def load_config() -> bool:
     """
     Load the CONFIG_FILE to the CONFIG dictionary
@@ -116,56 +279,16 @@ def load_config() -> bool:
     if not CONFIG_FILE:
         return False
 
-    # Make the CONFIG global variable writable.
-    global CONFIG
-
     # Try the whole config loading mechanism. In case
     # of any exception raised, abort the loading.
     try:
-        # Open the config.json file.
-        with open(CONFIG_FILE[0], 'r') as file:
-            # Read its json-parsed content.
-            loaded_config: Dict[Any, Any] = json.load(file)
-
-            # Ensure the config contains the "radius" value.
-            logger.info(f"""Loaded radius: {loaded_config["radius"]}""")
-
-            # Ensure the config contains the "last_position" value.
-            logger.info(f"""Loaded last position: {loaded_config["last_position"]}""")
-
-            # Ensure the config contains the "last_setting_menu" value.
-            logger.info(f"""Loaded last setting menu: {loaded_config["last_setting_menu"]}""")
-
-            # Ensure every hotkey contains the required values.
-            for hotkey in loaded_config["hotkeys"]:
-                logger.info(
-                    f"""Loaded hotkey: ["{hotkey}": {loaded_config["hotkeys"][hotkey]["type"]}, """
-                    f"""({loaded_config["hotkeys"][hotkey]['x']};{loaded_config["hotkeys"][hotkey]['y']})] """
-                    f"""<{loaded_config["hotkeys"][hotkey]['w']};{loaded_config["hotkeys"][hotkey]['h']}>"""
-                )
-
-            # Ensure every shortcut contains the required values.
-            for shortcut in loaded_config["shortcuts"]["builtin"]:
-                logger.info(
-                    f"""Loaded builtin shortcut: [{shortcut}: {loaded_config["shortcuts"]["builtin"][shortcut]}]"""
-                )
-            for shortcut in loaded_config["shortcuts"]["custom"]:
-                logger.info(
-                    f"""Loaded custom shortcut: [{shortcut}: {loaded_config["shortcuts"]["custom"][shortcut]}]"""
-                )
-
-            # Update the CONFIG dictionary.
-            for key in loaded_config.keys():
-                utils.update_dict(CONFIG, key, value=loaded_config[key])
-
-        # Trace.
-        logger.info(f"Open the config inside \"{CONFIG_FILE[0].parent}\" directory")
-        logger.info(f"Open the config called \"{CONFIG_FILE[0].name}\"")
+        # Parse the config file and apply it to the CONFIG dictionary.
+        apply_config(parse_config(CONFIG_FILE[0]))
 
         # The parsing is a success: return True.
         return True
 
-    except (FileNotFoundError, PermissionError, IsADirectoryError, json.JSONDecodeError, TypeError, KeyError) as e:
+    except CONFIG_ERRORS as e:
         # Trace such an exception.
         logger.error("Exception raised while loading the config file: " + str(e))
         logger.error("Config file loading failed")
@@ -183,6 +306,43 @@ def save_config() -> None:
     # Call utils.json_write with the appropriated arguments.
     utils.json_write(CONFIG, CONFIG_FILE[0])
 
+    # Keep in memory the stamp of the saved file.
+    global CONFIG_FILE_STAMP
+    CONFIG_FILE_STAMP = config_file_stamp()
+
+
+def config_file_stamp(file: Optional[Path] = None) -> Optional[Tuple[str, int, int]]:
+    """
+    Return the current stamp of the given config file, made of its path,
+    modification time and size, or None if it can't be accessed.
+
+    :param file: The config file. By default, None (the CONFIG_FILE).
+    :type file: pathlib.Path or None
+    :returns: The current config file stamp.
+    :rtype: Tuple[str, int, int] or None
+    """
+
+    # Try to retrieve the config file status.
+    if file is None:
+        file = CONFIG_FILE[0]
+    try:
+        status: os.stat_result = os.stat(file)
+        return str(file), status.st_mtime_ns, status.st_size
+    except OSError:
+        return None
+
+
+def config_file_changed() -> bool:
+    """
+    Return True if the CONFIG_FILE changed since it has been lastly loaded or saved.
+
+    :returns: True if the CONFIG_FILE changed.
+    :rtype: bool
+    """
+
+    # Compare the current CONFIG_FILE stamp to the stored one.
+    return CONFIG_FILE_STAMP is None or CONFIG_FILE_STAMP != config_file_stamp()
+
 
 def reset_config() -> None:
     """
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    hotkey layers used by the HotClick software.
+    Like keyboard firmware layers, each layer binds its
+    own hotkeys, the base layer being CONFIG["hotkeys"]
+    and the other ones CONFIG["layers"]. Every layer is
+    compiled once, when the hotkeys routine starts, into
+    its own SequenceMatcher, so switching the layer only
+    swaps the matcher the hotkeys routine feeds.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing        import Any, Dict, Mapping, Optional, Tuple
+from collections   import ChainMap
+from src.actions   import Action, InputBackend, RELEASE_POLL_INTERVAL, compile_dispatch_table, register_action_type
+from src.sequences import SequenceMatcher
+import threading
+import time
+import src.logger  as logger
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Name of the base layer, whose hotkeys are the CONFIG["hotkeys"] ones.
+BASE_LAYER: str = ""
+
+# Displayed name of the base layer.
+BASE_LAYER_LABEL: str = "Base"
+
+#   Modes of the layer keys: a momentary layer is active while its key is held, a toggled
+# one until its key is pressed again, the base layer being active again afterwards.
+LAYER_MODES: Tuple[str, ...] = ("momentary", "toggle")
+
+# =-----------------------------------------------------------------------------------= #
+
+
+# =---------------= #
+# LayerAction class #
+# =---------------= #
+
+class LayerAction(Action):
+    """Layer Action class activating a layer, either while its hotkey is held or until it is pressed again."""
+
+    __slots__ = ("layer", "toggle")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, layer: str, toggle: bool = False) -> None:
+        """
+        Initializer method.
+
+        :param str layer: The name of the layer to activate.
+        :param bool toggle: If True, the layer remains active until the hotkey is pressed again. By default, False.
+        """
+        self.layer: str = layer
+        self.toggle: bool = toggle
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "LayerAction":
+        """
+        Return the action compiled from the given binding, its "layer" being the name of the layer
+        to activate and its optional "mode" one of the LAYER_MODES, "momentary" by default.
+
+        :param binding: The binding to compile.
+        :type binding: Mapping[str, Any]
+        :returns: The compiled action.
+        :rtype: LayerAction
+        """
+        mode: str = str(binding.get("mode", "momentary")).lower()
+        if mode not in LAYER_MODES:
+            raise ValueError(f"Unknown layer mode \"{mode}\"")
+        return cls(str(binding["layer"]), mode == "toggle")
+
+    def execute(self, backend: InputBackend) -> None:
+        """
+        Execute the action through the given backend.
+
+        :param InputBackend backend: The backend simulating the inputs.
+        """
+        LAYERS.switch(self.layer, self.toggle, backend)
+
+# =----------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------= #
+# LayerStack class #
+# =--------------= #
+
+class LayerStack:
+    """
+    Layer Stack class holding the SequenceMatcher of every layer, the active one being read by the hotkeys
+    routine. A momentary layer takes precedence over the toggled one, active again once its key is released.
+    The layer keys of the base layer are kept within every other layer not binding their hotkeys, so any
+    layer can be reached or left from any other one.
+    """
+
+    __slots__ = ("active", "active_layer", "_matchers", "_toggled_layer", "_held_layer")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+
+        # Initialize the straight-forward attributes, only the empty base layer existing yet.
+        self._matchers: Dict[str, SequenceMatcher] = {BASE_LAYER: SequenceMatcher()}
+        self._toggled_layer: str = BASE_LAYER
+        self._held_layer: Optional[str] = None
+        self.active_layer: str = BASE_LAYER
+        self.active: SequenceMatcher = self._matchers[BASE_LAYER]
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def compile(
+            self,
+            hotkeys: Mapping[str, Mapping[str, Any]],
+            layers: Mapping[str, Mapping[str, Mapping[str, Any]]],
+            custom_shortcuts: Mapping[str, str]
+    ) -> None:
+        """
+        Compile the base layer's hotkeys and every other layer's ones, along with the custom shortcuts
+        bound within every layer, into the SequenceMatcher of each layer, starting from the base layer.
+
+        :param hotkeys: The bindings of the base layer, by hotkey.
+        :type hotkeys: Mapping[str, Mapping[str, Any]]
+        :param layers: The bindings by hotkey of every other layer, by layer name.
+        :type layers: Mapping[str, Mapping[str, Mapping[str, Any]]]
+        :param custom_shortcuts: The targets by custom shortcut.
+        :type custom_shortcuts: Mapping[str, str]
+        """
+
+        # Compile the base layer, keeping its layer keys aside for the other layers.
+        base_table: Dict[str, Action] = compile_dispatch_table(hotkeys, custom_shortcuts)
+        layer_keys: Dict[str, Action] = {
+            hotkey: action for hotkey, action in base_table.items() if isinstance(action, LayerAction)
+        }
+        matchers: Dict[str, SequenceMatcher] = {BASE_LAYER: SequenceMatcher.from_dispatch_table(base_table, hotkeys)}
+
+        #   Compile every other layer over the custom shortcuts and the base layer's layer keys,
+        # the custom shortcuts being compiled once for all the layers.
+        custom_table: Dict[str, Action] = compile_dispatch_table({}, custom_shortcuts)
+        for layer, bindings in layers.items():
+            table: Dict[str, Action] = {**custom_table, **layer_keys, **compile_dispatch_table(bindings, {})}
+            matchers[layer] = SequenceMatcher.from_dispatch_table(table, ChainMap(bindings, hotkeys))
+
+        # Replace the matchers, starting from the base layer.
+        self._matchers = matchers
+        self._toggled_layer = BASE_LAYER
+        self._held_layer = None
+        self.active_layer = BASE_LAYER
+        self.active = matchers[BASE_LAYER]
+
+    def use(self, layers: "LayerStack") -> None:
+        """
+        Use the layers compiled by the given LayerStack, starting from their base layer,
+        only swapping the matchers without compiling anything.
+
+        :param LayerStack layers: The LayerStack whose compiled layers to use.
+        """
+
+        # Swap the matchers, forgetting the toggled and held layers, then activate the base layer.
+        self._matchers = layers._matchers
+        self._toggled_layer = BASE_LAYER
+        self._held_layer = None
+        self.activate(BASE_LAYER)
+
+    def activate(self, layer: str) -> None:
+        """
+        Make the given layer the active one, the hotkeys routine feeding its SequenceMatcher from now on.
+        An unknown layer is reported and ignored.
+
+        :param str layer: The name of the layer to activate.
+        """
+
+        # Retrieve the layer's matcher, ignoring an unknown layer.
+        matcher: Optional[SequenceMatcher] = self._matchers.get(layer)
+        if matcher is None:
+            logger.error(f"Unknown layer \"{layer}\"")
+            return
+
+        # Swap the active matcher, forgetting the chords pressed within the previous layer.
+        matcher.reset()
+        self.active_layer = layer
+        self.active = matcher
+
+        # Trace.
+        logger.info(f"Layer \"{layer or BASE_LAYER_LABEL}\" active")
+
+    def switch(self, layer: str, toggle: bool, backend: InputBackend) -> None:
+        """
+        Activate the given layer from the key whose press is being handled by the given backend, either until
+        the key is pressed again if toggle is True, or while it is held otherwise. Toggling the toggled layer
+        again goes back to the base layer.
+
+        :param str layer: The name of the layer to activate.
+        :param bool toggle: If True, toggle the layer, otherwise activate it while the key is held.
+        :param InputBackend backend: The backend checking the key.
+        """
+
+        #   Toggle the layer, only activated right away if no momentary
+        # layer is held, such a layer taking precedence until released.
+        if toggle:
+            self._toggled_layer = BASE_LAYER if self._toggled_layer == layer else layer
+            if self._held_layer is None:
+                self.activate(self._toggled_layer)
+            return
+
+        # Ignore the repeated presses of the held key, the system repeating them.
+        if self._held_layer == layer:
+            return
+
+        #   Activate the layer while its key is held, waiting for its release from
+        # a daemon thread for the hotkeys routine to handle the other keys meanwhile.
+        self._held_layer = layer
+        self.activate(layer)
+        threading.Thread(target=self._release, args=(backend, backend.trigger, layer), daemon=True).start()
+
+    # ============== #
+    # Private method #
+    # ============== #
+
+    def _release(self, backend: InputBackend, trigger: Optional[str], layer: str) -> None:
+        """
+        Wait for the given key to be released, then go back to the toggled
+        layer, unless another momentary layer got activated meanwhile.
+
+        :param InputBackend backend: The backend checking the key.
+        :param trigger: The key holding the layer, or None to go back right away.
+        :type trigger: str or None
+        :param str layer: The name of the held layer.
+        """
+
+        # Wait for the key to be released.
+        while trigger is not None and backend.is_pressed(trigger):
+            time.sleep(RELEASE_POLL_INTERVAL)
+
+        # Go back to the toggled layer if the layer is still the held one.
+        if self._held_layer == layer:
+            self._held_layer = None
+            self.activate(self._toggled_layer)
+
+# =---------------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------= #
+# Layers instance #
+# =-------------= #
+
+# Register the layer keys' action type.
+register_action_type("Layer", LayerAction.from_binding)
+
+# The layers whose active one is fed by the hotkeys routine.
+LAYERS: LayerStack = LayerStack()
+
+# =--------------------------------------------= #
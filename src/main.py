@@ -143,6 +143,112 @@
     |         |                 | attributes and methods.                 |
     |         |                 | Make the CircleWindow text font adapted |
     |         |                 | to fit the available space.             |
+    |---------|-----------------|-----------------------------------------|
+    |  1.1.0  |      2026-10-19 | Add an overlay mode drawing every       |
+    |         |                 | hotkey within a single transparent      |
+    |         |                 | window per screen instead of a window   |
+    |         |                 | per hotkey.                             |
+    |         |                 | Memoize the CircleWindow text font      |
+    |         |                 | fitting, computed by binary search.     |
+    |         |                 | Cache the CircleWindow appearance as a  |
+    |         |                 | pixmap, re-rendered only when its size, |
+    |         |                 | hotkey or color changes.                |
+    |         |                 | Hide the CircleWindows when starting    |
+    |         |                 | the program and show them back when     |
+    |         |                 | restoring it, reloading the config file |
+    |         |                 | only if it changed.                     |
+    |         |                 | Load the config files from a worker     |
+    |         |                 | thread and create the CircleWindows by  |
+    |         |                 | time-boxed chunks.                      |
+    |         |                 | Add a HotkeyRegistry giving the new     |
+    |         |                 | hotkeys their key from a free keys pool |
+    |         |                 | and checking the hotkeys conflicts with |
+    |         |                 | the other hotkeys and the shortcuts in  |
+    |         |                 | constant time.                          |
+    |         |                 | Snap the dragged CircleWindows to their |
+    |         |                 | neighbors with alignment guides and     |
+    |         |                 | warn about the overlapping hotkeys,     |
+    |         |                 | backed by a SpatialGrid index.          |
+    |         |                 | Pace the CircleWindows dragging and     |
+    |         |                 | resizing to the screen refresh rate and |
+    |         |                 | commit their geometry once per gesture. |
+    |         |                 | Compile the theme once into a single    |
+    |         |                 | application-wide stylesheet selecting   |
+    |         |                 | the widgets by object name, cached per  |
+    |         |                 | theme hash.                             |
+    |         |                 | Restyle only the widgets depending on   |
+    |         |                 | an edited theme color, from a theme     |
+    |         |                 | dependency map, and write the theme     |
+    |         |                 | file once when saving.                  |
+    |         |                 | Add a themes directory whose themes are |
+    |         |                 | parsed, validated and compiled once,    |
+    |         |                 | when first selected from the Theme      |
+    |         |                 | settings, and kept within a LRU cache   |
+    |         |                 | for switching themes without any disk   |
+    |         |                 | access.                                 |
+    |         |                 | Capture the shortcuts from a            |
+    |         |                 | hotkey_pressed signal sent by the       |
+    |         |                 | keyboard hook instead of polling the    |
+    |         |                 | last hotkey every 10 ms from a          |
+    |         |                 | KeyboardThread, and stop sleeping on    |
+    |         |                 | the GUI thread when a mouse shortcut is |
+    |         |                 | captured.                               |
+    |         |                 | Pool the shortcut capture windows, one  |
+    |         |                 | per screen pre-rendered for its         |
+    |         |                 | geometry, filtering the application     |
+    |         |                 | events only for the duration of a       |
+    |         |                 | capture.                                |
+    |         |                 | Create the Settings menu pages when     |
+    |         |                 | first selected, and keep the            |
+    |         |                 | SettingsDialog alive, refreshing its    |
+    |         |                 | pages from the config when reopened.    |
+    |         |                 | Display the builtin and custom          |
+    |         |                 | shortcuts within a ShortcutTable view   |
+    |         |                 | backed by a table model, creating an    |
+    |         |                 | editor only for the edited cell and     |
+    |         |                 | checking the duplicates and the         |
+    |         |                 | validity from indexes.                  |
+    |         |                 | Add hotkeys and shortcuts search boxes  |
+    |         |                 | backed by an incremental n-gram index,  |
+    |         |                 | highlighting the matching hotkeys       |
+    |         |                 | Compile the hotkeys and custom          |
+    |         |                 | shortcuts into typed actions (click,    |
+    |         |                 | double click, hold, scroll, drag, key   |
+    |         |                 | tap) dispatched from a lookup table     |
+    |         |                 | Add timed macro sequences run by a      |
+    |         |                 | sleep-then-spin scheduler reporting the |
+    |         |                 | jitter of each step, cancelled by       |
+    |         |                 | pressing their hotkey again or by       |
+    |         |                 | releasing it                            |
+    |         |                 | Add auto-click hotkeys clicking at a    |
+    |         |                 | target rate while held or until toggled |
+    |         |                 | off, sharing a global clicks budget and |
+    |         |                 | reporting their achieved rate and       |
+    |         |                 | jitter                                  |
+    |         |                 | Support hotkeys made of chords          |
+    |         |                 | sequences (e.g.: "G, 3"), matched by a  |
+    |         |                 | prefix trie with per-sequence timeouts  |
+    |         |                 | Add hotkey layers with momentary and    |
+    |         |                 | toggle layer keys, each layer compiled  |
+    |         |                 | into its own sequence trie and swapped  |
+    |         |                 | in the hook path, editing a layer only  |
+    |         |                 | showing its own circles                 |
+    |         |                 | Keep the recently used profiles parsed  |
+    |         |                 | and compiled in an in-memory LRU,       |
+    |         |                 | listed in a "Recent profiles" menu, and |
+    |         |                 | cycle through them with a hotkey while  |
+    |         |                 | the hotkeys routine runs                |
+    |         |                 | Add a click timing calibration          |
+    |         |                 | measuring how long the cursor takes to  |
+    |         |                 | arrive, storing the click delay per     |
+    |         |                 | mouse backend and screen setup and      |
+    |         |                 | waiting for it before each button press |
+    |         |                 | Add optional pixel conditions to the    |
+    |         |                 | hotkeys, only clicking if the pixels    |
+    |         |                 | around the target match a color within  |
+    |         |                 | a tolerance, capturing only that tiny   |
+    |         |                 | region through a per-thread mss handle  |
+    |         |                 | and comparing it through NumPy.         |
      ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
 """
 
@@ -165,11 +271,11 @@ import sys
 
 __author__       = "Quentin Raimbaud"
 __contact__      = "quentin.raimbaud.contact@gmail.com"
-__date__         = "2024-04-03"
+__date__         = "2026-10-19"
 __license__      = "LGPL-2.1"
 __maintainer__   = "Quentin Raimbaud"
 __status__       = "Production"
-__version__      = "1.0.0"
+__version__      = "1.1.0"
 
 # =-------------------------------------------------= #
 
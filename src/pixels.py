@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the pixel
+    conditions guarding the hotkeys of the HotClick software.
+    A binding's optional "pixel" condition only lets its
+    action run if the pixels around its target match a
+    color within a tolerance. Only the few pixels around
+    the target get captured, from a capture handle kept
+    per thread, and compared all at once through NumPy.
+    The numpy and mss libraries are optional: without
+    them, the guarded hotkeys are reported and ignored.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing import Any, Mapping, Optional, Tuple
+import threading
+import src.logger as logger
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import mss
+except ImportError:
+    mss = None
+
+# =--------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Default distance, in pixels, from the target to the edge of the compared region, 0 comparing the target only.
+PIXEL_RADIUS: int = 0
+
+# Maximum distance of the compared region, keeping the capture tiny whatever the condition.
+MAX_PIXEL_RADIUS: int = 8
+
+# Default maximum difference of every color channel, from 0 to 255, for a pixel to match the condition's color.
+PIXEL_TOLERANCE: int = 10
+
+#   Modes of the pixel conditions: either every pixel of the
+# region must match the color, or any single one of them.
+PIXEL_MODES: Tuple[str, ...] = ("all", "any")
+
+# =---------------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------------= #
+# Pixel utility function #
+# =--------------------= #
+
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """
+    Return the red, green and blue channels of the given "#RRGGBB" color, raising a ValueError if it is invalid.
+
+    :param str color: The color to parse (e.g.: "#FF8000").
+    :returns: The red, green and blue channels, from 0 to 255.
+    :rtype: Tuple[int, int, int]
+    """
+    if not isinstance(color, str) or len(color) != 7 or not color.startswith('#'):
+        raise ValueError(f"Invalid color \"{color}\", expected \"#RRGGBB\"")
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+# =-----------------------------------------------------------------------------------------------------------= #
+
+
+# =------------------= #
+# Frame source classes #
+# =------------------= #
+
+class FrameSource:
+    """
+    Frame Source class, the base class of everything the pixel conditions capture their region from.
+    A captured region is a (height, width, 4) array of unsigned bytes, each pixel being in the BGRA order.
+    """
+
+    __slots__ = ()
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def grab(self, region: Tuple[int, int, int, int]) -> Any:
+        """
+        Capture and return the given region, raising an OSError if it can't be captured.
+        This method should be overridden in child classes.
+
+        :param region: The region to capture, as a (left, top, width, height) tuple.
+        :type region: Tuple[int, int, int, int]
+        :returns: The captured region.
+        :rtype: numpy.ndarray
+        """
+        raise NotImplementedError
+
+
+class ScreenFrameSource(FrameSource):
+    """
+    Screen Frame Source class capturing the regions from the screen through the mss library.
+    An mss handle can only be used from the thread that opened it, so a handle is opened once
+    per thread then kept, capturing a region only costing the capture itself.
+    """
+
+    __slots__ = ("_local",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+        self._local: threading.local = threading.local()
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def grab(self, region: Tuple[int, int, int, int]) -> Any:
+        """
+        Capture and return the given region, raising an OSError if it can't be captured.
+
+        :param region: The region to capture, as a (left, top, width, height) tuple.
+        :type region: Tuple[int, int, int, int]
+        :returns: The captured region.
+        :rtype: numpy.ndarray
+        """
+
+        # Open the current thread's capture handle once.
+        handle: Optional[Any] = getattr(self._local, "handle", None)
+        if handle is None:
+            handle = self._local.handle = mss.mss()
+
+        # Capture the region only, viewing its raw BGRA bytes without copying them.
+        left, top, width, height = region
+        try:
+            screenshot: Any = handle.grab({"left": left, "top": top, "width": width, "height": height})
+        except mss.exception.ScreenShotError as e:
+            raise OSError(str(e)) from e
+        return numpy.frombuffer(screenshot.raw, numpy.uint8).reshape(height, width, 4)
+
+
+class SyntheticFrameSource(FrameSource):
+    """
+    Synthetic Frame Source class capturing the regions from a frame held in memory,
+    letting the pixel conditions be checked and benchmarked without any screen.
+    """
+
+    __slots__ = ("frame",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, width: int, height: int, color: str = "#000000") -> None:
+        """
+        Initializer method.
+
+        :param int width: The width of the frame, in pixels.
+        :param int height: The height of the frame, in pixels.
+        :param str color: The "#RRGGBB" color filling the frame. By default, black.
+        """
+        red, green, blue = parse_color(color)
+        self.frame: Any = numpy.empty((height, width, 4), numpy.uint8)
+        self.frame[...] = (blue, green, red, 255)
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def grab(self, region: Tuple[int, int, int, int]) -> Any:
+        """
+        Capture and return the given region, raising an OSError if it lies outside the frame.
+
+        :param region: The region to capture, as a (left, top, width, height) tuple.
+        :type region: Tuple[int, int, int, int]
+        :returns: The captured region.
+        :rtype: numpy.ndarray
+        """
+        left, top, width, height = region
+        if left < 0 or top < 0 or left + width > self.frame.shape[1] or top + height > self.frame.shape[0]:
+            raise OSError(f"Region {region} outside the synthetic frame")
+        return self.frame[top:top + height, left:left + width]
+
+# =-----------------------------------------------------------------------------------------------------------= #
+
+
+# =------------------= #
+# PixelCondition class #
+# =------------------= #
+
+class PixelCondition:
+    """
+    Pixel Condition class matching the pixels of a small square region around a target against a color,
+    each color channel differing by at most the tolerance. The region and the color are prebuilt, the
+    color being kept in the BGRA order of the captured regions, so a check only captures the region and
+    compares all its pixels at once.
+    """
+
+    __slots__ = ("region", "color", "tolerance", "require_all", "source")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(
+            self,
+            position: Tuple[int, int],
+            color: Tuple[int, int, int],
+            radius: int = PIXEL_RADIUS,
+            tolerance: int = PIXEL_TOLERANCE,
+            require_all: bool = True,
+            source: Optional[FrameSource] = None
+    ) -> None:
+        """
+        Initializer method.
+
+        :param position: The coordinates of the target, at the center of the region.
+        :type position: Tuple[int, int]
+        :param color: The red, green and blue channels of the color to match.
+        :type color: Tuple[int, int, int]
+        :param int radius: The distance from the target to the edge of the region. By default, PIXEL_RADIUS.
+        :param int tolerance: The maximum difference of every color channel. By default, PIXEL_TOLERANCE.
+        :param bool require_all: If True, every pixel must match, otherwise any one of them. By default, True.
+        :param source: The frame source to capture the region from. By default, the SCREEN one.
+        :type source: FrameSource or None
+        """
+        self.region: Tuple[int, int, int, int] = (
+            position[0] - radius, position[1] - radius, 2 * radius + 1, 2 * radius + 1
+        )
+        self.color: Any = numpy.array(color[::-1], numpy.int16)
+        self.tolerance: int = tolerance
+        self.require_all: bool = require_all
+        self.source: FrameSource = source if source is not None else SCREEN
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    @classmethod
+    def from_binding(
+            cls,
+            condition: Mapping[str, Any],
+            position: Tuple[int, int],
+            source: Optional[FrameSource] = None
+    ) -> "PixelCondition":
+        """
+        Return the condition compiled from the given binding's "pixel" condition, its "color" being the
+        "#RRGGBB" color to match and its optional "radius", "tolerance" and "mode" (one of the PIXEL_MODES)
+        the ones of the condition. Raise a ValueError if the numpy or mss library is missing.
+
+        :param condition: The binding's pixel condition to compile.
+        :type condition: Mapping[str, Any]
+        :param position: The coordinates of the binding's target.
+        :type position: Tuple[int, int]
+        :param source: The frame source to capture the region from. By default, the SCREEN one.
+        :type source: FrameSource or None
+        :returns: The compiled condition.
+        :rtype: PixelCondition
+        """
+
+        # Ensure the required libraries are available.
+        if numpy is None or (source is None and mss is None):
+            raise ValueError("The pixel conditions require the numpy and mss libraries")
+
+        # Validate the condition's values.
+        radius: int = int(condition.get("radius", PIXEL_RADIUS))
+        if not 0 <= radius <= MAX_PIXEL_RADIUS:
+            raise ValueError(f"The pixel radius must be between 0 and {MAX_PIXEL_RADIUS}")
+        tolerance: int = int(condition.get("tolerance", PIXEL_TOLERANCE))
+        if not 0 <= tolerance <= 255:
+            raise ValueError("The pixel tolerance must be between 0 and 255")
+        mode: str = str(condition.get("mode", "all")).lower()
+        if mode not in PIXEL_MODES:
+            raise ValueError(f"Unknown pixel mode \"{mode}\"")
+        return cls(position, parse_color(condition["color"]), radius, tolerance, mode == "all", source)
+
+    def matches(self) -> bool:
+        """
+        Capture the region and return whether its pixels match the color.
+        A region that can't be captured is reported and doesn't match.
+
+        :returns: True if every pixel of the region matches, or any one of them depending on the mode.
+        :rtype: bool
+        """
+
+        # Capture the region.
+        try:
+            frame: Any = self.source.grab(self.region)
+        except OSError as e:
+            logger.error("Exception raised while capturing the pixel condition's region: " + str(e))
+            return False
+
+        # Compare every pixel's color channels at once, leaving the alpha channel out.
+        matching: Any = numpy.abs(frame[..., :3].astype(numpy.int16) - self.color).max(axis=2) <= self.tolerance
+        return bool(matching.all() if self.require_all else matching.any())
+
+# =-----------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------------= #
+# Frame source instance #
+# =-------------------= #
+
+# The frame source capturing the screen, used by default by the pixel conditions.
+SCREEN: ScreenFrameSource = ScreenFrameSource()
+
+# =-------------------------------------------------------------------------= #
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    ProfileCache class used by the HotClick software.
+    A profile is a config file along with its parsed
+    and validated content and its compiled layers, kept
+    in memory so switching back to a recently used
+    profile needs neither to read nor to compile it.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing      import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from pathlib     import Path
+from src.layers  import LayerStack
+import threading
+
+# =---------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Maximum number of profiles kept in memory, the least recently used one being forgotten first.
+PROFILES_CACHE_SIZE: int = 8
+
+# =--------------------------------------------------------------------------------------------= #
+
+
+# =-----------= #
+# Profile class #
+# =-----------= #
+
+class Profile:
+    """Profile class holding a config file's merged content, its stamp once parsed and its compiled layers."""
+
+    __slots__ = ("file", "config", "stamp", "layers")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(
+            self,
+            file: Path,
+            config: Dict[str, Any],
+            stamp: Optional[Tuple[str, int, int]],
+            layers: Optional[LayerStack] = None
+    ) -> None:
+        """
+        Initializer method.
+        If no compiled layers are provided, compile them from the given config.
+
+        :param pathlib.Path file: The config file.
+        :param config: The config file's content, merged into the default config.
+        :type config: Dict[str, Any]
+        :param stamp: The config file's stamp once parsed, as returned by the config.config_file_stamp function.
+        :type stamp: Tuple[str, int, int] or None
+        :param layers: The optional layers compiled from the config. By default, None.
+        :type layers: LayerStack or None
+        """
+
+        # Initialize the straight-forward attributes.
+        self.file: Path = file
+        self.config: Dict[str, Any] = config
+        self.stamp: Optional[Tuple[str, int, int]] = stamp
+
+        # Compile the layers if required.
+        if layers is None:
+            layers = LayerStack()
+            layers.compile(config["hotkeys"], config["layers"], config["shortcuts"]["custom"])
+        self.layers: LayerStack = layers
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =----------------= #
+# ProfileCache class #
+# =----------------= #
+
+class ProfileCache:
+    """
+    Profile Cache class keeping the recently used profiles in memory, from the least to the most recently used,
+    up to a maximum number of profiles. Cycling through the profiles always switches to the least recently used
+    one, so cycling repeatedly goes through every cached profile in turn. The cache is shared by the Qt main loop
+    and the keyboard thread cycling through the profiles, so each access holds the cache's lock.
+    """
+
+    __slots__ = ("_profiles", "_capacity", "_lock")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, capacity: int = PROFILES_CACHE_SIZE) -> None:
+        """
+        Initializer method.
+
+        :param int capacity: The maximum number of profiles. By default, PROFILES_CACHE_SIZE.
+        """
+
+        # Initialize the straight-forward attributes.
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._capacity: int = capacity
+        self._lock: threading.Lock = threading.Lock()
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def __len__(self) -> int:
+        """
+        Overridden __len__ method.
+
+        :returns: The number of cached profiles.
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._profiles)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def put(self, profile: Profile) -> Profile:
+        """
+        Cache the given profile as the most recently used one, replacing the
+        previous one of its file and forgetting the least recently used ones.
+
+        :param Profile profile: The profile to cache.
+        :returns: The cached profile.
+        :rtype: Profile
+        """
+
+        # Cache the profile as the most recently used one.
+        key: str = str(profile.file)
+        with self._lock:
+            self._profiles.pop(key, None)
+            self._profiles[key] = profile
+
+            # Forget the least recently used profiles beyond the capacity.
+            while len(self._profiles) > self._capacity:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def get(self, file: Path) -> Optional[Profile]:
+        """
+        Return the cached profile of the given config file, marking it as the most recently used one, or None.
+
+        :param pathlib.Path file: The config file.
+        :returns: The cached profile, or None.
+        :rtype: Profile or None
+        """
+        with self._lock:
+            profile: Optional[Profile] = self._profiles.get(str(file))
+            if profile is not None:
+                self._profiles.move_to_end(str(file))
+            return profile
+
+    def discard(self, file: Path) -> None:
+        """
+        Forget the cached profile of the given config file, if any.
+
+        :param pathlib.Path file: The config file.
+        """
+        with self._lock:
+            self._profiles.pop(str(file), None)
+
+    def cycle(self) -> Optional[Profile]:
+        """
+        Return the least recently used profile, the next one to cycle to, marking it as the most recently used one,
+        or None if no other profile than the most recently used one is cached.
+
+        :returns: The least recently used profile, or None.
+        :rtype: Profile or None
+        """
+        with self._lock:
+            if len(self._profiles) < 2:
+                return None
+            key, profile = next(iter(self._profiles.items()))
+            self._profiles.move_to_end(key)
+            return profile
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def files(self) -> List[Path]:
+        """
+        Getter method for the config files of the cached profiles, from the most to the least recently used.
+
+        :returns: The config files.
+        :rtype: List[pathlib.Path]
+        """
+        with self._lock:
+            return [profile.file for profile in reversed(self._profiles.values())]
+
+# =--------------------------------------------------------------------------------------------------------------= #
+
+
+# =--------------------= #
+# Profile cache instance #
+# =--------------------= #
+
+# The recently used profiles.
+PROFILES: ProfileCache = ProfileCache()
+
+# =------------------------------------= #
@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    HotkeyRegistry class used by the HotClick software.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing            import Any, Dict, KeysView, List, Optional, Set
+from PySide6.QtWidgets import QWidget
+from src.config        import CONFIG
+from src.layers        import BASE_LAYER
+from src.search        import SearchIndex
+from src.sequences     import SEQUENCE_SEPARATOR, split_sequence
+import heapq
+import string
+
+# =-----------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Ordered keys given to the new hotkeys, lowercase as stored within the CONFIG dictionary.
+FREE_KEYS: List[str] = list(dict.fromkeys(c.lower() for c in string.printable if not c.isspace()))
+
+# Index of every free key within the FREE_KEYS list.
+FREE_KEYS_INDEX: Dict[str, int] = {key: index for index, key in enumerate(FREE_KEYS)}
+
+# =-------------------------------------------------------------------------------------= #
+
+
+# =-------------------= #
+# HotkeyRegistry class #
+# =-------------------= #
+
+class HotkeyRegistry:
+    """
+    Hotkey Registry class holding the bidirectional key <-> widget maps
+    of the hotkeys, the pool of the free keys for the new hotkeys and
+    the index of the shortcuts, making every lookup and conflict check
+    constant time whatever the number of hotkeys. A key conflicts with
+    the keys it starts with or starting with it, as such sequences would
+    shadow each other, so the chord prefixes of the keys are indexed too.
+    The widgets are also kept within a search index by key, action type
+    and coordinates.
+    The bindings themselves remain the CONFIG["hotkeys"] dictionary, or the
+    CONFIG["layers"] one of the registry's layer, read by the hotkey
+    routine, the registry only keeping it up to date.
+    """
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, layer: str = BASE_LAYER) -> None:
+        """
+        Initializer method.
+
+        :param str layer: The name of the layer whose hotkeys are registered. By default, the base one.
+        """
+
+        # Initialize the straight-forward attributes.
+        self._layer: str = layer
+        self._widgets: Dict[str, QWidget] = {}
+        self._keys: Dict[QWidget, str] = {}
+        self._free_keys: List[int] = list(range(len(FREE_KEYS)))
+        self._pooled_keys: Set[int] = set(self._free_keys)
+        self._shortcuts: Dict[str, str] = {}
+        self._prefixes: Dict[str, int] = {}
+        self._shortcut_prefixes: Set[str] = set()
+        self._search_index: SearchIndex = SearchIndex()
+
+        # Index the current shortcuts.
+        self.update_shortcuts()
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def reset(self) -> None:
+        """Forget every registered widget and refill the free keys pool, as when the CONFIG dictionary is replaced."""
+
+        # Clear the widgets maps and refill the free keys pool.
+        self._widgets.clear()
+        self._keys.clear()
+        self._prefixes.clear()
+        self._refill_free_keys()
+        self._search_index.clear()
+
+    def update_shortcuts(self) -> None:
+        """Index the builtin and custom shortcuts from the CONFIG dictionary to check the conflicts against."""
+
+        # Refill the free keys pool, as the keys used by the previous shortcuts may be free now.
+        self._refill_free_keys()
+
+        # Index every shortcut lowercase, as the hotkeys are.
+        self._shortcuts = {
+            shortcut.lower(): f"builtin shortcut \"{action}\"" for action, shortcut in
+            CONFIG["shortcuts"]["builtin"].items()
+        }
+        self._shortcuts.update({
+            shortcut.lower(): f"custom shortcut \"{shortcut}\"" for shortcut in CONFIG["shortcuts"]["custom"]
+        })
+        self._shortcut_prefixes = {prefix for shortcut in self._shortcuts for prefix in self._chord_prefixes(shortcut)}
+
+    def allocate(self) -> str:
+        """
+        Return the first free key, neither used by a hotkey nor by a shortcut.
+        If every key is used, return an empty string, the hotkey being unassigned.
+
+        :returns: The first free key.
+        :rtype: str
+        """
+
+        #   Pop the keys taken since they have been freed, the pool being
+        # lazily updated. The first free key remains within the pool.
+        while self._free_keys:
+            key: str = FREE_KEYS[self._free_keys[0]]
+            if self.conflict(key) is None:
+                return key
+            self._pooled_keys.discard(heapq.heappop(self._free_keys))
+        return ""
+
+    def conflict(self, key: str, widget: Optional[QWidget] = None) -> Optional[str]:
+        """
+        Return the description of what the given key is already used by, or None if it is free.
+        A key is also used if it starts with a used key, or if a used key starts with it, a sequence
+        being complete as soon as its last chord is pressed. If a widget is provided, its own hotkey
+        isn't considered as a conflict.
+
+        :param str key: The key to check.
+        :param widget: The optional widget the key is checked for. By default, None.
+        :type widget: QWidget or None
+        :returns: The description of what the key is already used by, or None.
+        :rtype: str or None
+        """
+
+        # Check the key itself.
+        key = key.lower()
+        own_key: Optional[str] = self._keys.get(widget) if widget is not None else None
+        conflict: Optional[str] = self._used_by(key, own_key)
+        if conflict is not None:
+            return conflict
+
+        # Check the keys the key starts with.
+        for prefix in self._chord_prefixes(key):
+            conflict = self._used_by(prefix, own_key)
+            if conflict is not None:
+                return f"{conflict} it starts with"
+
+        # Check the keys starting with the key, the widget's own key left out.
+        starting_keys: int = self._prefixes.get(key, 0)
+        if own_key is not None and own_key.startswith(key + SEQUENCE_SEPARATOR):
+            starting_keys -= 1
+        if starting_keys > 0:
+            return "hotkey starting with it"
+        if key in self._shortcut_prefixes:
+            return "shortcut starting with it"
+        return None
+
+    def register(self, widget: QWidget, key: str, binding: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Register the given widget as the one displaying the given key.
+        If a binding is provided, set it as the key's binding.
+
+        :param QWidget widget: The widget to register.
+        :param str key: The key displayed by the widget.
+        :param binding: The optional binding of the key. By default, None.
+        :type binding: Dict[str, Any] or None
+        """
+
+        # Update the widgets maps and the binding.
+        key = key.lower()
+        if key not in self._widgets:
+            self._index_prefixes(key, 1)
+        self._widgets[key] = widget
+        self._keys[widget] = key
+        if binding is not None:
+            self.bindings[key] = binding
+        self._index(key)
+
+    def unregister(self, widget: QWidget) -> None:
+        """
+        Unregister the given widget, deleting its key's binding and freeing its key.
+
+        :param QWidget widget: The widget to unregister.
+        """
+
+        # Remove the widget from the widgets maps, returning here if it isn't registered.
+        key: Optional[str] = self._keys.pop(widget, None)
+        if key is None:
+            return
+        if self._widgets.get(key) is widget:
+            del self._widgets[key]
+            self._index_prefixes(key, -1)
+        self._search_index.remove(widget)
+
+        # Delete the binding and free the key.
+        self.bindings.pop(key, None)
+        self._free(key)
+
+    def rename(self, widget: QWidget, key: str) -> Optional[str]:
+        """
+        Move the given widget and its binding to the given key.
+        If the key is already used, leave everything unchanged and return the description
+        of what the key is already used by, otherwise return None.
+
+        :param QWidget widget: The widget to move.
+        :param str key: The new key of the widget.
+        :returns: The description of what the key is already used by, or None.
+        :rtype: str or None
+        """
+
+        # Ensure the key is free.
+        key = key.lower()
+        conflict: Optional[str] = self.conflict(key, widget)
+        if conflict is not None:
+            return conflict
+
+        # Move the binding, preserving its type, along with the widget, then free the previous key.
+        previous_key: Optional[str] = self._keys.get(widget)
+        binding: Optional[Dict[str, Any]] = None
+        if previous_key is not None and previous_key != key:
+            binding = self.bindings.pop(previous_key, None)
+            if self._widgets.get(previous_key) is widget:
+                del self._widgets[previous_key]
+                self._index_prefixes(previous_key, -1)
+            self._free(previous_key)
+        self.register(widget, key, binding)
+        return None
+
+    def update_binding(self, key: str, **values: Any) -> None:
+        """
+        Merge the given values into the key's binding, preserving the other ones such as its type.
+        A new binding is a "Click" one.
+
+        :param str key: The key whose binding to update.
+        :param values: The values to merge into the binding, such as 'x', 'y', 'w' and 'h'.
+        :type values: Any
+        """
+
+        # Update the binding in place, creating it if needed, then index the widget again.
+        key = key.lower()
+        self.bindings.setdefault(key, {"type": "Click"}).update(values)
+        self._index(key)
+
+    def search(self, query: str, limit: Optional[int] = None) -> Optional[Set[QWidget]]:
+        """
+        Return the widgets whose key, action type or coordinates contain every word of the given query,
+        case-insensitively, or None if a limit is given and more widgets match.
+
+        :param str query: The text to search.
+        :param limit: The maximum number of widgets to return, or None. By default, None.
+        :type limit: int or None
+        :returns: The matching widgets, or None if there are more than the limit.
+        :rtype: Set[QWidget] or None
+        """
+        return self._search_index.search(query, limit)
+
+    def widget(self, key: str) -> Optional[QWidget]:
+        """
+        Return the widget displaying the given key, or None.
+
+        :param str key: The key of the widget.
+        :returns: The widget displaying the given key, or None.
+        :rtype: QWidget or None
+        """
+        return self._widgets.get(key.lower())
+
+    def key(self, widget: QWidget) -> Optional[str]:
+        """
+        Return the key displayed by the given widget, or None.
+
+        :param QWidget widget: The widget of the key.
+        :returns: The key displayed by the given widget, or None.
+        :rtype: str or None
+        """
+        return self._keys.get(widget)
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _index(self, key: str) -> None:
+        """
+        Index the widget displaying the given key, if any, by its key, its action type and its coordinates.
+
+        :param str key: The lowercase key of the widget.
+        """
+
+        # Index the widget, the coordinates being unknown until the circle is placed.
+        widget: Optional[QWidget] = self._widgets.get(key)
+        if widget is None:
+            return
+        binding: Dict[str, Any] = self.bindings.get(key, {})
+        self._search_index.update(
+            widget, key, binding.get("type", ""), *(binding[axis] for axis in ("x", "y") if axis in binding)
+        )
+
+    def _used_by(self, key: str, own_key: Optional[str] = None) -> Optional[str]:
+        """
+        Return the description of what the given exact key is used by, or None if it is free.
+
+        :param str key: The lowercase key to check.
+        :param own_key: The optional key of the widget the key is checked for, not being a conflict. By default, None.
+        :type own_key: str or None
+        :returns: The description of what the key is used by, or None.
+        :rtype: str or None
+        """
+
+        # Check the hotkeys, including the ones without a widget or a binding yet, then the shortcuts.
+        if (key in self.bindings or key in self._widgets) and key != own_key:
+            return "hotkey"
+        return self._shortcuts.get(key)
+
+    def _index_prefixes(self, key: str, step: int) -> None:
+        """
+        Count the given key's chord prefixes once more, or once less, forgetting the ones no key starts with.
+
+        :param str key: The lowercase key whose prefixes to count.
+        :param int step: 1 if the key got registered, -1 if it got unregistered.
+        """
+        for prefix in self._chord_prefixes(key):
+            count: int = self._prefixes.get(prefix, 0) + step
+            if count > 0:
+                self._prefixes[prefix] = count
+            else:
+                self._prefixes.pop(prefix, None)
+
+    def _free(self, key: str) -> None:
+        """
+        Give the given key back to the free keys pool if it belongs to it and isn't within it yet,
+        the allocated keys remaining within the pool until found taken.
+
+        :param str key: The key to free.
+        """
+        index: Optional[int] = FREE_KEYS_INDEX.get(key)
+        if index is not None and index not in self._pooled_keys:
+            self._pooled_keys.add(index)
+            heapq.heappush(self._free_keys, index)
+
+    def _refill_free_keys(self) -> None:
+        """Refill the free keys pool with every key, a sorted list being a valid heap."""
+        self._free_keys = list(range(len(FREE_KEYS)))
+        self._pooled_keys = set(self._free_keys)
+
+    @staticmethod
+    def _chord_prefixes(key: str) -> List[str]:
+        """
+        Return the sequences of the given key's first chords, from its first chord to every chord but its last.
+
+        :param str key: The key (e.g.: "g, 3, h").
+        :returns: The chord prefixes of the key (e.g.: ["g", "g, 3"]).
+        :rtype: List[str]
+        """
+        chords: List[str] = split_sequence(key)
+        return [SEQUENCE_SEPARATOR.join(chords[:index]) for index in range(1, len(chords))]
+
+    # ============== #
+    # Getter methods #
+    # ============== #
+
+    @property
+    def layer(self) -> str:
+        """
+        Getter method for the layer attribute.
+
+        :returns: The layer attribute.
+        :rtype: str
+        """
+        return self._layer
+
+    @property
+    def bindings(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Getter method for the bindings of the registry's layer, created if the layer doesn't exist yet.
+        They are looked up from the CONFIG dictionary on each access, as it is replaced on each config loading.
+
+        :returns: The bindings by hotkey.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        if self._layer == BASE_LAYER:
+            return CONFIG["hotkeys"]
+        return CONFIG["layers"].setdefault(self._layer, {})
+
+    @property
+    def keys(self) -> KeysView[str]:
+        """
+        Getter method for the hotkeys, as a live view of the CONFIG dictionary.
+
+        :returns: The hotkeys.
+        :rtype: KeysView[str]
+        """
+        return self.bindings.keys()
+
+# =-------------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    Scheduler class used by the HotClick software.
+    The scheduled steps are timed from the monotonic
+    clock: the scheduler sleeps coarsely until shortly
+    before each deadline, then spins until it elapses,
+    the spinning margin adapting to how late the sleeps
+    of the system wake up.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+import threading
+import time
+import src.logger as logger
+
+# =----------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Minimum and maximum durations, in seconds, spent spinning before each deadline.
+MIN_SPIN_DURATION: float = 0.002
+MAX_SPIN_DURATION: float = 0.020
+
+# Longest coarse sleep, in seconds, so the cancellation conditions are checked regularly.
+MAX_SLEEP_DURATION: float = 0.005
+
+#   Weight of the last measured oversleep within the oversleep estimate,
+# also the decay of the estimate on each wait without any sleep.
+OVERSLEEP_SMOOTHING: float = 0.2
+
+#   Maximum fraction of the interval between two steps spent spinning before the latter,
+# so a run of short intervals keeps sleeping whatever the oversleep of the system.
+MAX_SPIN_FRACTION: float = 0.5
+
+#   Maximum number of runs spinning at once, the other ones sleeping until their deadline,
+# so several runs at once never keep more than a core busy nor starve the keyboard hook.
+MAX_SPINNING_RUNS: int = 1
+
+# Maximum number of steps whose jitter is reported one by one, the longer runs being summarized.
+MAX_REPORTED_JITTERS: int = 50
+
+# =-------------------------------------------------------------------------------------= #
+
+
+# =----------------= #
+# ScheduledRun class #
+# =----------------= #
+
+class ScheduledRun:
+    """
+    Scheduled Run class running timed steps on its own thread, each one at its offset from
+    the start of the run, and measuring the jitter of each step, i.e. how late it started.
+    The steps may be generated lazily, even endlessly, the offsets being non-decreasing, and a step
+    returning False got dropped (e.g.: a click beyond its rate limit), the run counting such steps.
+    The run stops early once cancelled, or once its optional cancellation condition is met.
+    """
+
+    __slots__ = (
+        "key", "steps", "condition", "jitters", "count", "dropped", "max_jitter", "total_jitter", "first_step",
+        "last_step", "completed", "_scheduler", "_cancelled", "_thread"
+    )
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(
+            self,
+            scheduler: "Scheduler",
+            key: Hashable,
+            steps: Iterable[Tuple[float, Callable[[], Optional[bool]]]],
+            condition: Optional[Callable[[], bool]] = None
+    ) -> None:
+        """
+        Initializer method.
+
+        :param Scheduler scheduler: The scheduler running the steps.
+        :param Hashable key: The key identifying the run within the scheduler (e.g.: its action).
+        :param steps: The steps to run, each one as its offset in seconds from the start and its function.
+        :type steps: Iterable[Tuple[float, Callable[[], Optional[bool]]]]
+        :param condition: The optional function returning True once the run must stop. By default, None.
+        :type condition: Callable[[], bool] or None
+        """
+
+        # Set the straight-forward attributes.
+        self.key: Hashable = key
+        self.steps: Iterable[Tuple[float, Callable[[], Optional[bool]]]] = steps
+        self.condition: Optional[Callable[[], bool]] = condition
+        self.jitters: List[float] = []
+        self.count: int = 0
+        self.dropped: int = 0
+        self.max_jitter: float = 0.0
+        self.total_jitter: float = 0.0
+        self.first_step: float = 0.0
+        self.last_step: float = 0.0
+        self.completed: bool = False
+        self._scheduler: Scheduler = scheduler
+        self._cancelled: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, daemon=True)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def start(self) -> None:
+        """Start running the steps on the run's own thread."""
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop the run before its next step."""
+        self._cancelled.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the run to finish.
+
+        :param timeout: The optional duration to wait for at most, in seconds. By default, None.
+        :type timeout: float or None
+        """
+        self._thread.join(timeout)
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _run(self) -> None:
+        """Run every step at its deadline, unless cancelled meanwhile, then report the measured jitters and drops."""
+        try:
+            start: float = time.perf_counter()
+            previous_offset: float = 0.0
+            for offset, step in self.steps:
+                max_spin: float = max(MIN_SPIN_DURATION, MAX_SPIN_FRACTION * (offset - previous_offset))
+                if not self._scheduler.wait_until(start + offset, self._stopped, max_spin):
+                    break
+                previous_offset = offset
+                self._measure(time.perf_counter(), start + offset)
+                if step() is False:
+                    self.dropped += 1
+            else:
+                self.completed = True
+        except Exception as e:
+            logger.error("Exception raised while running a scheduled sequence: " + str(e))
+        finally:
+            self._scheduler.finished(self)
+
+    def _measure(self, now: float, deadline: float) -> None:
+        """
+        Measure the jitter of the step run at the given time, keeping the jitter of every step only for the short runs.
+
+        :param float now: The time the step started at, as a time.perf_counter value.
+        :param float deadline: The deadline of the step, as a time.perf_counter value.
+        """
+        jitter: float = now - deadline
+        if self.count < MAX_REPORTED_JITTERS:
+            self.jitters.append(jitter)
+        if not self.count:
+            self.first_step = now
+        self.count += 1
+        self.max_jitter = max(self.max_jitter, jitter)
+        self.total_jitter += jitter
+        self.last_step = now
+
+    def _stopped(self) -> bool:
+        """
+        Return True if the run got cancelled or if its cancellation condition is met.
+
+        :returns: True if the run must stop.
+        :rtype: bool
+        """
+        return self._cancelled.is_set() or (self.condition is not None and self.condition())
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Getter method for whether the run got cancelled.
+
+        :returns: True if the run got cancelled.
+        :rtype: bool
+        """
+        return self._cancelled.is_set()
+
+    @property
+    def rate(self) -> float:
+        """
+        Getter method for the achieved rate of the run, in steps per second, between its first and its last step.
+
+        :returns: The achieved rate, or 0 if the run hasn't run two steps yet.
+        :rtype: float
+        """
+        return (self.count - 1) / (self.last_step - self.first_step) if self.last_step > self.first_step else 0.0
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------= #
+# Scheduler class #
+# =-------------= #
+
+class Scheduler:
+    """
+    Scheduler class starting the scheduled runs, at most one per key, and timing their steps.
+    Each deadline is reached by sleeping coarsely until shortly before it, then spinning on the
+    monotonic clock, the spinning margin following the measured oversleep of the system.
+    """
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+
+        # Initialize the straight-forward attributes.
+        self._runs: Dict[Hashable, ScheduledRun] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._oversleep: float = 0.0
+        self._spinning_slots: threading.Semaphore = threading.Semaphore(MAX_SPINNING_RUNS)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def start(
+            self,
+            key: Hashable,
+            steps: Iterable[Tuple[float, Callable[[], Optional[bool]]]],
+            condition: Optional[Callable[[], bool]] = None
+    ) -> ScheduledRun:
+        """
+        Start running the given steps, each one at its offset in seconds from now,
+        cancelling the run already started for the same key, if any.
+
+        :param Hashable key: The key identifying the run (e.g.: its action).
+        :param steps: The steps to run, each one as its offset in seconds from the start and its function.
+        :type steps: Iterable[Tuple[float, Callable[[], Optional[bool]]]]
+        :param condition: The optional function returning True once the run must stop. By default, None.
+        :type condition: Callable[[], bool] or None
+        :returns: The started run.
+        :rtype: ScheduledRun
+        """
+        run: ScheduledRun = ScheduledRun(self, key, steps, condition)
+        with self._lock:
+            previous_run: Optional[ScheduledRun] = self._runs.get(key)
+            if previous_run is not None:
+                previous_run.cancel()
+            self._runs[key] = run
+        run.start()
+        return run
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancel the run of the given key, if any.
+
+        :param Hashable key: The key identifying the run.
+        :returns: True if a run got cancelled.
+        :rtype: bool
+        """
+        with self._lock:
+            run: Optional[ScheduledRun] = self._runs.pop(key, None)
+        if run is None:
+            return False
+        run.cancel()
+        return True
+
+    def cancel_all(self) -> None:
+        """Cancel every run."""
+        with self._lock:
+            runs: List[ScheduledRun] = list(self._runs.values())
+            self._runs.clear()
+        for run in runs:
+            run.cancel()
+
+    def get(self, key: Hashable) -> Optional[ScheduledRun]:
+        """
+        Return the run of the given key in progress, or None.
+
+        :param Hashable key: The key identifying the run.
+        :returns: The run in progress, or None.
+        :rtype: ScheduledRun or None
+        """
+        return self._runs.get(key)
+
+    def wait_until(
+            self,
+            deadline: float,
+            stopped: Optional[Callable[[], bool]] = None,
+            max_spin: float = MAX_SPIN_DURATION
+    ) -> bool:
+        """
+        Wait until the given deadline of the monotonic clock, sleeping coarsely then spinning.
+        Return False as soon as the optional stopped function returns True, checked between the sleeps.
+
+        :param float deadline: The deadline, as a time.perf_counter value.
+        :param stopped: The optional function returning True once the wait must stop. By default, None.
+        :type stopped: Callable[[], bool] or None
+        :param float max_spin: The longest duration to spin for, in seconds. By default, MAX_SPIN_DURATION.
+        :returns: True if the deadline elapsed, False if the wait got stopped.
+        :rtype: bool
+        """
+
+        #   Sleep coarsely until the spinning margin before the deadline, measuring the oversleep of each sleep.
+        # If no sleep happens, decay the estimate instead, as it can't be measured anymore once the margin
+        # exceeds the time left before every deadline, which would otherwise keep spinning for good.
+        slept: bool = False
+        while True:
+            if stopped is not None and stopped():
+                return False
+            remaining: float = deadline - time.perf_counter() - min(self.spin_duration, max_spin)
+            if remaining <= 0:
+                break
+            duration: float = min(remaining, MAX_SLEEP_DURATION)
+            asleep: float = time.perf_counter()
+            time.sleep(duration)
+            self._oversleep += OVERSLEEP_SMOOTHING * (time.perf_counter() - asleep - duration - self._oversleep)
+            slept = True
+        if not slept:
+            self._oversleep *= 1 - OVERSLEEP_SMOOTHING
+
+        #   Spin until the deadline, yielding to the other threads at each iteration, unless
+        # enough runs are spinning already, in which case sleep until the deadline instead.
+        if self._spinning_slots.acquire(blocking=False):
+            try:
+                while time.perf_counter() < deadline:
+                    time.sleep(0)
+            finally:
+                self._spinning_slots.release()
+        else:
+            time.sleep(max(deadline - time.perf_counter(), 0))
+        return True
+
+    def finished(self, run: ScheduledRun) -> None:
+        """
+        Forget the given finished run and report the jitter measured for each of its steps, and its dropped steps.
+
+        :param ScheduledRun run: The finished run.
+        """
+
+        # Forget the run, unless another run replaced it meanwhile.
+        with self._lock:
+            if self._runs.get(run.key) is run:
+                del self._runs[run.key]
+
+        #   Report the jitter of each step in milliseconds, or summarize the long runs along with their
+        # achieved rate, along with the number of steps actually performed if some got dropped.
+        if not run.count:
+            return
+        state: str = "done" if run.completed else "cancelled"
+        drops: str = f", {run.count - run.dropped} steps performed and {run.dropped} dropped" if run.dropped else ""
+        if run.count <= MAX_REPORTED_JITTERS:
+            logger.info(
+                f"Sequence {state}{drops}, "
+                f"jitter per step (ms): " + ", ".join(f"{jitter * 1000:.3f}" for jitter in run.jitters)
+            )
+        else:
+            logger.info(
+                f"Sequence {state} after {run.count} steps at {run.rate:.1f} per second{drops}, jitter (ms): "
+                f"mean {run.total_jitter / run.count * 1000:.3f}, max {run.max_jitter * 1000:.3f}"
+            )
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def spin_duration(self) -> float:
+        """
+        Getter method for the duration spent spinning before each deadline, in seconds,
+        twice the estimated oversleep of the system within the spinning bounds.
+
+        :returns: The spinning duration.
+        :rtype: float
+        """
+        return min(max(2 * self._oversleep, MIN_SPIN_DURATION), MAX_SPIN_DURATION)
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =---------------= #
+# TokenBucket class #
+# =---------------= #
+
+class TokenBucket:
+    """
+    Token Bucket class limiting the rate of an operation shared by several threads: the tokens
+    refill at the given rate up to the given capacity, and each operation takes a token if any.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_last", "_lock")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initializer method.
+
+        :param float rate: The number of tokens refilled per second.
+        :param float capacity: The maximum number of tokens, i.e. the largest burst.
+        """
+
+        # Set the straight-forward attributes, the bucket being full.
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._last: float = time.perf_counter()
+        self._lock: threading.Lock = threading.Lock()
+
+    # ============= #
+    # Public method #
+    # ============= #
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if any, refilling the bucket for the time elapsed since the last call.
+
+        :returns: True if a token got taken.
+        :rtype: bool
+        """
+        with self._lock:
+            now: float = time.perf_counter()
+            self._tokens = min(self._tokens + (now - self._last) * self.rate, self.capacity)
+            self._last = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =------------------------= #
+# Scheduler utility function #
+# =------------------------= #
+
+def periodic_steps(
+        interval: float,
+        step: Callable[[], Optional[bool]]
+) -> Iterator[Tuple[float, Callable[[], Optional[bool]]]]:
+    """
+    Yield the given step endlessly every given interval, each offset being computed from the start
+    rather than from the previous step so the errors never accumulate. The steps whose deadline
+    already elapsed by the time the previous one ran are skipped instead of being run in a burst.
+
+    :param float interval: The interval between two steps, in seconds.
+    :param step: The step to run.
+    :type step: Callable[[], Optional[bool]]
+    :returns: The steps, each one as its offset in seconds from the start and its function.
+    :rtype: Iterator[Tuple[float, Callable[[], Optional[bool]]]]
+    """
+    start: float = time.perf_counter()
+    tick: int = 0
+    while True:
+        yield tick * interval, step
+        tick = max(tick + 1, int((time.perf_counter() - start) / interval))
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-------= #
+# Scheduler #
+# =-------= #
+
+# The scheduler running the timed sequences.
+SCHEDULER: Scheduler = Scheduler()
+
+# =------------------------------------= #
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    SearchIndex class used by the HotClick software.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from itertools import chain, islice
+
+# =------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Length of the longest n-grams indexed, the longer queries being answered by intersecting such n-grams.
+SEARCH_INDEX_GRAM_SIZE: int = 3
+
+#   Maximum number of matches the hotkeys search highlights, a search matching more
+# of them highlighting none rather than repainting most of the hotkeys.
+SEARCH_RESULTS_LIMIT: int = 1000
+
+# Maximum number of tokens a search narrows down one by one, the items of a word found within more tokens being chained.
+SEARCH_INDEX_MAX_GROUPS: int = 16
+
+# =-----------------------------------------------------------------------------------------------------= #
+
+
+# =---------------= #
+# SearchIndex class #
+# =---------------= #
+
+class SearchIndex:
+    """
+    Search Index class finding the items whose fields contain every word of a query, case-insensitively.
+    Each field is a token of its own, made of its position and its value, so the many items sharing a
+    value (e.g.: an action type) share a single token. Every substring of up to SEARCH_INDEX_GRAM_SIZE
+    characters of the distinct values is indexed along with the number of items it is found in at each
+    position, so a short word is an exact lookup and a longer one intersects the tokens of its n-grams
+    before checking the few distinct values left, never the items themselves.
+    The items of the different values of a same position being distinct, the number of items a word
+    matches is known before building its result, so the words matching too many items are answered
+    right away. Adding, updating or removing an item only updates the postings of its own tokens.
+    """
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+
+        # Initialize the straight-forward attributes.
+        self._fields: Dict[Hashable, Tuple[str, ...]] = {}
+        self._texts: Dict[Hashable, str] = {}
+        self._items: Dict[Tuple[int, str], Set[Hashable]] = {}
+        self._grams: Dict[Tuple[int, str], Set[str]] = {}
+        self._postings: Dict[str, Dict[Tuple[int, str], Set[Hashable]]] = {}
+        self._counts: Dict[str, Dict[int, int]] = {}
+
+    # ================= #
+    # Overridden method #
+    # ================= #
+
+    def __len__(self) -> int:
+        """
+        Overridden __len__ method.
+
+        :returns: The number of indexed items.
+        :rtype: int
+        """
+        return len(self._fields)
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def clear(self) -> None:
+        """Remove every item from the SearchIndex."""
+        self._fields.clear()
+        self._texts.clear()
+        self._items.clear()
+        self._grams.clear()
+        self._postings.clear()
+        self._counts.clear()
+
+    def update(self, item: Hashable, *fields: object) -> None:
+        """
+        Index the given item under the given fields (e.g.: its key, its action or its coordinates),
+        replacing its previous fields if it is already indexed. The items should give their fields
+        in the same order, each position holding the same kind of field.
+
+        :param Hashable item: The item to index.
+        :param fields: The fields the item can be found by.
+        :type fields: object
+        """
+
+        # Ignore the unchanged items.
+        values: Tuple[str, ...] = tuple(str(field).lower() for field in fields)
+        if self._fields.get(item) == values:
+            return
+
+        # Replace the previous fields by the new ones, the words never spanning a space.
+        self.remove(item)
+        self._fields[item] = values
+        self._texts[item] = ' '.join(values)
+
+        # Add the item to its tokens, indexing the n-grams of the new tokens, and count it within their n-grams.
+        for token in enumerate(values):
+            items: Optional[Set[Hashable]] = self._items.get(token)
+            if items is None:
+                items = self._items[token] = set()
+                self._grams[token] = self._split(token[1])
+                for gram in self._grams[token]:
+                    self._postings.setdefault(gram, {})[token] = items
+            items.add(item)
+            for gram in self._grams[token]:
+                counts: Dict[int, int] = self._counts.setdefault(gram, {})
+                counts[token[0]] = counts.get(token[0], 0) + 1
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Remove the given item from the SearchIndex, if indexed.
+
+        :param Hashable item: The item to remove.
+        """
+
+        # Forget the item's fields.
+        values: Optional[Tuple[str, ...]] = self._fields.pop(item, None)
+        if values is None:
+            return
+        del self._texts[item]
+
+        # Remove the item from its tokens and their n-grams' counts, forgetting the tokens left without item.
+        for token in enumerate(values):
+            for gram in self._grams[token]:
+                self._counts[gram][token[0]] -= 1
+            items: Set[Hashable] = self._items[token]
+            items.discard(item)
+            if items:
+                continue
+            del self._items[token]
+            for gram in self._grams.pop(token):
+                tokens: Dict[Tuple[int, str], Set[Hashable]] = self._postings[gram]
+                del tokens[token]
+                if not tokens:
+                    del self._postings[gram]
+                    del self._counts[gram]
+
+    def search(self, query: str, limit: Optional[int] = None) -> Optional[Set[Hashable]]:
+        """
+        Return the items having a field containing each word of the given query, case-insensitively.
+        An empty query matches every item. If a limit is given and more items match, return None,
+        such queries being mostly detected from the counts of their words, without building any result.
+
+        :param str query: The text to search.
+        :param limit: The maximum number of items to return, or None. By default, None.
+        :type limit: int or None
+        :returns: The matching items, or None if there are more than the limit.
+        :rtype: Set[Hashable] or None
+        """
+
+        #   Count the items each word matches at each position, leaving
+        # out the words matching every item, which narrow nothing down.
+        words: List[Tuple[int, int, str]] = []
+        for word in set(query.lower().split()):
+            counts: Dict[int, int] = self._word_counts(word)
+            lower_bound: int = max(counts.values(), default=0)
+            if lower_bound < len(self._fields):
+                words.append((sum(counts.values()), lower_bound, word))
+
+        #   Return if the matches are known to exceed the limit from the words' counts only, every
+        # word missing at most the items it doesn't match at the position it matches the most.
+        if limit is not None and sum(lower_bound for _, lower_bound, _ in words) \
+                - max(len(words) - 1, 0) * len(self._fields) > limit:
+            return None
+
+        #   Narrow the matches down lazily from the most selective word's tokens, a token whose value contains a
+        # word matching it as a whole, otherwise checking the texts of its items when they are fewer than the
+        # word's matches, or intersecting them with the word's matches. The tokens of a word found within many
+        # values (e.g.: the keys) are chained, as checking them one by one would cost more than it saves.
+        groups: Optional[List[Tuple[str, Iterable[Hashable]]]] = None
+        upper_bound: int = len(self._fields)
+        for count, _, word in sorted(words):
+            if groups is None:
+                tokens: Dict[Tuple[int, str], Set[Hashable]] = self._tokens(word)
+                groups = [(token[1], items) for token, items in tokens.items()] \
+                    if len(tokens) <= SEARCH_INDEX_MAX_GROUPS else [("", chain.from_iterable(tokens.values()))]
+            elif upper_bound < count:
+                groups = [
+                    (value, items if word in value else self._text_matches(items, word)) for value, items in groups
+                ]
+            else:
+                word_items: Set[Hashable] = set().union(*self._tokens(word).values())
+                groups = [
+                    (value, items if word in value else
+                     items & word_items if isinstance(items, set) else self._set_matches(items, word_items))
+                    for value, items in groups
+                ]
+            upper_bound = min(upper_bound, count)
+
+        # Match every item if no word narrowed them down.
+        if groups is None:
+            return None if limit is not None and len(self._fields) > limit else set(self._fields)
+
+        #   Gather the matches, by chunks of the number of matches still allowed,
+        # stopping as soon as they exceed the limit.
+        matches: Set[Hashable] = set()
+        for _, items in groups:
+            if limit is None:
+                matches.update(items)
+                continue
+            items = iter(items)
+            chunk: List[Hashable] = list(islice(items, limit + 1 - len(matches)))
+            while chunk:
+                matches.update(chunk)
+                if len(matches) > limit:
+                    return None
+                chunk = list(islice(items, limit + 1 - len(matches)))
+        return matches
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _word_counts(self, word: str) -> Dict[int, int]:
+        """
+        Return the number of items whose field at each position contains the given word.
+
+        :param str word: The word to count, lowercase.
+        :returns: The number of matching items, by position.
+        :rtype: Dict[int, int]
+        """
+
+        # Read the counts of the short words directly.
+        if len(word) <= SEARCH_INDEX_GRAM_SIZE:
+            return self._counts.get(word, {})
+
+        # Otherwise, sum the items of the word's tokens.
+        counts: Dict[int, int] = {}
+        for token, items in self._tokens(word).items():
+            counts[token[0]] = counts.get(token[0], 0) + len(items)
+        return counts
+
+    def _tokens(self, word: str) -> Dict[Tuple[int, str], Set[Hashable]]:
+        """
+        Return the items of the tokens whose value contains the given word, by token.
+
+        :param str word: The word to look up, lowercase.
+        :returns: The items of the matching tokens, by token.
+        :rtype: Dict[Tuple[int, str], Set[Hashable]]
+        """
+
+        # Look the short words up directly, such a lookup being exact.
+        if len(word) <= SEARCH_INDEX_GRAM_SIZE:
+            return self._postings.get(word, {})
+
+        #   Intersect the tokens of the word's n-grams from the smallest one, then
+        # check the distinct values left, as the n-grams may be found apart.
+        postings: List[Dict[Tuple[int, str], Set[Hashable]]] = sorted(
+            (self._postings.get(word[i:i + SEARCH_INDEX_GRAM_SIZE], {})
+             for i in range(len(word) - SEARCH_INDEX_GRAM_SIZE + 1)),
+            key=len
+        )
+        candidates: Set[Tuple[int, str]] = set(postings[0])
+        for tokens in postings[1:]:
+            if not candidates:
+                break
+            candidates &= tokens.keys()
+        return {token: self._items[token] for token in candidates if word in token[1]}
+
+    def _text_matches(self, items: Iterable[Hashable], word: str) -> Iterator[Hashable]:
+        """
+        Yield the given items whose text contains the given word.
+
+        :param items: The items to check.
+        :type items: Iterable[Hashable]
+        :param str word: The word to look up, lowercase.
+        :returns: The matching items.
+        :rtype: Iterator[Hashable]
+        """
+        return (item for item in items if word in self._texts[item])
+
+    @staticmethod
+    def _set_matches(items: Iterable[Hashable], matches: Set[Hashable]) -> Iterator[Hashable]:
+        """
+        Yield the given items found within the given matches.
+
+        :param items: The items to check.
+        :type items: Iterable[Hashable]
+        :param matches: The matches to look the items up in.
+        :type matches: Set[Hashable]
+        :returns: The matching items.
+        :rtype: Iterator[Hashable]
+        """
+        return (item for item in items if item in matches)
+
+    @staticmethod
+    def _split(text: str) -> Set[str]:
+        """
+        Return every distinct substring of the given text of up to SEARCH_INDEX_GRAM_SIZE characters.
+
+        :param str text: The text to split.
+        :returns: The distinct n-grams of the text.
+        :rtype: Set[str]
+        """
+        return {
+            text[i:i + size] for size in range(1, SEARCH_INDEX_GRAM_SIZE + 1) for i in range(len(text) - size + 1)
+        }
+
+# =--------------------------------------------------------------------------------------------------------------= #
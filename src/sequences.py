@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    SequenceMatcher class used by the HotClick software.
+    A hotkey is a sequence of chords separated by ", "
+    (e.g.: "g, 3" or "space, ctrl+a"), a single chord
+    being the shortest sequence. The sequences are kept
+    within a prefix trie walked one chord at a time.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing      import Any, Dict, List, Mapping, Optional
+from src.actions import Action
+import time
+import src.logger as logger
+
+# =-------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Separator of the chords of a sequence.
+SEQUENCE_SEPARATOR: str = ", "
+
+# Default time, in seconds, given to press the next chord of a sequence.
+SEQUENCE_TIMEOUT: float = 1.0
+
+# =-------------------------------------------------------------= #
+
+
+# =-----------------------= #
+# Sequence utility function #
+# =-----------------------= #
+
+def split_sequence(hotkey: str) -> List[str]:
+    """
+    Return the chords of the given hotkey, lowercase, a single chord being the shortest sequence.
+
+    :param str hotkey: The hotkey to split (e.g.: "g, 3").
+    :returns: The chords of the hotkey.
+    :rtype: List[str]
+    """
+    return hotkey.lower().split(SEQUENCE_SEPARATOR)
+
+# =----------------------------------------------------------------------------------= #
+
+
+# =------------= #
+# TrieNode class #
+# =------------= #
+
+class TrieNode:
+    """
+    Trie Node class holding either the action of a complete sequence or the next
+    chords of the sequences starting with the chords leading to it, along with the
+    time given to press the next chord once the node is reached.
+    """
+
+    __slots__ = ("children", "action", "timeout")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, timeout: float = SEQUENCE_TIMEOUT) -> None:
+        """
+        Initializer method.
+
+        :param float timeout: The time given to press the next chord, in seconds. By default, SEQUENCE_TIMEOUT.
+        """
+        self.children: Dict[str, TrieNode] = {}
+        self.action: Optional[Action] = None
+        self.timeout: float = timeout
+
+# =----------------------------------------------------------------------------------= #
+
+
+# =-------------------= #
+# SequenceMatcher class #
+# =-------------------= #
+
+class SequenceMatcher:
+    """
+    Sequence Matcher class matching the pressed chords against the sequences of a prefix trie.
+    Its only state is the node reached by the chords pressed so far along with its deadline, so
+    each chord costs a single dictionary lookup whatever the number and the length of the
+    sequences, and no history of the pressed chords is kept.
+    A sequence being complete as soon as its last chord is pressed, no sequence may start with
+    another one: such shadowed sequences are rejected.
+    """
+
+    __slots__ = ("_root", "_node", "_deadline")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+
+        # Initialize the straight-forward attributes, no chord being pressed yet.
+        self._root: TrieNode = TrieNode()
+        self._node: TrieNode = self._root
+        self._deadline: float = 0.0
+
+    @classmethod
+    def from_dispatch_table(
+            cls,
+            dispatch_table: Mapping[str, Action],
+            hotkeys: Mapping[str, Mapping[str, Any]]
+    ) -> "SequenceMatcher":
+        """
+        Return a SequenceMatcher of the sequences of the given dispatch table, the shortest ones first,
+        reporting and leaving out the shadowed ones. The timeout of a hotkey's sequence is the optional
+        "timeout" of its binding, in milliseconds.
+
+        :param dispatch_table: The action of each sequence.
+        :type dispatch_table: Mapping[str, Action]
+        :param hotkeys: The bindings by hotkey.
+        :type hotkeys: Mapping[str, Mapping[str, Any]]
+        :returns: The SequenceMatcher.
+        :rtype: SequenceMatcher
+        """
+        matcher: SequenceMatcher = cls()
+        for sequence in sorted(dispatch_table, key=lambda hotkey: len(split_sequence(hotkey))):
+            try:
+                matcher.add(
+                    sequence,
+                    dispatch_table[sequence],
+                    float(hotkeys.get(sequence, {}).get("timeout", SEQUENCE_TIMEOUT * 1000)) / 1000
+                )
+            except ValueError as e:
+                logger.error(f"Hotkey \"{sequence.upper()}\" ignored: " + str(e))
+        return matcher
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def add(self, sequence: str, action: Action, timeout: float = SEQUENCE_TIMEOUT) -> None:
+        """
+        Add the given sequence, executing the given action once complete, raising a ValueError if it
+        starts with another sequence or if another sequence starts with it. Each chord of the sequence
+        but the last gives the given time to press the next one, the longest time being kept if several
+        sequences share the chord.
+
+        :param str sequence: The sequence to add (e.g.: "g, 3").
+        :param Action action: The action executed once the sequence is complete.
+        :param float timeout: The time given to press each next chord, in seconds. By default, SEQUENCE_TIMEOUT.
+        """
+
+        # Walk the trie down to the sequence's last chord, checking no shorter sequence is complete on the way.
+        chords: List[str] = split_sequence(sequence)
+        node: TrieNode = self._root
+        nodes: List[TrieNode] = []
+        for index, chord in enumerate(chords[:-1]):
+            node = node.children.get(chord) or TrieNode(timeout)
+            if node.action is not None:
+                raise ValueError(
+                    f"the sequence \"{SEQUENCE_SEPARATOR.join(chords[:index + 1]).upper()}\" is already bound"
+                )
+            nodes.append(node)
+
+        # Ensure no longer sequence starts with the sequence, nor is the sequence already bound.
+        leaf: Optional[TrieNode] = node.children.get(chords[-1])
+        if leaf is not None:
+            raise ValueError("a sequence starting with it is already bound" if leaf.children else "already bound")
+
+        # Link the new nodes, keeping the longest timeout of the shared ones, then bind the action.
+        parent: TrieNode = self._root
+        for chord, child in zip(chords, nodes):
+            child.timeout = max(child.timeout, timeout)
+            parent.children[chord] = child
+            parent = child
+        parent.children[chords[-1]] = TrieNode(timeout)
+        parent.children[chords[-1]].action = action
+
+    def feed(self, chord: str, now: Optional[float] = None) -> Optional[Action]:
+        """
+        Advance the pressed sequence with the given chord, returning the action of the sequence it completes,
+        if any. A chord continuing no sequence starts a new one, and so does a chord pressed too late.
+
+        :param str chord: The pressed chord, lowercase (e.g.: "ctrl+a").
+        :param now: The time the chord got pressed at, as a time.perf_counter value. By default, now.
+        :type now: float or None
+        :returns: The action of the completed sequence, or None.
+        :rtype: Action or None
+        """
+
+        # Start from the reached node, unless its deadline elapsed.
+        if now is None:
+            now = time.perf_counter()
+        node: TrieNode = self._node
+        if node is not self._root and now > self._deadline:
+            node = self._root
+
+        # Continue the sequence, or start a new one with the chord.
+        child: Optional[TrieNode] = node.children.get(chord)
+        if child is None and node is not self._root:
+            child = self._root.children.get(chord)
+
+        # Return the action of the completed sequence, going back to the root.
+        if child is None or child.action is not None:
+            self._node = self._root
+            return None if child is None else child.action
+
+        # Otherwise, wait for the next chord until the node's deadline.
+        self._node = child
+        self._deadline = now + child.timeout
+        return None
+
+    def reset(self) -> None:
+        """Forget the chords pressed so far."""
+        self._node = self._root
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def pending(self) -> bool:
+        """
+        Getter method for whether a sequence is partially pressed, its deadline not being elapsed.
+
+        :returns: True if a sequence is partially pressed.
+        :rtype: bool
+        """
+        return self._node is not self._root and time.perf_counter() <= self._deadline
+
+# =---------------------------------------------------------------------------------------------------------= #
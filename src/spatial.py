@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    SpatialGrid class used by the HotClick software.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing         import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+from PySide6.QtCore import QLine, QPoint, QRect
+import math
+
+# =------------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Side length (in pixels) of the SpatialGrid cells, about twice the default hotkey size.
+SPATIAL_GRID_CELL_SIZE: int = 128
+
+# Distance (in pixels) under which a dragged ellipse snaps to the neighbors alignments.
+SNAP_DISTANCE: int = 8
+
+# Distance (in pixels) around a dragged ellipse within which the neighbors are considered for snapping.
+SNAP_RANGE: int = 4 * SPATIAL_GRID_CELL_SIZE
+
+# =----------------------------------------------------------------------------------------------= #
+
+
+# =---------------= #
+# SpatialGrid class #
+# =---------------= #
+
+class SpatialGrid:
+    """
+    Spatial Grid class indexing the global geometry of the
+    hotkeys ellipses within a uniform grid of square cells.
+    Every item is stored within the cells its bounding rectangle
+    covers, so a neighbors query only visits the cells around
+    the queried area whatever the number of hotkeys, and moving
+    an item only updates the cells it entered or left.
+    """
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, cell_size: int = SPATIAL_GRID_CELL_SIZE) -> None:
+        """
+        Initializer method.
+
+        :param int cell_size: The side length of the cells. By default, SPATIAL_GRID_CELL_SIZE.
+        """
+
+        # Initialize the straight-forward attributes.
+        self._cell_size: int = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._rects: Dict[Hashable, QRect] = {}
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def clear(self) -> None:
+        """Remove every item from the SpatialGrid."""
+        self._cells.clear()
+        self._rects.clear()
+
+    def update(self, item: Hashable, rect: QRect) -> None:
+        """
+        Insert the given item with the given bounding rectangle, or move it if it is already indexed.
+
+        :param Hashable item: The item to index.
+        :param PySide6.QtCore.QRect rect: The global bounding rectangle of the item.
+        """
+
+        # Update only the cells the item entered or left.
+        previous_rect: Optional[QRect] = self._rects.get(item)
+        previous_cells: Set[Tuple[int, int]] = set(self._cells_of(previous_rect)) if previous_rect is not None else set()
+        cells: Set[Tuple[int, int]] = set(self._cells_of(rect))
+        for cell in previous_cells - cells:
+            self._discard(cell, item)
+        for cell in cells - previous_cells:
+            self._cells.setdefault(cell, set()).add(item)
+        self._rects[item] = QRect(rect)
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Remove the given item from the SpatialGrid, if indexed.
+
+        :param Hashable item: The item to remove.
+        """
+
+        # Remove the item from the cells it covers.
+        rect: Optional[QRect] = self._rects.pop(item, None)
+        if rect is None:
+            return
+        for cell in self._cells_of(rect):
+            self._discard(cell, item)
+
+    def query(self, rect: QRect) -> Set[Hashable]:
+        """
+        Return the items whose bounding rectangle intersects the given rectangle.
+
+        :param PySide6.QtCore.QRect rect: The global rectangle to query.
+        :returns: The items intersecting the given rectangle.
+        :rtype: Set[Hashable]
+        """
+
+        # Gather the items of the covered cells, then filter them on their actual rectangle.
+        items: Set[Hashable] = set()
+        for cell in self._cells_of(rect):
+            items.update(self._cells.get(cell, ()))
+        return {item for item in items if self._rects[item].intersects(rect)}
+
+    def snap(self, item: Hashable, rect: QRect, distance: int = SNAP_DISTANCE) -> Tuple[QPoint, List[QLine]]:
+        """
+        Return the offset snapping the given item's rectangle to the closest alignment with its neighbors,
+        either their centers, their edges or their opposite edges, along with the alignment guides to draw.
+
+        :param Hashable item: The item being moved, ignored among the neighbors.
+        :param PySide6.QtCore.QRect rect: The global rectangle the item is being moved to.
+        :param int distance: The distance under which the rectangle snaps. By default, SNAP_DISTANCE.
+        :returns: The snapping offset and the global alignment guides.
+        :rtype: Tuple[PySide6.QtCore.QPoint, List[PySide6.QtCore.QLine]]
+        """
+
+        # Retrieve the closest alignment along each axis among the neighbors.
+        best_x: Optional[Tuple[int, int, QRect]] = None
+        best_y: Optional[Tuple[int, int, QRect]] = None
+        for neighbor in self.query(rect.adjusted(-SNAP_RANGE, -SNAP_RANGE, SNAP_RANGE, SNAP_RANGE)):
+            if neighbor == item:
+                continue
+            neighbor_rect: QRect = self._rects[neighbor]
+            for delta, guide in self._alignments(
+                    (rect.left(), rect.center().x(), rect.right()),
+                    (neighbor_rect.left(), neighbor_rect.center().x(), neighbor_rect.right())
+            ):
+                if abs(delta) <= distance and (best_x is None or abs(delta) < abs(best_x[0])):
+                    best_x = (delta, guide, neighbor_rect)
+            for delta, guide in self._alignments(
+                    (rect.top(), rect.center().y(), rect.bottom()),
+                    (neighbor_rect.top(), neighbor_rect.center().y(), neighbor_rect.bottom())
+            ):
+                if abs(delta) <= distance and (best_y is None or abs(delta) < abs(best_y[0])):
+                    best_y = (delta, guide, neighbor_rect)
+
+        # Compute the snapping offset and the guides spanning both the snapped rectangle and its neighbor.
+        offset: QPoint = QPoint(best_x[0] if best_x else 0, best_y[0] if best_y else 0)
+        snapped_rect: QRect = rect.translated(offset)
+        guides: List[QLine] = []
+        if best_x is not None:
+            guides.append(QLine(
+                best_x[1], min(snapped_rect.top(), best_x[2].top()),
+                best_x[1], max(snapped_rect.bottom(), best_x[2].bottom())
+            ))
+        if best_y is not None:
+            guides.append(QLine(
+                min(snapped_rect.left(), best_y[2].left()), best_y[1],
+                max(snapped_rect.right(), best_y[2].right()), best_y[1]
+            ))
+        return offset, guides
+
+    def overlaps(self, item: Hashable, rect: QRect) -> bool:
+        """
+        Return True if the ellipse inscribed within the given rectangle overlaps any other item's ellipse.
+
+        :param Hashable item: The item being moved, ignored among the neighbors.
+        :param PySide6.QtCore.QRect rect: The global rectangle of the ellipse to check.
+        :returns: True if the ellipse overlaps another one.
+        :rtype: bool
+        """
+        return any(
+            neighbor != item and self._ellipses_overlap(rect, self._rects[neighbor]) for neighbor in self.query(rect)
+        )
+
+    # =============== #
+    # Private methods #
+    # =============== #
+
+    def _cells_of(self, rect: QRect) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the cells covered by the given rectangle.
+
+        :param PySide6.QtCore.QRect rect: The rectangle covering the cells.
+        :returns: The covered cells coordinates.
+        :rtype: Iterator[Tuple[int, int]]
+        """
+        for i in range(rect.left() // self._cell_size, rect.right() // self._cell_size + 1):
+            for j in range(rect.top() // self._cell_size, rect.bottom() // self._cell_size + 1):
+                yield i, j
+
+    def _discard(self, cell: Tuple[int, int], item: Hashable) -> None:
+        """
+        Remove the given item from the given cell, forgetting the cell once empty.
+
+        :param Tuple[int, int] cell: The cell to remove the item from.
+        :param Hashable item: The item to remove.
+        """
+        items: Optional[Set[Hashable]] = self._cells.get(cell)
+        if items is not None:
+            items.discard(item)
+            if not items:
+                del self._cells[cell]
+
+    @staticmethod
+    def _alignments(
+            moved: Tuple[int, int, int],
+            neighbor: Tuple[int, int, int]
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the offsets aligning the moved (start, center, end) coordinates with the neighbor's ones,
+        along with the coordinate of the resulting guide.
+
+        :param Tuple[int, int, int] moved: The start, center and end coordinates of the moved rectangle.
+        :param Tuple[int, int, int] neighbor: The start, center and end coordinates of the neighbor rectangle.
+        :returns: The aligning offsets and the guides coordinates.
+        :rtype: Iterator[Tuple[int, int]]
+        """
+
+        # Align the starts, the centers and the ends together.
+        for index in range(3):
+            yield neighbor[index] - moved[index], neighbor[index]
+
+        # Align the moved start right after the neighbor end, and the moved end right before the neighbor start.
+        yield neighbor[2] + 1 - moved[0], neighbor[2]
+        yield neighbor[0] - 1 - moved[2], neighbor[0]
+
+    @staticmethod
+    def _ellipses_overlap(first: QRect, second: QRect) -> bool:
+        """
+        Return True if the ellipses inscribed within the given rectangles overlap,
+        comparing the distance between their centers to the sum of their radii along
+        the line joining them. The test is exact for circles and close for ellipses.
+
+        :param PySide6.QtCore.QRect first: The rectangle of the first ellipse.
+        :param PySide6.QtCore.QRect second: The rectangle of the second ellipse.
+        :returns: True if the ellipses overlap.
+        :rtype: bool
+        """
+
+        # Compute the vector between both centers.
+        dx: float = (second.left() + second.right() - first.left() - first.right()) / 2
+        dy: float = (second.top() + second.bottom() - first.top() - first.bottom()) / 2
+        distance: float = math.hypot(dx, dy)
+        if distance == 0:
+            return True
+
+        # Compute each ellipse's radius along such a vector.
+        def radius(rect: QRect) -> float:
+            a: float = rect.width() / 2
+            b: float = rect.height() / 2
+            return a * b / math.hypot(b * dx / distance, a * dy / distance)
+
+        # The ellipses overlap if their centers are closer than the sum of their radii.
+        return distance < radius(first) + radius(second)
+
+# =------------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,713 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    application-wide stylesheet used by the HotClick software.
+    The whole theme is compiled once into a single stylesheet,
+    every widget being selected by its object name, and a
+    theme dependency map allows to restyle only the widgets
+    depending on an edited theme value.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing            import Any, Callable, Dict, List, Optional, Set, Tuple
+from collections       import OrderedDict
+from PySide6.QtGui     import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+from src.config        import STYLE, THEME_BUTTONS
+import re
+import json
+import hashlib
+import weakref
+import src.utils           as utils
+
+# =-------------------------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+#   Maximum number of compiled stylesheets and palettes kept in memory, the least recently used ones being
+# dropped first, as every theme edition compiles a new theme. The ThemeLibrary's themes keep their own.
+COMPILED_CACHE_SIZE: int = 8
+
+# Compiled stylesheets, by theme hash, from the least to the most recently used.
+COMPILED_STYLESHEETS: "OrderedDict[str, str]" = OrderedDict()
+
+# Compiled palettes, by theme hash, from the least to the most recently used.
+COMPILED_PALETTES: "OrderedDict[str, QPalette]" = OrderedDict()
+
+# Hash of the theme whose stylesheet is applied to the QApplication.
+APPLIED_THEME_HASH: Optional[str] = None
+
+# Widgets given the stylesheet of their subtree by the restyle function since the last application-wide one.
+RESTYLED_WIDGETS: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
+
+# =--------------------------------------------------------------= #
+
+
+# =--------------------------= #
+# Stylesheet utility functions #
+# =--------------------------= #
+
+def theme_hash(style: Dict[str, Any]) -> str:
+    """
+    Return the hash of the given theme, identical for identical themes.
+
+    :param style: The theme to hash.
+    :type style: Dict[str, Any]
+    :returns: The hex digest of the theme.
+    :rtype: str
+    """
+    return hashlib.sha1(json.dumps(style, sort_keys=True).encode()).hexdigest()
+
+
+def cached(cache: "OrderedDict[str, Any]", key: str, compile_: Callable[[], Any]) -> Any:
+    """
+    Return the value of the given key within the given compiled artifacts cache, marking it as the most recently
+    used one, compiling and caching it first if it isn't cached, the least recently used ones being dropped
+    beyond the COMPILED_CACHE_SIZE.
+
+    :param cache: The cache to look the value up in (e.g.: COMPILED_STYLESHEETS).
+    :type cache: OrderedDict[str, Any]
+    :param str key: The theme hash.
+    :param compile_: The function compiling the value if it isn't cached.
+    :type compile_: Callable[[], Any]
+    :returns: The cached value.
+    :rtype: Any
+    """
+
+    # Return the cached value, marking it as the most recently used one.
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    # Otherwise, compile and cache it, dropping the least recently used values beyond the cache size.
+    cache[key] = compile_()
+    while len(cache) > COMPILED_CACHE_SIZE:
+        cache.popitem(last=False)
+    return cache[key]
+
+
+def theme_button_object_name(keys: Tuple[str, ...]) -> str:
+    """
+    Return the object name of the theme button editing the STYLE value accessed by the given keys.
+
+    :param keys: The keys to access the STYLE value edited by the theme button.
+    :type keys: Tuple[str, ...]
+    :returns: The theme button's object name.
+    :rtype: str
+    """
+    return "theme_button_" + re.sub(r"\W", '_', '_'.join(keys))
+
+
+def _main_window_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the MainWindow's scoped background rule.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        #main_window, #main_window * {{
+            background-color: {style["background-color"]};
+        }}"""
+
+
+def _main_window_menus_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the MainWindow's hotkeys menu and menu bar scoped background rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        #hotkeys_menu, #hotkeys_menu * {{
+            background-color: {style["Custom"]["middleground-color"]};
+        }}
+        #main_menu_bar, #main_menu_bar * {{
+            background-color: {style["Custom"]["middleground-color"]};
+        }}"""
+
+
+def _hotkeys_radius_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the MainWindow's hotkeys radius label and slider rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QLabel#hotkeys_radius_label {{
+            font-family: {style["font-family"]};
+            font-size: 14px;
+            color: {style["color"]};
+            font-weight: bold;
+        }}
+        QSlider#hotkeys_radius_slider::groove:horizontal {{
+            border: 1px solid #999999;
+            height: 10px;
+            margin: 0px;
+            border-radius: 5px;
+        }}
+        QSlider#hotkeys_radius_slider::handle:horizontal {{
+            background: qradialgradient(
+                spread:pad, cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5,
+                stop:0.0 #9696FF,
+                stop:1.0 #9696FF
+            );
+            border: 1px solid #5c5c5c;
+            width: 20px;
+            margin: -2px 0;
+            border-radius: 10px;
+        }}
+        QSlider#hotkeys_radius_slider::add-page:horizontal {{
+            background: #999999;
+            border: 1px solid #999999;
+            height: 10px;
+            margin: 0px;
+        }}
+        QSlider#hotkeys_radius_slider::sub-page:horizontal {{
+            background: qlineargradient(
+                x1: 0, y1: 0, x2: 0, y2: 1,
+                stop: 0 #FFFFFF,
+                stop: 1 #FFFFFF
+            );
+            border: 1px solid #999999;
+            height: 10px;
+            margin: 0px;
+        }}"""
+
+
+def _main_window_buttons_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the MainWindow's "New hotkey", "New Layer" and "Start" buttons rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QPushButton#new_hotkey_button, QPushButton#new_layer_button, QPushButton#start_button {{
+            background-color: {style["QPushButton"]["background-color"]};
+            border-style: outset;
+            border-width: 2px;
+            border-radius: 10px;
+            font: bold 14px;
+            padding: 6px;
+        }}
+        QPushButton#new_hotkey_button {{
+            border-color: white;
+            min-width: 15em;
+        }}
+        QPushButton#new_layer_button, QPushButton#start_button {{
+            border-color: beige;
+            min-width: 6em;
+        }}
+        QPushButton#new_hotkey_button:pressed, QPushButton#new_layer_button:pressed,
+        QPushButton#start_button:pressed {{
+            background-color: {style["QPushButton:pressed"]["background-color"]};
+            border-style: inset;
+        }}"""
+
+
+def _status_bar_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the MainWindow's status bar rule.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QStatusBar#status_bar {{
+            background-color: {style["QStatusBar"]["background-color"]};
+            padding-left: 8px;
+            font-weight: bold;
+        }}"""
+
+
+def _settings_dialog_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the SettingsDialog's and its MenuWidget's scoped background rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        #settings_dialog, #settings_dialog * {{
+            background-color: {style["background-color"]};
+        }}
+        #menu_widget, #menu_widget * {{
+            background-color: {style["background-color"]};
+        }}"""
+
+
+def _settings_contents_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the SettingsDialog's content widgets scoped background rule.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        #menu_content_widget, #menu_content_widget *,
+        #theme_widget, #theme_widget *,
+        #key_mapping_widget, #key_mapping_widget *,
+        #custom_key_mapping_widget, #custom_key_mapping_widget * {{
+            background-color: {style["Custom"]["middleground-color"]};
+        }}"""
+
+
+def _settings_texts_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the settings headers, descriptions and custom key mapping button rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QLabel#settings_header_label {{
+            color: {style["color"]};
+            font-size: 18px;
+            font-weight: bold;
+        }}
+        QLabel#settings_description_label {{
+            color: {style["color"]};
+            font-size: 16px;
+            font-style: italic;
+            font-weight: bolder;
+            margin-top: 15px;
+            margin-bottom: 20px;
+        }}
+        QPushButton#custom_key_mapping_button {{
+            color: {style["color"]};
+            font-size: 18px;
+            font-style: italic;
+            font-weight: bolder;
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+            padding: 10px;
+            margin-top: 15px;
+            margin-bottom: 15px;
+        }}"""
+
+
+def _themes_combo_box_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the ThemeWidget's themes combo box and the MainWindow's layers combo box rule.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QComboBox#themes_combo_box, QComboBox#layers_combo_box {{
+            color: {style["color"]};
+            font-family: {style["font-family"]};
+            font-size: 16px;
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+            padding: 2px 10px;
+            margin-left: 10px;
+            margin-right: 10px;
+        }}"""
+
+
+def _shortcut_table_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the settings shortcut tables rules, their invalid cells being painted by their model.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QTableView#shortcut_table {{
+            color: {style["color"]};
+            font-family: {style["font-family"]};
+            font-size: 14px;
+            gridline-color: {style["background-color"]};
+            selection-background-color: {style["Custom"]["selected-background-color"]};
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+        }}
+        #shortcut_table QHeaderView::section {{
+            background-color: {style["background-color"]};
+            color: {style["color"]};
+            font-weight: bold;
+            border: none;
+            padding: 4px;
+        }}"""
+
+
+def _search_edits_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the hotkeys and shortcuts search edits rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QLineEdit#hotkeys_search_edit, QLineEdit#shortcut_search_edit {{
+            background-color: {style["background-color"]};
+            color: {style["color"]};
+            font-family: {style["font-family"]};
+            font-size: 14px;
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+            padding: 4px;
+        }}"""
+
+
+def _save_button_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the settings save buttons rules, independent of the theme.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return """
+        QPushButton#save_button {
+            background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                              stop: 0 #4a4a4a, stop: 0.5 #3a3a3a, stop: 1 #4a4a4a);
+            border-radius: 10px;
+            border: 2px solid #3a3a3a;
+            color: white;
+            padding: 10px;
+            font-size: 14px;
+            font-weight: bold;
+            min-width: 100px;
+        }
+        QPushButton#save_button:hover {
+            background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                              stop: 0 #5a5a5a, stop: 0.5 #4a4a4a, stop: 1 #5a5a5a);
+            border: 2px solid #4a4a4a;
+        }
+        QPushButton#save_button:pressed {
+            background-color: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                              stop: 0 #3a3a3a, stop: 0.5 #2a2a2a, stop: 1 #3a3a3a);
+            border: 2px solid #2a2a2a;
+        }
+        QPushButton#save_button:disabled {
+            background-color: #808080;
+            border: 2px solid #606060;
+            color: #a0a0a0;
+        }"""
+
+
+def _menu_buttons_rules(style: Dict[str, Any]) -> str:
+    """
+    Return the SettingsDialog's menu buttons rules.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The compiled rules.
+    :rtype: str
+    """
+    return f"""
+        QPushButton#menu_button {{
+            background-color: {style["background-color"]};
+            color: {style["color"]};
+            font-family: {style["font-family"]};
+            font-size: 16px;
+            width: 250px;
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+            padding: 2px;
+            margin-left: 10px;
+            margin-right: 10px;
+        }}
+        QPushButton#menu_button:checked {{
+            background-color: {style["QPushButton:checked"]["background-color"]};
+        }}"""
+
+
+def _theme_button_rules(keys: Tuple[str, ...]) -> Callable[[Dict[str, Any]], str]:
+    """
+    Return the function compiling the rule of the theme button editing
+    the STYLE value accessed by the given keys, displaying the color it edits.
+
+    :param keys: The keys to access the STYLE value edited by the theme button.
+    :type keys: Tuple[str, ...]
+    :returns: The function compiling the theme button's rule.
+    :rtype: Callable[[Dict[str, Any]], str]
+    """
+
+    def rules(style: Dict[str, Any]) -> str:
+        background_color: str = utils.access_dict(style, *keys)
+        return f"""
+        QPushButton#{theme_button_object_name(keys)} {{
+            background-color: {background_color};
+            color: {utils.opposite_hex_color(background_color)};
+            font-family: {style["font-family"]};
+            font-size: 16px;
+            width: 250px;
+            border: 2px solid rgb(255, 255, 255);
+            border-radius: 10px;
+            padding: 2px;
+            margin-left: 10px;
+            margin-right: 10px;
+        }}"""
+
+    return rules
+
+
+#   Sections of the application-wide stylesheet, as (object names selected, theme keys used, rules function) tuples.
+# The deepest widgets' sections come last for their rules to take precedence over their ancestors' ones.
+STYLESHEET_SECTIONS: List[Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...], Callable[[Dict[str, Any]], str]]] = [
+    (("main_window",), (("background-color",),), _main_window_rules),
+    (("hotkeys_menu", "main_menu_bar"), (("Custom", "middleground-color"),), _main_window_menus_rules),
+    (("hotkeys_radius_label",), (("font-family",), ("color",)), _hotkeys_radius_rules),
+    (
+        ("new_hotkey_button", "new_layer_button", "start_button"),
+        (("QPushButton", "background-color"), ("QPushButton:pressed", "background-color")),
+        _main_window_buttons_rules
+    ),
+    (("status_bar",), (("QStatusBar", "background-color"),), _status_bar_rules),
+    (("settings_dialog", "menu_widget"), (("background-color",),), _settings_dialog_rules),
+    (
+        ("menu_content_widget", "theme_widget", "key_mapping_widget", "custom_key_mapping_widget"),
+        (("Custom", "middleground-color"),),
+        _settings_contents_rules
+    ),
+    (
+        ("settings_header_label", "settings_description_label", "custom_key_mapping_button"),
+        (("color",),),
+        _settings_texts_rules
+    ),
+    (("themes_combo_box", "layers_combo_box"), (("color",), ("font-family",)), _themes_combo_box_rules),
+    (
+        ("shortcut_table",),
+        (("color",), ("font-family",), ("background-color",), ("Custom", "selected-background-color")),
+        _shortcut_table_rules
+    ),
+    (
+        ("hotkeys_search_edit", "shortcut_search_edit"),
+        (("background-color",), ("color",), ("font-family",)),
+        _search_edits_rules
+    ),
+    (("save_button",), (), _save_button_rules),
+    (
+        ("menu_button",),
+        (("background-color",), ("color",), ("font-family",), ("QPushButton:checked", "background-color")),
+        _menu_buttons_rules
+    ),
+    *(
+        ((theme_button_object_name(theme_button[:-1]),), (theme_button[:-1], ("font-family",)),
+         _theme_button_rules(theme_button[:-1]))
+        for row in THEME_BUTTONS for theme_button in row
+    )
+]
+
+
+def _theme_dependencies() -> Dict[Tuple[str, ...], Set[str]]:
+    """
+    Return the object names of the widgets whose rules use each theme key, from the STYLESHEET_SECTIONS.
+
+    :returns: The object names depending on each theme key.
+    :rtype: Dict[Tuple[str, ...], Set[str]]
+    """
+    dependencies: Dict[Tuple[str, ...], Set[str]] = {}
+    for object_names, theme_keys, _ in STYLESHEET_SECTIONS:
+        for theme_key in theme_keys:
+            dependencies.setdefault(theme_key, set()).update(object_names)
+    return dependencies
+
+
+# Object names of the widgets whose rules use each theme key (e.g.: ("QStatusBar", "background-color")).
+THEME_DEPENDENCIES: Dict[Tuple[str, ...], Set[str]] = _theme_dependencies()
+
+
+def compile_stylesheet(style: Dict[str, Any]) -> str:
+    """
+    Compile the given theme into the application-wide stylesheet.
+    The widgets styled for their whole content (e.g.: background
+    colors) get a "#name, #name *" rule, the deepest widgets' rules
+    coming last for them to take precedence over their ancestors' ones.
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The application-wide stylesheet.
+    :rtype: str
+    """
+    return '\n'.join(rules(style) for _, _, rules in STYLESHEET_SECTIONS)
+
+
+def current_stylesheet() -> str:
+    """
+    Return the stylesheet of the current STYLE dictionary, compiling it only once per cached theme.
+
+    :returns: The current theme's stylesheet.
+    :rtype: str
+    """
+
+    # Compile the current theme if it hasn't been yet.
+    return cached(COMPILED_STYLESHEETS, theme_hash(STYLE), lambda: compile_stylesheet(STYLE))
+
+
+def compile_palette(style: Dict[str, Any]) -> QPalette:
+    """
+    Compile the given theme into the application-wide palette, used by
+    the widgets the stylesheet doesn't style (e.g.: the standard dialogs).
+
+    :param style: The theme to compile.
+    :type style: Dict[str, Any]
+    :returns: The application-wide palette.
+    :rtype: PySide6.QtGui.QPalette
+    """
+
+    # Set the palette roles from the theme colors.
+    palette: QPalette = QPalette()
+    palette.setColor(QPalette.Window, QColor(style["background-color"]))
+    palette.setColor(QPalette.Base, QColor(style["Custom"]["middleground-color"]))
+    palette.setColor(QPalette.Button, QColor(style["QPushButton"]["background-color"]))
+    palette.setColor(QPalette.Highlight, QColor(style["Custom"]["selected-background-color"]))
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(role, QColor(style["color"]))
+    return palette
+
+
+def current_palette() -> QPalette:
+    """
+    Return the palette of the current STYLE dictionary, compiling it only once per cached theme.
+
+    :returns: The current theme's palette.
+    :rtype: PySide6.QtGui.QPalette
+    """
+
+    # Compile the current theme's palette if it hasn't been yet.
+    return cached(COMPILED_PALETTES, theme_hash(STYLE), lambda: compile_palette(STYLE))
+
+
+def apply_stylesheet() -> None:
+    """
+    Apply the stylesheet and the palette of the current STYLE dictionary to the whole application at once,
+    dropping the per-widget stylesheets set by the restyle function meanwhile.
+    They are only compiled once per theme, and only applied if the theme changed.
+    """
+
+    # Make the APPLIED_THEME_HASH global variable writable.
+    global APPLIED_THEME_HASH
+
+    # If there is no QApplication, return here.
+    application: Optional[QApplication] = QApplication.instance()
+    if application is None:
+        return
+
+    # Apply the current theme if it isn't already.
+    current_theme_hash: str = theme_hash(STYLE)
+    if current_theme_hash != APPLIED_THEME_HASH:
+        application.setPalette(current_palette())
+        application.setStyleSheet(current_stylesheet())
+        APPLIED_THEME_HASH = current_theme_hash
+
+    #   Drop the per-widget stylesheets, superseded by the application-wide one,
+    # including when the theme got reverted to the applied one meanwhile.
+    for widget in list(RESTYLED_WIDGETS):
+        widget.setStyleSheet("")
+    RESTYLED_WIDGETS.clear()
+
+
+def restyle(root: QWidget, keys: Tuple[str, ...]) -> None:
+    """
+    Restyle only the widgets within the given root whose rules use the given theme key,
+    once the STYLE dictionary changed, instead of re-applying the application-wide stylesheet
+    which would restyle every widget of the application.
+    The outermost affected widgets are given a stylesheet made of the rules of the sections selecting
+    them or their descendants only, a widget stylesheet taking precedence over the application-wide one
+    within the widget's subtree. Such stylesheets are dropped by the next apply_stylesheet call.
+
+    :param QWidget root: The widget containing the widgets to restyle (e.g.: the MainWindow).
+    :param keys: The keys to access the changed STYLE value.
+    :type keys: Tuple[str, ...]
+    """
+
+    # Retrieve the affected widgets, returning here if there is none.
+    object_names: Set[str] = THEME_DEPENDENCIES.get(tuple(keys), set())
+    widgets: List[QWidget] = [root] if root.objectName() in object_names else []
+    for object_name in object_names:
+        widgets.extend(root.findChildren(QWidget, object_name))
+    if not widgets:
+        return
+
+    #   Restyle the outermost affected widgets, along with the previously restyled widgets
+    # within them, whose outdated stylesheet would otherwise keep precedence over the current one.
+    affected_widgets: Set[QWidget] = set(widgets)
+    for widget in set(RESTYLED_WIDGETS) | affected_widgets:
+        ancestor: Optional[QWidget] = widget.parentWidget()
+        while ancestor is not None and ancestor not in affected_widgets:
+            ancestor = ancestor.parentWidget()
+        if (ancestor is None and widget in affected_widgets) or (ancestor is not None and widget in RESTYLED_WIDGETS):
+            widget.setStyleSheet(_subtree_stylesheet(widget))
+            RESTYLED_WIDGETS.add(widget)
+
+
+def _subtree_stylesheet(widget: QWidget) -> str:
+    """
+    Compile the current STYLE dictionary's rules of the sections selecting the given widget or any of its
+    descendants only. The ancestors' sections are left out, the widget inheriting them from the
+    application-wide stylesheet, whereas its descendants' ones must be set along with its own, a widget
+    stylesheet taking precedence over the application-wide one whatever the rules' specificity.
+
+    :param QWidget widget: The widget to compile the stylesheet of.
+    :returns: The widget's stylesheet.
+    :rtype: str
+    """
+    object_names: Set[str] = {child.objectName() for child in widget.findChildren(QWidget)}
+    object_names.add(widget.objectName())
+    return '\n'.join(
+        rules(STYLE) for section_object_names, _, rules in STYLESHEET_SECTIONS
+        if object_names.intersection(section_object_names)
+    )
+
+
+def repolish(widget: QWidget) -> None:
+    """
+    Reset the given widget's palette and restyle it from the application-wide stylesheet,
+    without re-parsing any stylesheet (e.g.: once the logger changed the StatusBar's text color).
+
+    :param QWidget widget: The widget to restyle.
+    """
+    widget.setPalette(QPalette())
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    widget.update()
+
+# =------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains everything related to the
+    themes library used by the HotClick software.
+    The themes of the themes directory are parsed,
+    validated and compiled once, when first selected,
+    then kept compiled within a LRU cache so switching
+    back to them doesn't touch the disk anymore.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing        import Any, Dict, Iterator, List, Optional, Tuple
+from collections   import OrderedDict
+from pathlib       import Path
+from PySide6.QtGui import QColor, QPalette
+from src.config    import DEFAULT_STYLE, STYLE
+from src.utils     import PATH
+import copy
+import json
+import src.logger      as logger
+import src.stylesheet  as stylesheet
+import src.utils       as utils
+
+# =-------------------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =-------------= #
+# Global variable #
+# =-------------= #
+
+# Directory containing the themes files, each one named after its theme.
+THEMES_DIRECTORY: Path = Path(PATH) / Path("themes")
+
+# Maximum number of compiled themes kept in memory.
+THEME_CACHE_SIZE: int = 8
+
+# STYLE keys whose value isn't a color.
+NON_COLOR_KEYS: Tuple[Tuple[str, ...], ...] = (("font-family",),)
+
+# =----------------------------------------------------------------------= #
+
+
+# =---------------------= #
+# Theme utility functions #
+# =---------------------= #
+
+def theme_keys(style: Dict[str, Any], *keys: str) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the keys to access every value of the given theme.
+
+    :param style: The theme to walk through.
+    :type style: Dict[str, Any]
+    :param keys: The keys leading to the given theme, used when walking recursively.
+    :type keys: str
+    :returns: The keys to access every value.
+    :rtype: Iterator[Tuple[str, ...]]
+    """
+    for key, value in style.items():
+        if isinstance(value, dict):
+            yield from theme_keys(value, *keys, key)
+        else:
+            yield *keys, key
+
+
+def merge_theme(style: Dict[str, Any], loaded_style: Dict[str, Any]) -> None:
+    """
+    Merge the given loaded theme into the given theme recursively, so a partial nested
+    object (e.g.: "Custom") only replaces the values it holds.
+
+    :param style: The theme to merge into.
+    :type style: Dict[str, Any]
+    :param loaded_style: The theme to merge, as loaded from its JSON file.
+    :type loaded_style: Dict[str, Any]
+    """
+    for key, value in loaded_style.items():
+        if isinstance(value, dict) and isinstance(style.get(key), dict):
+            merge_theme(style[key], value)
+        else:
+            style[key] = value
+
+
+def validate_theme(loaded_style: Any) -> Dict[str, Any]:
+    """
+    Return the given loaded theme merged recursively over the DEFAULT_STYLE dictionary.
+    Raise a ValueError if the theme isn't a dictionary, if it replaces any DEFAULT_STYLE
+    value by an object, or if any of its values is neither a string nor a valid color
+    when a color is expected.
+
+    :param loaded_style: The theme as loaded from its JSON file.
+    :type loaded_style: Any
+    :returns: The validated theme.
+    :rtype: Dict[str, Any]
+    """
+
+    # Ensure the theme is a dictionary, then merge it over the default theme.
+    if not isinstance(loaded_style, dict):
+        raise ValueError("A theme must be a JSON object")
+    style: Dict[str, Any] = copy.deepcopy(DEFAULT_STYLE)
+    merge_theme(style, loaded_style)
+
+    #   Ensure every value is a string, and a valid color if a color is expected, including
+    # every DEFAULT_STYLE value the compiled stylesheet and palette read.
+    for keys in dict.fromkeys((*theme_keys(DEFAULT_STYLE), *theme_keys(style))):
+        value: Any = style
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+        if not isinstance(value, str):
+            raise ValueError(f"The theme value \"{'.'.join(keys)}\" must be a string")
+        if keys not in NON_COLOR_KEYS and not QColor.isValidColor(value):
+            raise ValueError(f"The theme value \"{'.'.join(keys)}\" is not a valid color: \"{value}\"")
+
+    # Return the validated theme.
+    return style
+
+# =----------------------------------------------------------------------------------------------= #
+
+
+# =-----------------= #
+# CompiledTheme class #
+# =-----------------= #
+
+class CompiledTheme:
+    """
+    Compiled Theme class holding a validated theme along with every artifact
+    derived from it: its stylesheet and its palette.
+    The stylesheet and the palette get registered within the stylesheet
+    module caches, so applying the theme never compiles it again.
+    """
+
+    __slots__ = ("name", "style", "hash", "stylesheet", "palette")
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, name: str, style: Dict[str, Any]) -> None:
+        """
+        Initializer method.
+
+        :param str name: The name of the theme.
+        :param style: The validated theme.
+        :type style: Dict[str, Any]
+        """
+
+        # Set the straight-forward attributes.
+        self.name: str = name
+        self.style: Dict[str, Any] = style
+        self.hash: str = stylesheet.theme_hash(style)
+
+        #   Compile the theme, unless the stylesheet module caches already hold it, registering
+        # its artifacts within them, the theme keeping its own once they got dropped from them.
+        self.stylesheet: str = stylesheet.cached(
+            stylesheet.COMPILED_STYLESHEETS, self.hash, lambda: stylesheet.compile_stylesheet(style)
+        )
+        self.palette: QPalette = stylesheet.cached(
+            stylesheet.COMPILED_PALETTES, self.hash, lambda: stylesheet.compile_palette(style)
+        )
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def apply(self) -> None:
+        """
+        Make the theme the current one by replacing the STYLE dictionary's content, without any disk access.
+        The widgets must then be restyled, the stylesheet module finding the theme already compiled.
+        """
+
+        # Copy the theme to the STYLE dictionary, for the theme edition to leave the compiled theme unchanged.
+        utils.update_dict(STYLE, value=copy.deepcopy(self.style))
+
+        # Register the compiled artifacts again, in case the stylesheet module caches dropped them meanwhile.
+        stylesheet.cached(stylesheet.COMPILED_STYLESHEETS, self.hash, lambda: self.stylesheet)
+        stylesheet.cached(stylesheet.COMPILED_PALETTES, self.hash, lambda: self.palette)
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =----------------= #
+# ThemeLibrary class #
+# =----------------= #
+
+class ThemeLibrary:
+    """
+    Theme Library class listing the themes of the themes directory,
+    compiling each one lazily when first requested and keeping the
+    most recently used ones compiled within a LRU cache.
+    """
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self, directory: Path = THEMES_DIRECTORY, cache_size: int = THEME_CACHE_SIZE) -> None:
+        """
+        Initializer method.
+
+        :param pathlib.Path directory: The themes directory. By default, THEMES_DIRECTORY.
+        :param int cache_size: The maximum number of compiled themes kept in memory. By default, THEME_CACHE_SIZE.
+        """
+
+        # Initialize the straight-forward attributes.
+        self._directory: Path = directory
+        self._cache_size: int = cache_size
+        self._themes: OrderedDict[str, CompiledTheme] = OrderedDict()
+        self._names: List[str] = []
+
+        # List the available themes.
+        self.refresh()
+
+    # ============== #
+    # Public methods #
+    # ============== #
+
+    def refresh(self) -> None:
+        """List the themes of the themes directory again, forgetting the compiled ones."""
+
+        # List the JSON files of the themes directory, if any.
+        self._themes.clear()
+        try:
+            self._names = sorted(file.stem for file in self._directory.glob("*.json") if file.is_file())
+        except OSError:
+            self._names = []
+
+    def get(self, name: str) -> Optional[CompiledTheme]:
+        """
+        Return the compiled theme of the given name, parsing, validating and
+        compiling it if it isn't cached yet, or None if it can't be loaded.
+
+        :param str name: The name of the theme.
+        :returns: The compiled theme, or None.
+        :rtype: CompiledTheme or None
+        """
+
+        # Return the cached theme, marking it as the most recently used one.
+        theme: Optional[CompiledTheme] = self._themes.get(name)
+        if theme is not None:
+            self._themes.move_to_end(name)
+            return theme
+
+        # Parse, validate and compile the theme.
+        try:
+            with open(self._directory / Path(name + ".json")) as file:
+                theme = CompiledTheme(name, validate_theme(json.load(file)))
+        except (OSError, ValueError) as e:
+            logger.error(f"Exception raised while loading the \"{name}\" theme: " + str(e))
+            return None
+
+        # Cache the theme, evicting the least recently used one if the cache is full.
+        self._themes[name] = theme
+        if len(self._themes) > self._cache_size:
+            self._themes.popitem(last=False)
+        return theme
+
+    # ============= #
+    # Getter method #
+    # ============= #
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Getter method for the names of the available themes.
+
+        :returns: The names of the available themes.
+        :rtype: List[str]
+        """
+        return self._names
+
+# =---------------------------------------------------------------------------------------------------------= #
+
+
+# =-------------= #
+# Theme library #
+# =-------------= #
+
+# The themes library of the themes directory.
+THEME_LIBRARY: ThemeLibrary = ThemeLibrary()
+
+# =----------------------------------------= #
@@ -17,13 +17,15 @@
 # =--------------= #
 
 from typing            import Any, Callable, Dict, Optional, Type, TypeVar, Union
-from PySide6.QtWidgets import QLayout, QLayoutItem
+from PySide6.QtGui     import QFont, QFontMetrics, QScreen
+from PySide6.QtWidgets import QLayout, QLayoutItem, QWidget
 from pathlib           import Path
 import src.logger          as logger
 import os
 import sys
 import keyboard
 import json
+import functools
 
 # =---------------------------------------------------------------------------= #
 
@@ -40,6 +42,9 @@ import json
 # Retrieve and declare the binary directory path.
 PATH: Path = os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else Path(__file__).parent.parent
 
+# Declare the frame interval (in milliseconds) used when the screen refresh rate is unknown.
+DEFAULT_FRAME_INTERVAL: int = 16
+
 # =---------------------------------------------------------------------------------------------------------= #
 
 
@@ -83,6 +88,66 @@ def clear_layout(layout: Optional[QLayout]) -> None:
 # =-------------------------------------------------= #
 
 
+# =-------------------= #
+# Font fitting function #
+# =-------------------= #
+
+@functools.lru_cache(maxsize=1024)
+def fit_font_size(text: str, width: int, height: int, family: str, max_size: int = 22) -> int:
+    """
+    Return the largest bold font point size, up to max_size, for the given text
+    to fit within the given width and height, found by binary search.
+    The results are memoized with an LRU policy, so repeated calls with the
+    same arguments (e.g.: repeated paints) don't perform any font metric work.
+
+    :param str text: The text to fit.
+    :param int width: The available width.
+    :param int height: The available height.
+    :param str family: The font family.
+    :param int max_size: The maximum font point size. By default, 22.
+    :returns: The largest fitting font point size, at least 1.
+    :rtype: int
+    """
+
+    # Binary search the largest fitting point size between 1 and max_size.
+    font: QFont = QFont(family, max_size, QFont.Bold)
+    low: int = 1
+    high: int = max_size
+    while low < high:
+        middle: int = (low + high + 1) // 2
+        font.setPointSize(middle)
+        metrics: QFontMetrics = QFontMetrics(font)
+        if metrics.horizontalAdvance(text) <= width and metrics.height() <= height:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+# =-----------------------------------------------------------------------------------------= #
+
+
+# =---------------------= #
+# Frame interval function #
+# =---------------------= #
+
+def frame_interval(widget: QWidget) -> int:
+    """
+    Return the refresh interval, in milliseconds, of the screen the given widget is on.
+
+    :param QWidget widget: The widget to retrieve the screen of.
+    :returns: The screen refresh interval, DEFAULT_FRAME_INTERVAL if unknown.
+    :rtype: int
+    """
+
+    # Retrieve the screen refresh rate, ignoring any invalid one.
+    screen: Optional[QScreen] = widget.screen()
+    if screen is None or screen.refreshRate() <= 0:
+        return DEFAULT_FRAME_INTERVAL
+    return max(1, round(1000 / screen.refreshRate()))
+
+# =----------------------------------------------------------------= #
+
+
 # =-------------------------= #
 # Opposite HEX color function #
 # =-------------------------= #
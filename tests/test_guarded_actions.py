@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+"""
+    This file contains the tests of the guarded actions
+    of the HotClick software, checking their conditions
+    against a synthetic frame source rather than the
+    screen, so they run without any display.
+
+     ____________________________________________________
+    | REFER TO THE MAIN.PY FILE FOR THE CHANGE DOC TABLE |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+"""
+
+
+# =--------------= #
+# Libraries import #
+# =--------------= #
+
+from typing import Iterator, Optional, Tuple
+import logging
+import pytest
+
+numpy = pytest.importorskip("numpy")
+pytest.importorskip("pynput")
+pytest.importorskip("keyboard")
+pytest.importorskip("PySide6")
+pytest.importorskip("colorama")
+
+from src.actions   import AutoClickAction, GuardedAction, InputBackend
+import src.logger  as logger
+from src.pixels    import PixelCondition, SyntheticFrameSource
+from src.scheduler import SCHEDULER, ScheduledRun
+
+# =------------------------------------------= #
+
+
+# =--------------------------------------------------= #
+# REFER TO THE MAIN.PY FILE FOR THE AUTHORSHIP SECTION #
+# =--------------------------------------------------= #
+
+
+# =--------------------= #
+# RecordingBackend class #
+# =--------------------= #
+
+class RecordingBackend(InputBackend):
+    """Recording Backend class counting the clicks instead of simulating them, every key being released."""
+
+    __slots__ = ("clicks",)
+
+    # ================== #
+    # Initializer method #
+    # ================== #
+
+    def __init__(self) -> None:
+        """Initializer method."""
+        self.trigger: Optional[str] = "f1"
+        self.click_delay: float = 0.0
+        self._moved_at: float = 0.0
+        self.clicks: int = 0
+
+    # ================== #
+    # Overridden methods #
+    # ================== #
+
+    def move(self, position: Tuple[int, int]) -> None:
+        """
+        Overridden move method, ignoring the move.
+
+        :param position: The coordinates to move to.
+        :type position: Tuple[int, int]
+        """
+
+    def click(self, button: object, count: int = 1) -> None:
+        """
+        Overridden click method, counting the clicks.
+
+        :param object button: The mouse button to click.
+        :param int count: The number of clicks. By default, 1.
+        """
+        self.clicks += count
+
+    @staticmethod
+    def is_pressed(key: str) -> bool:
+        """
+        Overridden is_pressed method, every key being released.
+
+        :param str key: The key to check.
+        :returns: False.
+        :rtype: bool
+        """
+        return False
+
+# =-------------------------------------------------------------------------------------------------------------= #
+
+
+# =----------= #
+# Test fixture #
+# =----------= #
+
+@pytest.fixture(autouse=True)
+def test_logger(monkeypatch: pytest.MonkeyPatch) -> Iterator[logging.Logger]:
+    """
+    Use a plain logger for the traces of the tested actions and of the scheduler's threads,
+    the LOGGER only being initialized along with the MainWindow's status bar.
+
+    :param pytest.MonkeyPatch monkeypatch: The fixture restoring the LOGGER afterwards.
+    :returns: The plain logger.
+    :rtype: Iterator[logging.Logger]
+    """
+    monkeypatch.setattr(logger, "LOGGER", logging.getLogger("hotclick.tests"))
+    yield logger.LOGGER
+
+# =-------------------------------------------------------------------------------------------------------------= #
+
+
+# =------------= #
+# Test functions #
+# =------------= #
+
+def test_guarded_auto_click_toggles_off_once_its_condition_fails() -> None:
+    """Pressing a guarded toggle auto-clicker's hotkey again stops it, even once its frame source fails."""
+
+    # Start the auto-clicker, its pixel condition matching the synthetic frame.
+    source: SyntheticFrameSource = SyntheticFrameSource(16, 16, "#FF0000")
+    backend: RecordingBackend = RecordingBackend()
+    action: AutoClickAction = AutoClickAction((8, 8), rate=100, cancel_on_release=False)
+    guarded: GuardedAction = GuardedAction(action, (PixelCondition((8, 8), (255, 0, 0), source=source).matches,))
+    guarded.execute(backend)
+    run: Optional[ScheduledRun] = SCHEDULER.get(action)
+    assert run is not None
+
+    # Make the frame source fail, every region lying outside its now empty frame.
+    source.frame = numpy.empty((0, 0, 4), numpy.uint8)
+
+    # Press the hotkey again once released: the auto-clicker stops despite its failing condition.
+    try:
+        assert run.condition is not None and not run.condition()
+        guarded.execute(backend)
+        run.join(1)
+        assert run.cancelled
+        assert SCHEDULER.get(action) is None
+    finally:
+        SCHEDULER.cancel(action)
+
+
+def test_guarded_auto_click_skipped_while_its_condition_fails() -> None:
+    """A guarded auto-clicker that isn't running doesn't start while its frame source fails."""
+    source: SyntheticFrameSource = SyntheticFrameSource(16, 16, "#FF0000")
+    source.frame = numpy.empty((0, 0, 4), numpy.uint8)
+    action: AutoClickAction = AutoClickAction((8, 8), rate=100, cancel_on_release=False)
+    GuardedAction(action, (PixelCondition((8, 8), (255, 0, 0), source=source).matches,)).execute(RecordingBackend())
+    assert SCHEDULER.get(action) is None
+
+# =-------------------------------------------------------------------------------------------------------------= #